@@ -1,24 +1,39 @@
 from __future__ import annotations
 
-import asyncio
-
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import get_session
-from app.schemas.market import PriceCacheResponse, PriceResponse
+from app.schemas.market import (
+    IndicatorSnapshotResponse,
+    MarketScheduleResponse,
+    PriceCacheResponse,
+    PriceResponse,
+    QuoteCacheStatsResponse,
+    RefreshStatsResponse,
+)
+from app.services.indicator_snapshot import get_snapshot, get_snapshot_stats
 from app.services.market_service import MarketService
+from app.services.refresh_planner import note_view, refresh_planner
 from app.services.stock_master_service import StockMasterService
 
 router = APIRouter(prefix="/market", tags=["market"])
 
 
+def _round2(value: float | None) -> float | None:
+    return None if value is None else round(value, 2)
+
+
 @router.get(
     "/price/{symbol}",
     response_model=PriceResponse,
     summary="종목 현재가 조회",
     description="실시간 현재가, 전일 대비 변동액/변동률, 거래량, MA5/MA20 이동평균을 반환합니다. "
-                "3계층 캐시(메모리 15초 → DB → API) 순서로 조회하여 응답 속도를 최적화합니다.",
+                "3계층 캐시(메모리 15초 → DB → API) 순서로 조회하여 응답 속도를 최적화합니다. "
+                "MA5/MA20은 시세 갱신 잡이 미리 계산한 지표 스냅샷에서 읽습니다. "
+                "stale-while-revalidate 활성 시 만료 직후 시세는 stale=true로 즉시 반환하고 백그라운드에서 갱신합니다.",
 )
 async def get_price(
     symbol: str,
@@ -28,10 +43,15 @@ async def get_price(
     svc = MarketService(session)
     stock_svc = StockMasterService(session)
     info = await svc.get_price(symbol, market)
-    name, indicators = await asyncio.gather(
-        stock_svc.get_name(symbol, market),
-        svc.get_latest_indicators(symbol, market),
-    )
+    note_view(symbol, market)  # 최근 조회 종목은 주기 갱신 계층 4로 유지
+    # 같은 세션을 쓰므로 순차 실행 (일봉 저장소 조회도 DB를 사용)
+    name = await stock_svc.get_name(symbol, market)
+    # 스케줄러가 계산해 둔 지표 스냅샷 우선 (없거나 유효 시간이 지난 종목은 일봉으로 계산)
+    snapshot = get_snapshot(symbol, market, max_age=settings.indicator_snapshot_max_age)
+    if snapshot is not None:
+        indicators = {"ma5": _round2(snapshot.ma5), "ma20": _round2(snapshot.ma20)}
+    else:
+        indicators = await svc.get_latest_indicators(symbol, market)
     return PriceResponse(
         symbol=info.symbol,
         name=name,
@@ -42,6 +62,84 @@ async def get_price(
         market=info.market,
         ma5=indicators["ma5"],
         ma20=indicators["ma20"],
+        stale=info.stale,
+    )
+
+
+@router.get(
+    "/indicators/{symbol}",
+    response_model=IndicatorSnapshotResponse,
+    summary="종목 지표 스냅샷 조회",
+    description="시세 갱신 잡이 관심·보유·전략 종목마다 미리 계산해 둔 최신 지표(MA5/MA20, RSI14, "
+                "MACD, 볼린저 밴드, ATR14)를 반환합니다. 브로커를 호출하지 않으며, "
+                "스냅샷이 없거나 유효 시간(INDICATOR_SNAPSHOT_MAX_AGE)이 지난 종목은 일봉으로 즉시 계산해 저장합니다.",
+)
+async def get_indicators(
+    symbol: str,
+    market: str = "KR",
+    session: AsyncSession = Depends(get_session),
+):
+    snapshot = get_snapshot(symbol, market, max_age=settings.indicator_snapshot_max_age)
+    if snapshot is None:
+        await MarketService(session).refresh_indicator_snapshots([(symbol, market)])
+        snapshot = get_snapshot(symbol, market)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="일봉 데이터가 없어 지표를 계산할 수 없습니다")
+    return IndicatorSnapshotResponse(
+        symbol=snapshot.symbol,
+        market=snapshot.market,
+        as_of=snapshot.as_of,
+        close=snapshot.close,
+        bars=snapshot.bars,
+        ma5=_round2(snapshot.ma5),
+        ma20=_round2(snapshot.ma20),
+        rsi14=_round2(snapshot.rsi14),
+        macd=_round2(snapshot.macd),
+        macd_signal=_round2(snapshot.macd_signal),
+        bb_upper=_round2(snapshot.bb_upper),
+        bb_lower=_round2(snapshot.bb_lower),
+        atr14=_round2(snapshot.atr14),
+        computed_at=snapshot.computed_at,
+        age=round(snapshot.age, 1),
+    )
+
+
+@router.get(
+    "/stream",
+    summary="실시간 시세 스트림 (SSE)",
+    description="Server-Sent Events로 종목 시세 변경분을 푸시합니다. symbols는 쉼표 구분 종목 코드입니다. "
+                "각 quote 이벤트는 압축 JSON(s=종목, m=시장, p=현재가, c=변동액, r=변동률, v=거래량)이며 "
+                "직전 전송 대비 바뀐 필드만 포함합니다. 하트비트 주석을 주기적으로 보내고, "
+                "재접속 시 Last-Event-ID 헤더로 놓친 이벤트를 재생합니다. "
+                "구독 종목은 시세 갱신 잡에 포함되어 접속자 수와 무관하게 종목당 한 번만 조회됩니다.",
+    response_class=StreamingResponse,
+)
+async def stream_quotes(
+    request: Request,
+    symbols: str = Query(..., description="쉼표 구분 종목 코드 (예: 005930,000660)"),
+    market: str = "KR",
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+):
+    from app.services.quote_stream import quote_event_stream
+
+    keys = [(s.strip(), market) for s in dict.fromkeys(symbols.split(",")) if s.strip()]
+    if not keys:
+        raise HTTPException(status_code=400, detail="symbols를 하나 이상 지정하세요")
+    if len(keys) > settings.sse_max_symbols:
+        raise HTTPException(
+            status_code=400, detail=f"종목은 최대 {settings.sse_max_symbols}개까지 구독할 수 있습니다",
+        )
+    resume_from = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+
+    return StreamingResponse(
+        quote_event_stream(
+            keys,
+            last_event_id=resume_from,
+            heartbeat=settings.sse_heartbeat_interval,
+            is_disconnected=request.is_disconnected,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -58,14 +156,17 @@ async def get_daily_prices(
     session: AsyncSession = Depends(get_session),
 ):
     svc = MarketService(session)
-    return await svc.get_daily_prices(symbol, market, days)
+    bars = await svc.get_daily_prices(symbol, market, days)
+    return bars.to_dicts()
 
 
 @router.get(
     "/candles/{symbol}",
     summary="분봉 데이터 조회",
-    description="1분봉(interval=1) 또는 5분봉(interval=5) 캔들 데이터를 반환합니다. "
-                "5분봉은 서버에서 1분봉을 집계하여 생성합니다. KIS API 미연동 시 빈 목록을 반환합니다.",
+    description="당일(장 시작 전이면 직전 거래일) 분봉 캔들 데이터를 반환합니다. "
+                "interval은 1, 3, 5, 10, 15, 30, 60분을 지원하며, 저장된 1분봉을 벽시계 구간"
+                "(예: 5분봉 09:00, 09:05 …)으로 집계하므로 중간에 빠진 분봉이 있어도 경계가 어긋나지 않습니다. "
+                "1분봉은 저장소에 보관하고 마지막 저장 분 이후만 KIS에서 가져옵니다. KIS API 미연동 시 빈 목록을 반환합니다.",
 )
 async def get_intraday_candles(
     symbol: str,
@@ -73,6 +174,12 @@ async def get_intraday_candles(
     interval: int = Query(default=1, ge=1, le=60),
     session: AsyncSession = Depends(get_session),
 ):
+    from app.candles import SUPPORTED_INTERVALS
+    if interval not in SUPPORTED_INTERVALS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"interval은 {', '.join(map(str, SUPPORTED_INTERVALS))} 중 하나여야 합니다",
+        )
     svc = MarketService(session)
     return await svc.get_intraday_candles(symbol, market, interval)
 
@@ -89,3 +196,88 @@ async def get_price_cache(session: AsyncSession = Depends(get_session)):
     svc = PriceCacheService(session)
     items = await svc.get_all()
     return [PriceCacheResponse.model_validate(item) for item in items]
+
+
+@router.get(
+    "/cache/stats",
+    response_model=QuoteCacheStatsResponse,
+    summary="시세 메모리 캐시 통계",
+    description="메모리 시세 캐시(LRU+TTL)의 현재 크기, 용량, 히트/미스/제거 통계, "
+                "동시 요청 병합으로 절약된 브로커 호출 수, DB 쓰기 지연 버퍼 상태, 시세 이벤트 버스 발행/전달 통계를 반환합니다.",
+)
+async def get_quote_cache_stats():
+    from app.services.market_service import get_coalesce_stats
+    from app.services.price_bus import price_bus
+    from app.services.price_cache_service import get_write_behind_stats
+    from app.services.quote_cache import quote_cache
+    wb = get_write_behind_stats()
+    return QuoteCacheStatsResponse(
+        **quote_cache.stats(),
+        **get_coalesce_stats(),
+        db_pending=wb["pending"],
+        db_flushes=wb["flushes"],
+        db_rows_flushed=wb["rows_flushed"],
+        db_flush_failures=wb["failures"],
+        bus=price_bus.stats(),
+    )
+
+
+@router.get(
+    "/refresh/stats",
+    response_model=RefreshStatsResponse,
+    summary="시세 갱신 잡 통계",
+    description="관심종목·보유종목 시세 갱신 잡의 주기별 소요 시간, 성공/실패 건수, 간격 초과 횟수와 "
+                "제공자(KIS/pykrx)별 초당 호출 한도 대기 통계, 엔드포인트별 서킷 브레이커 상태(closed/open/half_open), "
+                "pykrx 워커 프로세스(pid, RSS, 교체·재기동 횟수)와 차단 호출 전용 스레드 풀 상태, 지표 스냅샷 갱신 통계, KIS 실시간 수신 상태, "
+                "우선순위 계층별(미체결 주문·전략 / 보유 / 관심 / 최근 조회) 종목 수·주기·최대 경과 시간을 반환합니다.",
+)
+async def get_refresh_stats():
+    from app.broker.throttle import get_circuit_breaker_stats, get_executor_stats, get_rate_limiter_stats
+    from app.services.market_service import get_refresh_stats as _get_refresh_stats
+    from app.broker.kis.realtime import get_realtime_client
+    from app.broker.free.worker_client import get_market_data_worker
+    realtime = get_realtime_client()
+    worker = get_market_data_worker()
+    return RefreshStatsResponse(
+        **_get_refresh_stats(),
+        rate_limiters=get_rate_limiter_stats(),
+        circuit_breakers=get_circuit_breaker_stats(),
+        executors=get_executor_stats(),
+        market_data_worker=worker.stats() if worker else None,
+        indicator_snapshots=get_snapshot_stats(),
+        realtime=realtime.stats() if realtime else None,
+        planner=refresh_planner.stats(),
+    )
+
+
+@router.get(
+    "/schedule",
+    response_model=MarketScheduleResponse,
+    summary="KRX 장 운영 일정 조회",
+    description="KRX 거래 캘린더 기준 현재 시간대(장 시작 전/정규장/장 마감 후/휴장), 오늘 정규장 시각, "
+                "다음 개장 시각, 시간대별 시세 갱신 간격, 전략 자동 실행 여부, 다가오는 휴장일을 반환합니다.",
+)
+async def get_market_schedule():
+    from datetime import datetime
+
+    from app.services.market_calendar import (
+        KST,
+        MarketPhase,
+        market_calendar,
+        refresh_interval,
+    )
+
+    now = datetime.now(KST)
+    phase = market_calendar.phase(now)
+    sess = market_calendar.session(now.date())
+    return MarketScheduleResponse(
+        now=now,
+        phase=phase.value,
+        is_trading_day=sess is not None,
+        session_open=sess.open if sess else None,
+        session_close=sess.close if sess else None,
+        next_session_open=market_calendar.next_session_open(now),
+        refresh_interval=refresh_interval(phase),
+        strategy_enabled=phase is MarketPhase.REGULAR,
+        upcoming_holidays=market_calendar.upcoming_holidays(now.date()),
+    )
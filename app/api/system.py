@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from typing import Literal
 
+from fastapi import APIRouter, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from app import metrics
 from app.config import settings
 
 router = APIRouter(tags=["system"])
@@ -19,3 +23,22 @@ async def health():
         "trading_mode": settings.get_trading_mode().value,
         "version": "0.1.0",
     }
+
+
+@router.get(
+    "/system/metrics",
+    summary="캐시·시세 제공자 메트릭",
+    description="시세 조회 응답 계층(메모리/stale/시작 적재/제공자/대체값), DB 대체 출처, "
+                "제공자(pykrx/KIS)별 호출·실패 수와 지연 히스토그램, 쓰기 지연 버퍼 flush 지표를 반환합니다. "
+                "기본은 Prometheus 텍스트 형식이며 format=json이면 JSON으로 반환합니다.",
+    response_class=PlainTextResponse,
+)
+async def system_metrics(
+    format: Literal["prometheus", "json"] = Query(
+        default="prometheus", description="응답 형식 (prometheus | json)"
+    ),
+):
+    metrics.ensure_cache_gauges()
+    if format == "json":
+        return JSONResponse(metrics.snapshot())
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,223 @@
+"""일봉 시계열 — 날짜·OHLCV 열 배열(columnar) 한 묶음.
+
+브로커·일봉 저장소·지표·전략이 같은 BarSeries를 주고받아 행마다 dict를 만들지 않는다.
+날짜는 datetime64[D], 가격은 float64, 거래량은 int64이며 항상 날짜 오름차순·날짜 중복 없음.
+슬라이스는 배열 뷰라 복사하지 않고, JSON 응답처럼 dict가 필요한 곳만 to_dicts()로 한 번에 변환한다.
+bars[i]는 그 행 dict를 그때 만든다 (기존 list[dict] 호출자 호환).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+
+import numpy as np
+
+# 기본 열 (dict 변환 시 키 순서)
+FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def _iso(value) -> str:
+    """브로커별 날짜 형식(YYYYMMDD / YYYY-MM-DD / date) → YYYY-MM-DD."""
+    value = str(value)
+    if len(value) == 8 and value.isdigit():
+        return f"{value[:4]}-{value[4:6]}-{value[6:]}"
+    return value[:10]
+
+
+def _dates(values) -> np.ndarray:
+    if isinstance(values, np.ndarray) and values.dtype.kind == "M":
+        return values.astype("datetime64[D]", copy=False)
+    values = list(values)
+    # YYYY-MM-DD 문자열·date는 numpy가 바로 변환 (YYYYMMDD는 연도로 읽히므로 먼저 정규화)
+    if values and isinstance(values[0], str) and len(values[0]) != 10:
+        values = [_iso(v) for v in values]
+    return np.array(values, dtype="datetime64[D]")
+
+
+class BarSeries:
+    """날짜 오름차순 일봉 열 배열. extra에는 같은 길이의 파생 열(ma5 등)을 둔다."""
+
+    __slots__ = ("date", "open", "high", "low", "close", "volume", "extra")
+
+    def __init__(
+        self,
+        date: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        extra: dict[str, np.ndarray] | None = None,
+    ):
+        # 이미 정렬·형 변환된 배열을 그대로 보관 (외부 입력은 from_columns/from_records 사용)
+        self.date = date
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.extra = extra or {}
+
+    @classmethod
+    def empty(cls) -> BarSeries:
+        f = np.empty(0, dtype=np.float64)
+        return cls(np.empty(0, dtype="datetime64[D]"), f, f, f, f, np.empty(0, dtype=np.int64))
+
+    @classmethod
+    def from_columns(
+        cls,
+        date: Sequence,
+        open: Sequence[float],
+        high: Sequence[float],
+        low: Sequence[float],
+        close: Sequence[float],
+        volume: Sequence[int],
+    ) -> BarSeries:
+        """열 목록 → 시계열. 날짜 오름차순으로 정렬하고, 같은 날짜는 나중 값만 남긴다."""
+        dates = _dates(date)
+        cols = [np.asarray(c, dtype=np.float64) for c in (open, high, low, close)]
+        vol = np.asarray(volume, dtype=np.float64).astype(np.int64)
+        if len(dates) > 1 and not (dates[1:] > dates[:-1]).all():
+            order = np.argsort(dates, kind="stable")
+            dates = dates[order]
+            keep = np.r_[dates[1:] != dates[:-1], True]  # 같은 날짜 중 마지막
+            idx = order[keep]
+            dates = dates[keep]
+            cols = [c[idx] for c in cols]
+            vol = vol[idx]
+        return cls(dates, *cols, vol)
+
+    @classmethod
+    def from_records(cls, rows: Iterable[dict]) -> BarSeries:
+        """일봉 dict 목록(정렬 무관) → 시계열. 날짜 없는 행은 버린다."""
+        rows = [r for r in rows if r.get("date")]
+        n = len(rows)
+
+        def col(field: str, dtype) -> np.ndarray:
+            return np.fromiter((r.get(field) or 0 for r in rows), dtype=dtype, count=n)
+
+        return cls.from_columns(
+            [r["date"] for r in rows],
+            col("open", np.float64), col("high", np.float64), col("low", np.float64),
+            col("close", np.float64), col("volume", np.float64),
+        )
+
+    @classmethod
+    def coerce(cls, bars: BarSeries | Iterable[dict]) -> BarSeries:
+        """BarSeries는 그대로, dict 목록(외부 브로커 구현 등)은 변환."""
+        return bars if isinstance(bars, BarSeries) else cls.from_records(bars)
+
+    # ── 조회 ─────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def __getitem__(self, key: int | slice) -> dict | BarSeries:
+        if isinstance(key, slice):
+            return BarSeries(
+                self.date[key], self.open[key], self.high[key], self.low[key],
+                self.close[key], self.volume[key],
+                {name: values[key] for name, values in self.extra.items()},
+            )
+        return self._row(range(len(self))[key])
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.to_dicts())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BarSeries):
+            return NotImplemented
+        return (
+            self.extra.keys() == other.extra.keys()
+            and all(
+                np.array_equal(a, b, equal_nan=a.dtype.kind == "f")
+                for a, b in zip(self._columns(), other._columns())
+            )
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "BarSeries(0)"
+        return f"BarSeries({len(self)}, {self.date[0]}..{self.date[-1]})"
+
+    def _columns(self) -> list[np.ndarray]:
+        return [self.date, self.open, self.high, self.low, self.close, self.volume, *self.extra.values()]
+
+    def column(self, field: str) -> np.ndarray:
+        """이름으로 열 조회 (기본 열 또는 파생 열)."""
+        if field in self.extra:
+            return self.extra[field]
+        return getattr(self, field)
+
+    def dates(self) -> list[str]:
+        """날짜 열 → YYYY-MM-DD 문자열 목록."""
+        return np.datetime_as_string(self.date, unit="D").tolist()
+
+    @property
+    def last_date(self) -> str | None:
+        return str(self.date[-1]) if len(self) else None
+
+    @property
+    def version(self) -> tuple:
+        """시계열 버전 토큰 — 길이·시작/마지막 날짜·마지막 종가 (indicators.memoize용)."""
+        if not len(self):
+            return (0,)
+        return (len(self), str(self.date[0]), str(self.date[-1]), float(self.close[-1]))
+
+    def since(self, start: str) -> BarSeries:
+        """start(YYYY-MM-DD) 이후 봉 (start 포함, 복사 없는 슬라이스)."""
+        return self[int(np.searchsorted(self.date, np.datetime64(start, "D"))):]
+
+    # ── 변환 ─────────────────────────────────────────────────
+
+    def with_columns(self, **columns: np.ndarray) -> BarSeries:
+        """파생 열을 추가한 새 시계열 (기본 열 배열은 공유)."""
+        return BarSeries(
+            self.date, self.open, self.high, self.low, self.close, self.volume,
+            {**self.extra, **columns},
+        )
+
+    def merge(self, newer: BarSeries) -> BarSeries:
+        """두 시계열 합치기 — 같은 날짜는 newer 값 사용. 파생 열은 버린다."""
+        if not len(newer):
+            return BarSeries(self.date, self.open, self.high, self.low, self.close, self.volume)
+        if not len(self):
+            return BarSeries(newer.date, newer.open, newer.high, newer.low, newer.close, newer.volume)
+        return BarSeries.from_columns(
+            np.concatenate((self.date, newer.date)),
+            np.concatenate((self.open, newer.open)),
+            np.concatenate((self.high, newer.high)),
+            np.concatenate((self.low, newer.low)),
+            np.concatenate((self.close, newer.close)),
+            np.concatenate((self.volume, newer.volume)),
+        )
+
+    def to_dicts(self) -> list[dict]:
+        """행별 dict 목록 (JSON 응답용). 파생 열의 NaN은 None."""
+        rows = [
+            {"date": d, "open": o, "high": h, "low": lo, "close": c, "volume": v}
+            for d, o, h, lo, c, v in zip(
+                self.dates(), self.open.tolist(), self.high.tolist(),
+                self.low.tolist(), self.close.tolist(), self.volume.tolist(),
+            )
+        ]
+        for name, values in self.extra.items():
+            for row, v in zip(rows, np.where(np.isnan(values), None, values).tolist()):
+                row[name] = v
+        return rows
+
+    def _row(self, i: int) -> dict:
+        row = {
+            "date": str(self.date[i]),
+            "open": float(self.open[i]),
+            "high": float(self.high[i]),
+            "low": float(self.low[i]),
+            "close": float(self.close[i]),
+            "volume": int(self.volume[i]),
+        }
+        for name, values in self.extra.items():
+            v = float(values[i])
+            row[name] = None if v != v else v
+        return row
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.bars import BarSeries
 
 
 @dataclass
@@ -30,6 +33,7 @@ class PriceInfo:
     change_pct: float = 0.0
     volume: int = 0
     market: str = "KR"
+    stale: bool = False  # 캐시 만료 후 대체값(갱신 대기 중) 여부
 
 
 class AbstractBroker(ABC):
@@ -72,12 +76,46 @@ class AbstractBroker(ABC):
     async def get_current_price(self, symbol: str, market: str) -> PriceInfo:
         """Get current price for a symbol."""
 
+    async def get_current_prices(self, symbols: list[str], market: str) -> dict[str, PriceInfo]:
+        """여러 종목 현재가 일괄 조회. {symbol: PriceInfo} 반환, 실패 종목은 제외.
+
+        기본 구현은 종목별 get_current_price를 제한된 동시성으로 호출하며,
+        시장 전체 스냅샷 등 일괄 조회가 가능한 브로커는 재정의한다.
+        """
+        from app.broker.throttle import gather_limited
+        from app.config import settings
+
+        return await gather_limited(
+            symbols,
+            lambda s: self.get_current_price(s, market),
+            concurrency=settings.price_refresh_concurrency,
+            timeout=settings.price_refresh_deadline,
+        )
+
     @abstractmethod
-    async def get_daily_prices(self, symbol: str, market: str, days: int = 60) -> list[dict]:
-        """Get daily OHLCV data for the last N days."""
+    async def get_daily_prices(
+        self, symbol: str, market: str, days: int = 60, start: str | None = None,
+    ) -> BarSeries:
+        """Get daily OHLCV data for the last N days (oldest first).
+
+        start('YYYY-MM-DD')가 주어지면 일수 대신 start 이후 봉 전체 (휴장일과 무관한 날짜 구간).
+        """
 
     @abstractmethod
     async def get_intraday_candles(
         self, symbol: str, market: str, interval: int = 1
     ) -> list[dict]:
-        """분봉 데이터 조회 (interval: 1 또는 5분). 지원하지 않으면 빈 목록 반환."""
+        """분봉 데이터 조회 (interval: 집계 단위 분). 지원하지 않으면 빈 목록 반환."""
+
+    async def get_minute_candles(
+        self, symbol: str, market: str, since: str | None = None
+    ) -> list[dict]:
+        """당일 1분봉 중 since('YYYY-MM-DD HH:MM:SS') 이후 것만 오름차순 반환.
+
+        기본 구현은 당일 1분봉 전체를 받아 거르며,
+        과거 방향 페이지 조회가 가능한 브로커는 필요한 페이지만 가져오도록 재정의한다.
+        """
+        candles = await self.get_intraday_candles(symbol, market, 1)
+        if since is None:
+            return candles
+        return [c for c in candles if c["datetime"] >= since]
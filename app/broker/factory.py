@@ -2,28 +2,48 @@
 
 from __future__ import annotations
 
+import logging
+
 from app.broker.base import AbstractBroker
-from app.schemas.common import TradingMode
+from app.schemas.common import MarketDataMode, TradingMode
+
+logger = logging.getLogger(__name__)
 
 
 _broker_cache: dict[TradingMode, AbstractBroker] = {}
 
 
 async def get_broker(mode: TradingMode | str | None = None) -> AbstractBroker:
-    """Get or create a broker instance for the given trading mode."""
+    """Get or create a broker instance for the given trading mode.
+
+    settings.market_data_mode가 RECORD면 시세 응답을 기록하는 래퍼로 감싸고,
+    REPLAY면 거래 모드와 무관하게 기록 파일로 시세를 제공하는 모의 브로커를 반환한다.
+    """
+    from app.config import settings
+
     if mode is None:
-        from app.config import settings
         mode = settings.get_trading_mode()
     if isinstance(mode, str):
         mode = TradingMode(mode)
 
     if mode not in _broker_cache:
-        if mode == TradingMode.REAL:
+        data_mode = settings.market_data_mode
+        if data_mode == MarketDataMode.REPLAY:
+            from app.broker.paper.broker import PaperBroker
+            from app.broker.replay.provider import get_replay_provider
+            if mode == TradingMode.REAL:
+                logger.warning("시세 재생 모드: 실매매 브로커 대신 모의 체결 브로커 사용")
+            broker = PaperBroker(price_provider=get_replay_provider())
+        elif mode == TradingMode.REAL:
             from app.broker.kis.broker import KISBroker
             broker = KISBroker()
         else:
             from app.broker.paper.broker import PaperBroker
             broker = PaperBroker()
+        if data_mode == MarketDataMode.RECORD:
+            from app.broker.replay.log import get_recorder
+            from app.broker.replay.recorder import RecordingBroker
+            broker = RecordingBroker(broker, get_recorder())
         await broker.connect()
         _broker_cache[mode] = broker
 
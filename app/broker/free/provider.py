@@ -1,26 +1,104 @@
-"""Free market data provider using pykrx (KR)."""
+"""Free market data provider using pykrx (KR).
+
+pykrx 호출은 시세 워커 프로세스(또는 비활성 시 프로세스 내 전용 스레드 풀)에서 실행되고,
+이 모듈은 결과(JSON 값)를 PriceInfo / 전종목 스냅샷 테이블로 바꾸는 얇은 클라이언트다.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
+from typing import Any
 
+from app.bars import BarSeries
 from app.broker.base import PriceInfo
+from app.broker.free.snapshot import MarketSnapshot
+from app.broker.free.worker_client import call_pykrx, call_pykrx_batch, unwrap
+from app.broker.throttle import CircuitOpenError, get_circuit_breaker, get_rate_limiter
+from app.config import settings
+from app.metrics import provider_timer
 
 logger = logging.getLogger(__name__)
 
+# 전종목 시세 스냅샷 (프로세스 전역 공유) 과 진행 중인 조회 Task (동시 만료 시 1회만 조회)
+_snapshot: MarketSnapshot | None = None
+_snapshot_task: asyncio.Task | None = None
+
+
+def _snapshot_expiry() -> float:
+    """스냅샷 만료 시각 (monotonic): 장중이면 스냅샷 유효 시간 후, 아니면 다음 장 시작."""
+    from app.services.daily_bar_service import is_bar_live, next_session_open
+    from app.services.market_calendar import KST
+
+    now = datetime.now(KST)
+    if is_bar_live(now):
+        return time.monotonic() + settings.pykrx_snapshot_max_age
+    return time.monotonic() + (next_session_open(now) - now).total_seconds()
+
 
 class FreeMarketProvider:
     """Provides market data without KIS credentials."""
 
+    def __init__(self):
+        # KRX 스크래핑 호출 한도 (프로세스 전역 공유)
+        self._limiter = get_rate_limiter("pykrx", settings.pykrx_rate_limit)
+
+    async def _run(self, op: str, **args) -> Any:
+        """pykrx 작업을 엔드포인트별 서킷 브레이커 → 호출 한도 → 워커(제한 시간) 순으로 실행.
+
+        브레이커가 열려 있으면 호출 한도를 소모하지 않고 CircuitOpenError로 즉시 실패한다.
+        """
+        async def _call() -> Any:
+            await self._limiter.acquire()
+            with provider_timer("pykrx", op):
+                return await call_pykrx(op, args)
+
+        return await get_circuit_breaker(f"pykrx.{op}").call(_call)
+
     async def get_current_price(self, symbol: str, market: str) -> PriceInfo:
+        """최신 전종목 스냅샷에서 O(1) 조회. 스냅샷에 없는 종목(ETF 등)만 종목별 조회."""
+        try:
+            info = (await self._get_kr_snapshot()).get(symbol)
+        except CircuitOpenError:
+            info = None
+        except Exception as e:
+            logger.warning("전종목 스냅샷 조회 실패, 종목별 조회 %s: %s", symbol, e)
+            info = None
+        if info is not None:
+            return info
         return await self._get_kr_price(symbol)
 
+    async def get_current_prices(
+        self, symbols: list[str], market: str
+    ) -> dict[str, PriceInfo]:
+        """시장 전체 스냅샷(갱신 주기당 최대 1회 조회)으로 여러 종목 시세를 반환한다.
+
+        스냅샷에 없는 종목(ETF 등)만 워커 일괄 요청 1회로 보완한다.
+        스냅샷 조회가 실패하거나 서킷이 열려 있으면 전 종목을 일괄 요청으로 조회한다.
+        """
+        try:
+            snapshot = await self._get_kr_snapshot()
+        except CircuitOpenError:
+            return await self._get_kr_prices(symbols)
+        except Exception as e:
+            logger.warning("전종목 스냅샷 조회 실패, 종목별 조회 %d종목: %s", len(symbols), e)
+            return await self._get_kr_prices(symbols)
+        result = {}
+        for s in symbols:
+            info = snapshot.get(s)
+            if info is not None:
+                result[s] = info
+        missing = [s for s in symbols if s not in result]
+        if missing:
+            result.update(await self._get_kr_prices(missing))
+        return result
+
     async def get_daily_prices(
-        self, symbol: str, market: str, days: int = 60
-    ) -> list[dict]:
-        return await self._get_kr_daily(symbol, days)
+        self, symbol: str, market: str, days: int = 60, start: str | None = None,
+    ) -> BarSeries:
+        return BarSeries.from_columns(**await self._run("daily", symbol=symbol, days=days, start=start))
 
     async def get_intraday_candles(
         self, symbol: str, market: str, interval: int = 1
@@ -32,65 +110,74 @@ class FreeMarketProvider:
     # ── KR (pykrx) ──────────────────────────────────────────────
 
     async def _get_kr_price(self, symbol: str) -> PriceInfo:
-        def _fetch():
-            from pykrx import stock as pykrx_stock
-
-            today = datetime.now().strftime("%Y%m%d")
-            week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y%m%d")
-
-            df = pykrx_stock.get_market_ohlcv_by_date(week_ago, today, symbol)
-            if df.empty:
-                return PriceInfo(symbol=symbol, price=0.0, market="KR")
-
-            latest = df.iloc[-1]
-            price = float(latest["종가"])
-            volume = int(latest["거래량"])
-
-            if len(df) >= 2:
-                prev_close = float(df.iloc[-2]["종가"])
-                change = price - prev_close
-                change_pct = (change / prev_close * 100) if prev_close else 0.0
-            else:
-                change = 0.0
-                change_pct = 0.0
-
-            return PriceInfo(
-                symbol=symbol,
-                price=price,
-                change=change,
-                change_pct=change_pct,
-                volume=volume,
-                market="KR",
-            )
-
-        return await asyncio.to_thread(_fetch)
-
-    async def _get_kr_daily(self, symbol: str, days: int) -> list[dict]:
-        def _fetch():
-            from pykrx import stock as pykrx_stock
-
-            today = datetime.now().strftime("%Y%m%d")
-            start = (datetime.now() - timedelta(days=int(days * 1.6))).strftime(
-                "%Y%m%d"
-            )
-
-            df = pykrx_stock.get_market_ohlcv_by_date(start, today, symbol)
-            if df.empty:
-                return []
-
-            df = df.tail(days)
-            result = []
-            for date_idx, row in df.iterrows():
-                result.append(
-                    {
-                        "date": date_idx.strftime("%Y-%m-%d"),
-                        "open": float(row["시가"]),
-                        "high": float(row["고가"]),
-                        "low": float(row["저가"]),
-                        "close": float(row["종가"]),
-                        "volume": int(row["거래량"]),
-                    }
-                )
-            return result
-
-        return await asyncio.to_thread(_fetch)
+        return PriceInfo(**await self._run("price", symbol=symbol))
+
+    async def _get_kr_prices(self, symbols: list[str]) -> dict[str, PriceInfo]:
+        """종목별 시세를 워커 일괄 요청으로 조회 (실패 종목과 마감까지 못 끝낸 종목은 제외).
+
+        price_refresh_deadline이 지나면 남은 종목은 조회하지 않고 완료분만 반환한다.
+        워커는 요청을 하나씩 처리하므로, 스냅샷·일봉 등 다른 요청이 뒤에서 오래 기다리지 않도록
+        pykrx_call_timeout의 절반 안에 끝나는 묶음으로 나눠 보낸다.
+        호출 한도는 묶음마다 첫 종목만 기다리고 나머지는 미리 예약하며,
+        워커가 같은 간격(1/rate초)으로 순차 실행해 공유 한도를 지킨다.
+        """
+        rate = settings.pykrx_rate_limit
+        interval = 1.0 / rate if rate > 0 else 0.0
+        size = max(1, int(settings.pykrx_call_timeout / 2 / interval)) if interval else len(symbols)
+        deadline = time.monotonic() + settings.price_refresh_deadline
+        breaker = get_circuit_breaker("pykrx.price")
+        result: dict[str, PriceInfo] = {}
+
+        for start in range(0, len(symbols), size):
+            chunk = symbols[start:start + size]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning("일괄 조회 마감 초과: %d종목 미조회", len(symbols) - start)
+                break
+
+            async def _call(chunk: list[str] = chunk, remaining: float = remaining) -> list[dict]:
+                await self._limiter.acquire()
+                self._limiter.reserve(len(chunk) - 1)
+                with provider_timer("pykrx", "price_batch"):
+                    return await call_pykrx_batch(
+                        [("price", {"symbol": s}) for s in chunk],
+                        interval=interval,
+                        timeout=remaining,
+                    )
+
+            try:
+                items = await breaker.call(_call)
+            except Exception as e:
+                if not result:
+                    raise
+                logger.warning("일괄 조회 중단 (%d종목 완료): %s", len(result), e)
+                break
+            for symbol, item in zip(chunk, items):
+                try:
+                    result[symbol] = PriceInfo(**unwrap(item))
+                except Exception as e:
+                    logger.warning("일괄 조회 실패 %s: %s", symbol, e)
+        return result
+
+    async def _get_kr_snapshot(self) -> MarketSnapshot:
+        """유효한 전종목 스냅샷 반환. 만료됐으면 다시 조회한다 (동시 요청은 한 번의 조회를 공유)."""
+        global _snapshot_task
+        if _snapshot is not None and _snapshot.is_fresh():
+            return _snapshot
+        task = _snapshot_task
+        if task is None or task.done():
+            task = _snapshot_task = asyncio.create_task(self._fetch_kr_snapshot())
+        # 실패 시 만료 스냅샷을 최신처럼 내보내지 않고 예외 전파 (호출자가 DB/만료 캐시로 대체)
+        return await asyncio.shield(task)
+
+    async def _fetch_kr_snapshot(self) -> MarketSnapshot:
+        """KOSPI/KOSDAQ/KONEX 전종목 당일(휴일이면 직전 영업일) OHLCV를 한 번에 조회."""
+        global _snapshot
+        cols = await self._run("snapshot")
+        _snapshot = MarketSnapshot.from_ohlcv(
+            cols["tickers"], cols["open"], cols["high"], cols["low"],
+            cols["close"], cols["volume"], cols["change"], cols["change_pct"],
+            expires_at=_snapshot_expiry(),
+        )
+        logger.debug("전종목 스냅샷 갱신: %d종목", len(_snapshot))
+        return _snapshot
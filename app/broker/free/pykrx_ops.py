@@ -0,0 +1,181 @@
+"""pykrx 호출 함수 모음 — 시세 워커 프로세스와 프로세스 내 실행기가 함께 쓴다.
+
+모든 함수는 차단 호출이며 JSON 직렬화 가능한 값(dict/list/숫자/문자열)만 반환한다.
+DataFrame은 함수 안에서만 만들고 버리므로, 워커 프로세스에서 실행하면
+pandas 메모리가 웹 프로세스에 남지 않는다. 이 모듈은 app 설정 등을 import하지 않는다.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+
+def price(symbol: str) -> dict:
+    """최근 7일 일봉의 마지막 두 종가로 종목 현재가·전일 대비 계산."""
+    from pykrx import stock as pykrx_stock
+
+    today = datetime.now().strftime("%Y%m%d")
+    week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y%m%d")
+
+    df = pykrx_stock.get_market_ohlcv_by_date(week_ago, today, symbol)
+    if df.empty:
+        return {"symbol": symbol, "price": 0.0, "market": "KR"}
+
+    latest = df.iloc[-1]
+    close = float(latest["종가"])
+    volume = int(latest["거래량"])
+
+    if len(df) >= 2:
+        prev_close = float(df.iloc[-2]["종가"])
+        change = close - prev_close
+        change_pct = (change / prev_close * 100) if prev_close else 0.0
+    else:
+        change = 0.0
+        change_pct = 0.0
+
+    return {
+        "symbol": symbol,
+        "price": close,
+        "change": change,
+        "change_pct": change_pct,
+        "volume": volume,
+        "market": "KR",
+    }
+
+
+# KRX 전종목 시세(12001) 원본 열 — pykrx get_market_ohlcv_by_ticker가 버리는 대비(CMPPREVDD_PRC)까지 사용
+_SNAPSHOT_COLUMNS = {
+    "open": "TDD_OPNPRC",
+    "high": "TDD_HGPRC",
+    "low": "TDD_LWPRC",
+    "close": "TDD_CLSPRC",
+    "volume": "ACC_TRDVOL",
+    "change": "CMPPREVDD_PRC",
+    "change_pct": "FLUC_RT",
+}
+_FLUC_DOWN = ("2", "5")  # FLUC_TP_CD: 1 상승, 2 하락, 3 보합, 4 상한, 5 하한
+
+
+def _krx_all_prices(date: str):
+    """KRX 전종목 시세 원본 DataFrame (값은 "1,234" 형식 문자열)."""
+    from pykrx.website.krx.market.core import 전종목시세
+
+    return 전종목시세().fetch(date, "ALL")
+
+
+def snapshot() -> dict:
+    """KOSPI/KOSDAQ/KONEX 전종목 당일(휴일이면 직전 영업일) OHLCV와 전일 대비 — 열 단위 목록.
+
+    전일 대비는 KRX가 주는 값을 그대로 쓴다 (부호는 등락 구분 코드로 붙인다).
+    """
+    import pandas as pd
+    from pykrx import stock as pykrx_stock
+
+    def _num(df, column: str):
+        values = df[column].astype(str).str.replace(",", "", regex=False)
+        return pd.to_numeric(values, errors="coerce").fillna(0.0).to_numpy(dtype=float)
+
+    today = datetime.now().strftime("%Y%m%d")
+    df = _krx_all_prices(today)
+    if df.empty or not _num(df, "TDD_CLSPRC").any():
+        # 휴일: 직전 영업일 (pykrx alternative=True와 같은 방식)
+        df = _krx_all_prices(pykrx_stock.get_nearest_business_day_in_a_week(today, prev=True))
+    if df.empty:
+        return {k: [] for k in ("tickers", *_SNAPSHOT_COLUMNS)}
+
+    cols = {key: _num(df, column) for key, column in _SNAPSHOT_COLUMNS.items()}
+    down = df["FLUC_TP_CD"].astype(str).isin(_FLUC_DOWN).to_numpy()
+    change = abs(cols["change"])
+    change[down] *= -1
+    cols["change"] = change
+    return {"tickers": df["ISU_SRT_CD"].tolist(), **{k: v.tolist() for k, v in cols.items()}}
+
+
+def daily(symbol: str, days: int, start: str | None = None) -> dict:
+    """최근 days 거래일 일봉 (날짜 오름차순) — 열 단위 목록 (BarSeries.from_columns 인자).
+
+    start(YYYY-MM-DD)가 있으면 start부터 오늘까지 전체 구간.
+    """
+    from pykrx import stock as pykrx_stock
+
+    today = datetime.now().strftime("%Y%m%d")
+    if start:
+        fromdate = start.replace("-", "")
+    else:
+        fromdate = (datetime.now() - timedelta(days=int(days * 1.6))).strftime("%Y%m%d")
+
+    df = pykrx_stock.get_market_ohlcv_by_date(fromdate, today, symbol)
+    if df.empty:
+        return {k: [] for k in ("date", "open", "high", "low", "close", "volume")}
+
+    if not start:
+        df = df.tail(days)
+    return {
+        "date": df.index.strftime("%Y-%m-%d").tolist(),
+        "open": df["시가"].to_numpy(dtype=float).tolist(),
+        "high": df["고가"].to_numpy(dtype=float).tolist(),
+        "low": df["저가"].to_numpy(dtype=float).tolist(),
+        "close": df["종가"].to_numpy(dtype=float).tolist(),
+        "volume": df["거래량"].to_numpy(dtype="int64").tolist(),
+    }
+
+
+def tickers(market: str) -> list[list[str]]:
+    """시장(KOSPI/KOSDAQ) 상장 종목 [[코드, 종목명], ...] (종목명 조회 실패 종목 제외)."""
+    from pykrx import stock as pykrx_stock
+
+    today = datetime.now().strftime("%Y%m%d")
+    result = []
+    for ticker in pykrx_stock.get_market_ticker_list(today, market=market):
+        try:
+            name = pykrx_stock.get_market_ticker_name(ticker)
+        except Exception:
+            continue
+        if name:
+            result.append([ticker, name])
+    return result
+
+
+def ping() -> dict:
+    """실행 프로세스 확인용 (pykrx 호출 없음)."""
+    return {"pid": os.getpid()}
+
+
+OPS: dict[str, Callable[..., object]] = {
+    "price": price,
+    "ping": ping,
+    "snapshot": snapshot,
+    "daily": daily,
+    "tickers": tickers,
+}
+
+
+def dispatch(op: str, args: dict) -> object:
+    fn = OPS.get(op)
+    if fn is None:
+        raise ValueError(f"알 수 없는 pykrx 작업: {op}")
+    return fn(**args)
+
+
+def run_batch(items: list[dict], interval: float = 0.0, deadline: float | None = None) -> list[dict]:
+    """여러 작업을 순서대로 실행 (작업 사이 interval초 간격). 항목별 성공/실패 결과 목록 반환.
+
+    deadline(초)이 지나면 남은 작업은 실행하지 않고 TimeoutError 항목으로 돌려준다 (완료분은 유지).
+    """
+    results = []
+    start = time.monotonic()
+    for i, item in enumerate(items):
+        if deadline is not None and time.monotonic() - start + (interval if i else 0.0) > deadline:
+            skipped = {"ok": False, "error": "일괄 조회 제한 시간 초과 (미실행)", "type": "TimeoutError"}
+            results.extend(dict(skipped) for _ in items[i:])
+            break
+        if i and interval > 0:
+            time.sleep(interval)
+        try:
+            results.append({"ok": True, "result": dispatch(item["op"], item.get("args", {}))})
+        except Exception as e:
+            results.append({"ok": False, "error": str(e), "type": type(e).__name__})
+    return results
@@ -0,0 +1,103 @@
+"""KRX 전종목 시세 스냅샷 — 종목 코드 색인 + 열 배열 테이블.
+
+pykrx 전종목 OHLCV(일자 기준) 1회 조회 결과를 (종목 수 × 7) float64 배열 하나로 보관하고
+{종목 코드: 행 번호} 색인으로 종목별 시세를 O(1)로 조회한다.
+2,700여 종목 기준 배열 약 150KB로, 종목별 PriceInfo를 미리 만들어 두는 것보다 작다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+
+import numpy as np
+
+from app.broker.base import PriceInfo
+
+# 열 순서
+PRICE, CHANGE, CHANGE_PCT, VOLUME, OPEN, HIGH, LOW = range(7)
+
+
+class MarketSnapshot:
+    """특정 거래일의 전종목 시세 테이블 (불변)."""
+
+    __slots__ = ("market", "fetched_at", "expires_at", "_index", "_table")
+
+    def __init__(
+        self,
+        tickers: Sequence[str],
+        table: np.ndarray,
+        market: str = "KR",
+        expires_at: float = 0.0,
+    ):
+        self.market = market
+        self.fetched_at = time.monotonic()
+        self.expires_at = expires_at  # monotonic, 이후에는 다시 조회
+        self._index = {t: i for i, t in enumerate(tickers)}
+        self._table = table
+
+    @classmethod
+    def from_ohlcv(
+        cls,
+        tickers: Sequence[str],
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        change: np.ndarray,
+        change_pct: np.ndarray,
+        **kwargs,
+    ) -> MarketSnapshot:
+        """KRX 전종목 OHLCV·전일 대비·등락률 열로 테이블 구성."""
+        table = np.empty((len(close), 7), dtype=np.float64)
+        table[:, PRICE] = close
+        table[:, CHANGE] = change
+        table[:, CHANGE_PCT] = change_pct
+        table[:, VOLUME] = volume
+        table[:, OPEN] = open_
+        table[:, HIGH] = high
+        table[:, LOW] = low
+        return cls(list(tickers), table, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (time.monotonic() if now is None else now) < self.expires_at
+
+    def get(self, symbol: str) -> PriceInfo | None:
+        """종목 시세 (없으면 None)."""
+        i = self._index.get(symbol)
+        if i is None:
+            return None
+        price, change, pct, volume = self._table[i, :4].tolist()
+        return PriceInfo(
+            symbol=symbol,
+            price=price,
+            change=change,
+            change_pct=pct,
+            volume=int(volume),
+            market=self.market,
+        )
+
+    def ohlcv(self, symbol: str) -> dict | None:
+        """종목 당일 시가/고가/저가/종가/거래량 (없으면 None)."""
+        i = self._index.get(symbol)
+        if i is None:
+            return None
+        row = self._table[i].tolist()
+        return {
+            "open": row[OPEN],
+            "high": row[HIGH],
+            "low": row[LOW],
+            "close": row[PRICE],
+            "volume": int(row[VOLUME]),
+        }
@@ -0,0 +1,69 @@
+"""pykrx 시세 워커 프로세스 — 표준 입출력 JSON Lines 프로토콜.
+
+웹 프로세스(worker_client)가 띄우는 장수명 하위 프로세스로, pykrx/pandas는 이 프로세스에만 적재된다.
+
+요청 (한 줄에 하나):
+    {"id": 1, "op": "price", "args": {"symbol": "005930"}}
+    {"id": 2, "batch": [{"op": "price", "args": {...}}, ...], "interval": 0.2, "deadline": 18.0}
+응답:
+    {"id": 1, "ok": true, "result": ..., "rss": 123456789}
+    {"id": 1, "ok": false, "error": "...", "type": "ConnectionError", "rss": ...}
+    {"id": 2, "ok": true, "results": [{"ok": true, "result": ...}, ...], "rss": ...}
+
+요청은 받은 순서대로 하나씩 처리한다. 일괄 요청은 deadline(초)이 지나면 남은 항목을 실행하지 않고
+완료분과 함께 응답한다. stdin이 닫히면 종료한다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+
+def _rss_bytes() -> int:
+    """현재 상주 메모리(RSS). /proc가 없으면 최대 RSS로 대체."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def handle(request: dict) -> dict:
+    from app.broker.free import pykrx_ops
+
+    response: dict = {"id": request.get("id")}
+    try:
+        if "batch" in request:
+            response["results"] = pykrx_ops.run_batch(
+                request["batch"], request.get("interval", 0.0), request.get("deadline"),
+            )
+        else:
+            response["result"] = pykrx_ops.dispatch(request["op"], request.get("args", {}))
+        response["ok"] = True
+    except Exception as e:
+        response.update(ok=False, error=str(e), type=type(e).__name__)
+    response["rss"] = _rss_bytes()
+    return response
+
+
+def main() -> None:
+    # 프로토콜 출력은 원래 stdout만 사용. pykrx 등이 print하는 메시지는 stderr로 보낸다.
+    out = sys.stdout.buffer
+    sys.stdout = sys.stderr
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            continue
+        out.write(json.dumps(handle(request), ensure_ascii=False, separators=(",", ":")).encode())
+        out.write(b"\n")
+        out.flush()
+
+
+if __name__ == "__main__":
+    main()
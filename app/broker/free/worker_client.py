@@ -0,0 +1,333 @@
+"""pykrx 시세 워커 클라이언트 — 하위 프로세스 관리 + JSON Lines 요청/응답.
+
+- 첫 호출 시 워커를 띄우고, 요청 id로 응답을 짝지어 동시 요청을 한 파이프로 주고받는다.
+- 호출 수가 max_calls에 닿거나 워커 RSS가 max_rss_mb를 넘으면 새 워커로 교체하고,
+  기존 워커는 처리 중인 요청을 마친 뒤 종료한다 (pandas 메모리를 OS에 반환).
+- 워커가 죽으면 진행 중 요청은 새 워커에서 한 번 재시도한다 (조회 작업은 멱등).
+- 제한 시간을 넘긴 워커는 멈춘 것으로 보고 강제 종료한다. 일괄 요청의 마감 시간은 워커가 직접 지켜
+  완료분을 돌려주므로, 마감 + 호출 1건 제한 시간까지 응답이 없을 때만 멈춘 것으로 본다.
+
+pykrx_worker_enabled=False면 같은 작업을 프로세스 내 전용 스레드 풀에서 실행한다 (call_pykrx).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import pathlib
+import sys
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 응답 한 줄(전종목 열 목록)이 기본 StreamReader 한도(64KB)를 넘으므로 여유 있게
+_LINE_LIMIT = 16 * 1024 * 1024
+_PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[3]
+
+# 워커 쪽 예외 이름 → 웹 프로세스에서 다시 던질 예외 타입
+_REMOTE_ERRORS: dict[str, type[Exception]] = {
+    "ImportError": ImportError,
+    "ModuleNotFoundError": ImportError,
+    "ValueError": ValueError,
+    "KeyError": KeyError,
+    "ConnectionError": ConnectionError,
+    "TimeoutError": TimeoutError,
+}
+
+
+class WorkerError(RuntimeError):
+    """워커에서 작업이 실패함 (원격 예외 타입이 매핑되지 않은 경우)."""
+
+
+class WorkerCrashedError(RuntimeError):
+    """워커 프로세스가 응답 전에 종료됨."""
+
+
+def _remote_error(payload: dict) -> Exception:
+    exc_type = _REMOTE_ERRORS.get(payload.get("type", ""), WorkerError)
+    return exc_type(payload.get("error", "pykrx 워커 작업 실패"))
+
+
+class _WorkerProcess:
+    """실행 중인 워커 프로세스 1개와 응답 대기 중인 요청들."""
+
+    def __init__(self, proc: asyncio.subprocess.Process):
+        self.proc = proc
+        self.pending: dict[int, asyncio.Future] = {}
+        self.calls = 0
+        self.rss = 0
+        self.alive = True
+        self._reader = asyncio.create_task(self._read_loop())
+
+    @classmethod
+    async def spawn(cls) -> _WorkerProcess:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_PROJECT_ROOT), env.get("PYTHONPATH")]))
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "app.broker.free.worker",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=env,
+            limit=_LINE_LIMIT,
+        )
+        logger.info("pykrx 워커 시작 (pid=%d)", proc.pid)
+        return cls(proc)
+
+    @property
+    def pid(self) -> int:
+        return self.proc.pid
+
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                line = await self.proc.stdout.readline()
+                if not line:
+                    break
+                try:
+                    payload = json.loads(line)
+                except ValueError:
+                    logger.debug("pykrx 워커 비정상 출력 무시: %r", line[:200])
+                    continue
+                self.rss = payload.get("rss", self.rss)
+                fut = self.pending.pop(payload.get("id"), None)
+                if fut is not None and not fut.done():
+                    fut.set_result(payload)
+        except Exception as e:
+            logger.warning("pykrx 워커 응답 수신 오류: %s", e)
+        finally:
+            self.alive = False
+            for fut in self.pending.values():
+                if not fut.done():
+                    fut.set_exception(WorkerCrashedError(f"pykrx 워커 종료 (pid={self.pid})"))
+            self.pending.clear()
+
+    async def request(self, message: dict, request_id: int, timeout: float | None) -> dict:
+        if not self.alive:
+            raise WorkerCrashedError(f"pykrx 워커 종료 (pid={self.pid})")
+        fut = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = fut
+        self.calls += 1
+        try:
+            self.proc.stdin.write(json.dumps({"id": request_id, **message}).encode() + b"\n")
+            await self.proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            self.pending.pop(request_id, None)
+            raise WorkerCrashedError(f"pykrx 워커 파이프 끊김 (pid={self.pid})") from e
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        finally:
+            self.pending.pop(request_id, None)
+
+    async def close(self, grace: float = 5.0) -> None:
+        """처리 중인 요청을 기다린 뒤 stdin을 닫아 정상 종료. grace초 안에 끝나지 않으면 강제 종료."""
+        if self.pending:
+            await asyncio.wait(list(self.pending.values()), timeout=grace)
+        if self.proc.returncode is None:
+            try:
+                self.proc.stdin.close()
+                await asyncio.wait_for(self.proc.wait(), grace)
+            except (TimeoutError, OSError):
+                self.kill()
+        await self._finish()
+
+    def kill(self) -> None:
+        if self.proc.returncode is None:
+            try:
+                self.proc.kill()
+            except ProcessLookupError:
+                pass
+
+    async def _finish(self) -> None:
+        if self.proc.returncode is None:
+            await self.proc.wait()
+        await asyncio.gather(self._reader, return_exceptions=True)
+
+
+class MarketDataWorker:
+    """pykrx 워커 프로세스 관리자 (지연 기동, 호출 수·RSS 기준 교체, 장애 시 재기동)."""
+
+    def __init__(self, max_calls: int = 500, max_rss_mb: float = 300.0, timeout: float = 15.0):
+        self.max_calls = max_calls
+        self.max_rss_mb = max_rss_mb
+        self.timeout = timeout
+        self._worker: _WorkerProcess | None = None
+        self._spawning: asyncio.Task | None = None
+        self._retiring: set[asyncio.Task] = set()
+        self._ids = itertools.count(1)
+        self.calls = 0
+        self.spawns = 0
+        self.recycles = 0
+        self.crashes = 0
+        self.timeouts = 0
+
+    async def _ensure(self) -> _WorkerProcess:
+        worker = self._worker
+        if worker is not None and worker.alive:
+            return worker
+        if worker is not None:
+            self.crashes += 1
+            logger.warning("pykrx 워커 비정상 종료 (pid=%d), 재기동", worker.pid)
+            self._worker = None
+            await worker._finish()
+        # 동시 호출이 워커를 여러 개 띄우지 않도록 기동 Task를 공유
+        if self._spawning is None or self._spawning.done():
+            self._spawning = asyncio.create_task(_WorkerProcess.spawn())
+        worker = await asyncio.shield(self._spawning)
+        if self._worker is None:
+            self._worker = worker
+            self.spawns += 1
+        return self._worker
+
+    def _maybe_recycle(self, worker: _WorkerProcess) -> None:
+        if self._worker is not worker or not worker.alive:
+            return
+        reason = None
+        if self.max_calls > 0 and worker.calls >= self.max_calls:
+            reason = f"호출 {worker.calls}회"
+        elif self.max_rss_mb > 0 and worker.rss > self.max_rss_mb * 1024 * 1024:
+            reason = f"RSS {worker.rss / 1024 / 1024:.0f}MB"
+        if reason is None:
+            return
+        logger.info("pykrx 워커 교체 (pid=%d, %s)", worker.pid, reason)
+        self._worker = None
+        self.recycles += 1
+        task = asyncio.create_task(worker.close())
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+
+    async def _request(self, message: dict, timeout: float | None) -> dict:
+        timeout = self.timeout if timeout is None else timeout
+        for attempt in range(2):
+            worker = await self._ensure()
+            try:
+                payload = await worker.request(message, next(self._ids), timeout or None)
+            except WorkerCrashedError:
+                if attempt:
+                    raise
+                continue  # 새 워커에서 한 번 재시도
+            except TimeoutError:
+                # 응답 없는 워커는 멈춘 것으로 보고 종료 (다음 호출이 새 워커를 띄움)
+                self.timeouts += 1
+                if self._worker is worker:
+                    self._worker = None
+                worker.kill()
+                task = asyncio.create_task(worker._finish())
+                self._retiring.add(task)
+                task.add_done_callback(self._retiring.discard)
+                raise TimeoutError(f"pykrx 워커 응답 제한 시간 초과 ({timeout:.0f}s)") from None
+            self.calls += 1
+            self._maybe_recycle(worker)
+            return payload
+        raise WorkerCrashedError("pykrx 워커 재기동 실패")
+
+    async def call(self, op: str, args: dict | None = None, timeout: float | None = None) -> Any:
+        """작업 1건 실행 후 결과 반환 (워커 쪽 예외는 대응 타입으로 다시 던짐)."""
+        payload = await self._request({"op": op, "args": args or {}}, timeout)
+        if not payload.get("ok"):
+            raise _remote_error(payload)
+        return payload.get("result")
+
+    async def call_batch(
+        self, items: list[tuple[str, dict]], interval: float = 0.0, timeout: float | None = None,
+    ) -> list[dict]:
+        """여러 작업을 요청 1번으로 실행 (워커가 interval초 간격으로 순차 처리). 항목별 결과 목록 반환.
+
+        timeout은 일괄 요청의 마감 시간이다: 워커가 마감 이후 항목을 실행하지 않고 완료분과 함께 응답한다.
+        """
+        message = {"batch": [{"op": op, "args": args} for op, args in items], "interval": interval}
+        if timeout:
+            message["deadline"] = timeout
+            timeout += self.timeout  # 마감 직전에 시작한 항목 1건까지 기다림
+        payload = await self._request(message, timeout)
+        if not payload.get("ok"):
+            raise _remote_error(payload)
+        return payload["results"]
+
+    async def stop(self) -> None:
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            await worker.close(grace=2.0)
+        if self._retiring:
+            await asyncio.gather(*self._retiring, return_exceptions=True)
+
+    def stats(self) -> dict:
+        worker = self._worker
+        return {
+            "pid": worker.pid if worker else None,
+            "alive": bool(worker and worker.alive),
+            "worker_calls": worker.calls if worker else 0,
+            "rss_mb": round(worker.rss / 1024 / 1024, 1) if worker else 0.0,
+            "calls": self.calls,
+            "spawns": self.spawns,
+            "recycles": self.recycles,
+            "crashes": self.crashes,
+            "timeouts": self.timeouts,
+        }
+
+
+_worker: MarketDataWorker | None = None
+
+
+def get_market_data_worker() -> MarketDataWorker | None:
+    """프로세스 전역 워커 관리자 (pykrx_worker_enabled=False면 None)."""
+    global _worker
+    if not settings.pykrx_worker_enabled:
+        return None
+    if _worker is None:
+        _worker = MarketDataWorker(
+            max_calls=settings.pykrx_worker_max_calls,
+            max_rss_mb=settings.pykrx_worker_max_rss_mb,
+            timeout=settings.pykrx_call_timeout,
+        )
+    return _worker
+
+
+async def stop_market_data_worker() -> None:
+    global _worker
+    if _worker is not None:
+        await _worker.stop()
+        _worker = None
+
+
+def _executor():
+    from app.broker.throttle import get_executor
+    return get_executor("pykrx", settings.pykrx_max_workers, settings.pykrx_call_timeout)
+
+
+async def call_pykrx(op: str, args: dict | None = None, timeout: float | None = None) -> Any:
+    """pykrx 작업 1건 실행 — 워커 프로세스 또는 (비활성 시) 프로세스 내 전용 스레드 풀."""
+    worker = get_market_data_worker()
+    if worker is not None:
+        return await worker.call(op, args, timeout)
+    from app.broker.free import pykrx_ops
+    return await _executor().run(pykrx_ops.dispatch, op, args or {}, timeout=timeout)
+
+
+async def call_pykrx_batch(
+    items: list[tuple[str, dict]], interval: float = 0.0, timeout: float | None = None,
+) -> list[dict]:
+    """pykrx 작업 여러 건을 한 번에 실행. 항목별 {"ok", "result" | "error", "type"} 목록 반환.
+
+    timeout(마감 시간)이 지나면 남은 항목은 TimeoutError 항목이 된다.
+    """
+    worker = get_market_data_worker()
+    if worker is not None:
+        return await worker.call_batch(items, interval, timeout)
+    from app.broker.free import pykrx_ops
+    batch = [{"op": op, "args": args} for op, args in items]
+    return await _executor().run(
+        pykrx_ops.run_batch, batch, interval, timeout,
+        timeout=timeout + settings.pykrx_call_timeout if timeout else None,
+    )
+
+
+def unwrap(item: dict) -> Any:
+    """call_pykrx_batch 항목 → 결과 값 (실패 항목은 예외)."""
+    if not item.get("ok"):
+        raise _remote_error(item)
+    return item.get("result")
@@ -3,42 +3,35 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
+
+from app.bars import BarSeries
 from app.broker.base import AbstractBroker, BalanceInfo, OrderResult, PriceInfo
-from app.broker.kis.client import KISClient
+from app.candles import aggregate
+from app.broker.kis.client import BALANCE_LANE, get_kis_client
 from app.broker.kis import endpoints as ep
+from app.broker.throttle import gather_limited
 from app.config import settings
+from app.metrics import provider_timer
 
 logger = logging.getLogger(__name__)
 
 
-def _aggregate_candles(candles: list[dict], interval: int) -> list[dict]:
-    """1분봉 목록을 N분봉으로 집계한다 (오름차순 입력 기준)."""
-    if interval <= 1 or not candles:
-        return candles
-    aggregated = []
-    bucket: list[dict] = []
-    for candle in candles:
-        bucket.append(candle)
-        if len(bucket) == interval:
-            aggregated.append({
-                "datetime": bucket[0]["datetime"],
-                "open": bucket[0]["open"],
-                "high": max(c["high"] for c in bucket),
-                "low": min(c["low"] for c in bucket),
-                "close": bucket[-1]["close"],
-                "volume": sum(c["volume"] for c in bucket),
-            })
-            bucket = []
-    return aggregated
+# 분봉 차트 API 한 번에 받는 봉 수, 정규장 전체를 덮는 최대 페이지 수 (390분 / 30)
+_MINUTE_PAGE_SIZE = 30
+_MAX_MINUTE_PAGES = 14
+_SESSION_OPEN_HHMMSS = "090000"
 
 
 class KISBroker(AbstractBroker):
 
     def __init__(self):
-        self._client = KISClient()
+        # 초당 호출 한도(주문 > 잔고 > 시세 차선)는 KISClient가 모든 요청에 적용.
+        # 토큰 발급 횟수를 줄이려고 모든 인스턴스가 같은 클라이언트를 쓴다
+        self._client = get_kis_client()
 
     @property
     def is_mock(self) -> bool:
@@ -60,7 +53,8 @@ class KISBroker(AbstractBroker):
         logger.info("KISBroker connected (mock=%s)", self.is_mock)
 
     async def disconnect(self) -> None:
-        await self._client.close()
+        # 공유 클라이언트는 다른 브로커·실시간 수신기도 쓰므로 앱 종료 시 close_kis_client()로 닫는다
+        logger.info("KISBroker disconnected (mock=%s)", self.is_mock)
 
     # ---- Orders ----
 
@@ -145,7 +139,7 @@ class KISBroker(AbstractBroker):
                 "CTX_AREA_FK100": "",
                 "CTX_AREA_NK100": "",
             }
-            data = await self._client.get(ep.KR_BALANCE_PATH, tr_id, params)
+            data = await self._client.get(ep.KR_BALANCE_PATH, tr_id, params, lane=BALANCE_LANE)
             output2 = data.get("output2", [{}])
             summary = output2[0] if output2 else {}
             return BalanceInfo(
@@ -163,7 +157,8 @@ class KISBroker(AbstractBroker):
 
     async def _get_kr_price(self, symbol: str) -> PriceInfo:
         params = {"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": symbol}
-        data = await self._client.get(ep.KR_PRICE_PATH, ep.KR_PRICE_TR, params)
+        with provider_timer("kis", "price"):
+            data = await self._client.get(ep.KR_PRICE_PATH, ep.KR_PRICE_TR, params)
         output = data.get("output", {})
         return PriceInfo(
             symbol=symbol,
@@ -174,70 +169,112 @@ class KISBroker(AbstractBroker):
             market="KR",
         )
 
-    async def get_daily_prices(self, symbol: str, market: str, days: int = 60) -> list[dict]:
-        return await self._get_kr_daily(symbol)
+    async def get_current_prices(self, symbols: list[str], market: str) -> dict[str, PriceInfo]:
+        """종목별 inquire-price 호출을 초당 한도 내에서 동시 실행 (실패 종목은 제외)."""
+        return await gather_limited(
+            symbols,
+            self._get_kr_price,
+            concurrency=settings.price_refresh_concurrency,
+            timeout=settings.price_refresh_deadline,
+        )
+
+    async def get_daily_prices(
+        self, symbol: str, market: str, days: int = 60, start: str | None = None,
+    ) -> BarSeries:
+        # 일봉 API는 최근 30거래일을 한 번에 주므로 start 구간은 응답을 잘라서 반환
+        bars = await self._get_kr_daily(symbol)
+        return bars.since(start) if start else bars
 
-    async def _get_kr_daily(self, symbol: str) -> list[dict]:
+    async def _get_kr_daily(self, symbol: str) -> BarSeries:
+        """일봉 응답(최신순)을 열 배열로 바로 변환 (BarSeries가 날짜 오름차순 정렬)."""
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": symbol,
             "FID_PERIOD_DIV_CODE": "D",
             "FID_ORG_ADJ_PRC": "0",
         }
-        data = await self._client.get(ep.KR_DAILY_PRICE_PATH, ep.KR_DAILY_PRICE_TR, params)
-        output = data.get("output", [])
-        return [
-            {
-                "date": item.get("stck_bsop_date", ""),
-                "open": float(item.get("stck_oprc", 0)),
-                "high": float(item.get("stck_hgpr", 0)),
-                "low": float(item.get("stck_lwpr", 0)),
-                "close": float(item.get("stck_clpr", 0)),
-                "volume": int(item.get("acml_vol", 0)),
-            }
-            for item in output
-            if item.get("stck_bsop_date")
-        ]
+        with provider_timer("kis", "daily"):
+            data = await self._client.get(ep.KR_DAILY_PRICE_PATH, ep.KR_DAILY_PRICE_TR, params)
+        output = [item for item in data.get("output", []) if item.get("stck_bsop_date")]
+
+        def col(field: str) -> np.ndarray:
+            return np.fromiter((item.get(field) or 0 for item in output), dtype=np.float64, count=len(output))
+
+        return BarSeries.from_columns(
+            [item["stck_bsop_date"] for item in output],
+            col("stck_oprc"), col("stck_hgpr"), col("stck_lwpr"), col("stck_clpr"), col("acml_vol"),
+        )
 
     # ---- Intraday candles ----
 
     async def get_intraday_candles(
         self, symbol: str, market: str, interval: int = 1
     ) -> list[dict]:
-        """KIS API로 분봉 조회 후 interval(분)에 맞게 집계."""
-        raw = await self._get_kr_minute_candles(symbol)
-        if interval == 1 or not raw:
-            return raw
-        return _aggregate_candles(raw, interval)
-
-    async def _get_kr_minute_candles(self, symbol: str) -> list[dict]:
-        """KIS 분봉 차트 API 호출 (1분봉 기준, 당일 데이터)."""
-        now_str = datetime.now().strftime("%H%M%S")
+        """KIS API로 당일 1분봉 조회 후 interval(분) 벽시계 구간으로 집계."""
+        try:
+            raw = await self.get_minute_candles(symbol, market)
+        except Exception as e:
+            logger.warning("분봉 조회 실패 %s: %s", symbol, e)
+            return []
+        return aggregate(raw, interval)
+
+    async def get_minute_candles(
+        self, symbol: str, market: str, since: str | None = None
+    ) -> list[dict]:
+        """현재 시각부터 과거 방향으로 30분씩 페이지 조회, since 이전 구간에 닿으면 중단.
+
+        페이지 조회가 실패하면 중간이 빈 부분 결과 대신 예외를 그대로 올린다
+        (호출자가 저장·증분 위치를 진전시키지 않고 다음 주기에 같은 구간을 다시 받도록).
+        """
+        collected: dict[str, dict] = {}
+        hour = datetime.now().strftime("%H%M%S")
+        for _ in range(_MAX_MINUTE_PAGES):
+            page = await self._get_kr_minute_candles(symbol, hour)
+            if not page:
+                break
+            new = [c for c in page if c["datetime"] not in collected]
+            for c in new:
+                collected[c["datetime"]] = c
+            earliest = page[0]["datetime"]
+            if (
+                not new
+                or len(page) < _MINUTE_PAGE_SIZE
+                or (since is not None and earliest <= since)
+                or earliest[11:].replace(":", "") <= _SESSION_OPEN_HHMMSS
+            ):
+                break
+            # 다음 페이지: 이번 페이지 첫 봉 1분 전까지
+            prev = datetime.strptime(earliest, "%Y-%m-%d %H:%M:%S") - timedelta(minutes=1)
+            hour = prev.strftime("%H%M%S")
+        candles = [collected[k] for k in sorted(collected)]
+        if since is not None:
+            candles = [c for c in candles if c["datetime"] >= since]
+        return candles
+
+    async def _get_kr_minute_candles(self, symbol: str, hour: str) -> list[dict]:
+        """KIS 분봉 차트 API 호출 — hour(HHMMSS) 이전 최대 30개 1분봉 (오름차순)."""
         params = {
             "FID_ETC_CLS_CODE": "",
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": symbol,
-            "FID_INPUT_HOUR_1": now_str,
+            "FID_INPUT_HOUR_1": hour,
             "FID_PW_DATA_INCU_YN": "Y",
         }
-        try:
+        with provider_timer("kis", "minute"):
             data = await self._client.get(ep.KR_MINUTE_CHART_PATH, ep.KR_MINUTE_CHART_TR, params)
-            output = data.get("output2", [])
-            result = []
-            for item in output:
-                date = item.get("stck_bsop_date", "")
-                time = item.get("stck_cntg_hour", "")
-                if not date or not time:
-                    continue
-                result.append({
-                    "datetime": f"{date[:4]}-{date[4:6]}-{date[6:]} {time[:2]}:{time[2:4]}:{time[4:]}",
-                    "open": float(item.get("stck_oprc", 0)),
-                    "high": float(item.get("stck_hgpr", 0)),
-                    "low": float(item.get("stck_lwpr", 0)),
-                    "close": float(item.get("stck_prpr", 0)),
-                    "volume": int(item.get("cntg_vol", 0)),
-                })
-            return list(reversed(result))  # 오름차순 정렬
-        except Exception as e:
-            logger.warning("분봉 조회 실패 %s: %s", symbol, e)
-            return []
+        output = data.get("output2", [])
+        result = []
+        for item in output:
+            date = item.get("stck_bsop_date", "")
+            time = item.get("stck_cntg_hour", "")
+            if not date or not time:
+                continue
+            result.append({
+                "datetime": f"{date[:4]}-{date[4:6]}-{date[6:]} {time[:2]}:{time[2:4]}:{time[4:]}",
+                "open": float(item.get("stck_oprc", 0)),
+                "high": float(item.get("stck_hgpr", 0)),
+                "low": float(item.get("stck_lwpr", 0)),
+                "close": float(item.get("stck_prpr", 0)),
+                "volume": int(item.get("cntg_vol", 0)),
+            })
+        return list(reversed(result))  # 오름차순 정렬
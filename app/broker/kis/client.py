@@ -12,11 +12,18 @@ from typing import Any
 import httpx
 
 from app.config import settings
-from app.broker.kis.endpoints import HASHKEY_PATH, TOKEN_PATH
+from app.broker.kis.endpoints import APPROVAL_PATH, HASHKEY_PATH, TOKEN_PATH
 from app.broker.kis.models import KISToken
+from app.broker.throttle import get_priority_limiter
 
 logger = logging.getLogger(__name__)
 
+# 초당 호출 한도 차선 (우선순위 순): 주문·취소 → 잔고 → 시세·차트
+ORDER_LANE = "order"
+BALANCE_LANE = "balance"
+QUOTE_LANE = "quote"
+LANES = (ORDER_LANE, BALANCE_LANE, QUOTE_LANE)
+
 
 class KISClient:
     """Low-level HTTP client for KIS OpenAPI."""
@@ -24,13 +31,25 @@ class KISClient:
     def __init__(self):
         self._client: httpx.AsyncClient | None = None
         self._token = KISToken()
+        self._approval_key = ""
         self._is_mock = "vts" in settings.kis_base_url.lower()
+        # 초당 호출 한도는 같은 앱 키를 쓰는 모든 클라이언트가 공유 (토큰·접속키 발급은 별도 한도라 제외)
+        rate = settings.kis_rate_limit_mock if self._is_mock else settings.kis_rate_limit_real
+        self._limiter = get_priority_limiter("kis", rate, LANES)
 
     @property
     def is_mock(self) -> bool:
         return self._is_mock
 
+    @property
+    def token_expiring_soon(self) -> bool:
+        """발급받은 토큰이 만료됐거나 1시간 안에 만료됨 (선제 갱신 대상). 아직 발급 전이면 False."""
+        return bool(self._token.access_token) and self._token.is_expiring_soon
+
     async def open(self):
+        """HTTP 연결 풀 생성 (이미 열려 있으면 그대로 사용 — 여러 브로커가 공유)."""
+        if self._client is not None:
+            return
         self._client = httpx.AsyncClient(
             base_url=settings.kis_base_url,
             timeout=30.0,
@@ -69,9 +88,31 @@ class KISClient:
         self._token = KISToken()  # 만료 상태로 초기화
         await self._ensure_token()
 
-    async def _get_hashkey(self, body: dict) -> str:
+    async def get_approval_key(self, refresh: bool = False) -> str:
+        """실시간(WebSocket) 접속키 발급 — 프로세스 내에서 재사용하고 refresh=True일 때만 재발급."""
+        if self._approval_key and not refresh:
+            return self._approval_key
         if not self._client:
             await self.open()
+        resp = await self._client.post(
+            APPROVAL_PATH,
+            json={
+                "grant_type": "client_credentials",
+                "appkey": settings.kis_app_key,
+                "secretkey": settings.kis_app_secret,
+            },
+        )
+        if not resp.is_success:
+            logger.error("실시간 접속키 발급 실패 [%s]: %s", resp.status_code, resp.text)
+        resp.raise_for_status()
+        self._approval_key = resp.json()["approval_key"]
+        logger.info("KIS 실시간 접속키 발급 완료 (mock=%s)", self._is_mock)
+        return self._approval_key
+
+    async def _get_hashkey(self, body: dict, lane: str) -> str:
+        if not self._client:
+            await self.open()
+        await self._limiter.acquire(lane)
         resp = await self._client.post(
             HASHKEY_PATH,
             json=body,
@@ -96,17 +137,25 @@ class KISClient:
             "custtype": "P",  # 개인투자자 구분 (KIS API 필수 헤더)
         }
 
-    async def get(self, path: str, tr_id: str, params: dict[str, str] | None = None) -> dict[str, Any]:
+    async def get(
+        self,
+        path: str,
+        tr_id: str,
+        params: dict[str, str] | None = None,
+        lane: str = QUOTE_LANE,
+    ) -> dict[str, Any]:
         await self._ensure_token()
         if not self._client:
             await self.open()
         headers = self._base_headers(tr_id)
+        await self._limiter.acquire(lane)
         resp = await self._client.get(path, headers=headers, params=params)
         if resp.status_code == 401:
             # 세션 만료로 인한 401 — 토큰 강제 갱신 후 1회 재시도
             logger.warning("KIS 401 응답 — 토큰 강제 갱신 후 재시도: %s", path)
             await self.force_refresh_token()
             headers = self._base_headers(tr_id)
+            await self._limiter.acquire(lane)
             resp = await self._client.get(path, headers=headers, params=params)
         if not resp.is_success:
             logger.error("KIS GET 오류 [%s] %s: %s", resp.status_code, path, resp.text)
@@ -119,6 +168,7 @@ class KISClient:
         tr_id: str,
         body: dict[str, Any],
         use_hashkey: bool = True,
+        lane: str = ORDER_LANE,
         _retry: int = 2,
     ) -> dict[str, Any]:
         await self._ensure_token()
@@ -126,7 +176,8 @@ class KISClient:
             await self.open()
         headers = self._base_headers(tr_id)
         if use_hashkey:
-            headers["hashkey"] = await self._get_hashkey(body)
+            headers["hashkey"] = await self._get_hashkey(body, lane)
+        await self._limiter.acquire(lane)
         resp = await self._client.post(path, headers=headers, json=body)
 
         if resp.status_code == 401:
@@ -135,7 +186,8 @@ class KISClient:
             await self.force_refresh_token()
             headers = self._base_headers(tr_id)
             if use_hashkey:
-                headers["hashkey"] = await self._get_hashkey(body)
+                headers["hashkey"] = await self._get_hashkey(body, lane)
+            await self._limiter.acquire(lane)
             resp = await self._client.post(path, headers=headers, json=body)
 
         # 5xx 서버 오류는 일시적 장애일 수 있으므로 최대 _retry회 재시도
@@ -145,7 +197,7 @@ class KISClient:
                 resp.status_code, _retry, path, tr_id,
             )
             await asyncio.sleep(1)
-            return await self.post(path, tr_id, body, use_hashkey=use_hashkey, _retry=_retry - 1)
+            return await self.post(path, tr_id, body, use_hashkey=use_hashkey, lane=lane, _retry=_retry - 1)
 
         if not resp.is_success:
             logger.error(
@@ -154,3 +206,22 @@ class KISClient:
             )
         resp.raise_for_status()
         return resp.json()
+
+
+_kis_client: KISClient | None = None
+
+
+def get_kis_client() -> KISClient:
+    """프로세스 전역 KISClient (토큰·실시간 접속키를 브로커와 실시간 수신기가 공유)."""
+    global _kis_client
+    if _kis_client is None:
+        _kis_client = KISClient()
+    return _kis_client
+
+
+async def close_kis_client() -> None:
+    """공유 KISClient의 연결 풀 종료 (앱 종료 시 1회)."""
+    global _kis_client
+    if _kis_client is not None:
+        await _kis_client.close()
+        _kis_client = None
@@ -3,6 +3,7 @@
 # OAuth
 TOKEN_PATH = "/oauth2/tokenP"
 HASHKEY_PATH = "/uapi/hashkey"
+APPROVAL_PATH = "/oauth2/Approval"  # 실시간(WebSocket) 접속키
 
 # --- 국내주식 ---
 KR_ORDER_PATH = "/uapi/domestic-stock/v1/trading/order-cash"
@@ -31,3 +32,9 @@ KR_ORDERS_TR_MOCK = "VTTC8001R"
 # --- 분봉 차트 ---
 KR_MINUTE_CHART_PATH = "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice"
 KR_MINUTE_CHART_TR = "FHKST03010200"
+
+# --- 실시간 (WebSocket) ---
+WS_URL_REAL = "ws://ops.koreainvestment.com:21000"
+WS_URL_MOCK = "ws://ops.koreainvestment.com:31000"
+WS_PATH = "/tryitout/H0STCNT0"
+KR_REALTIME_TRADE_TR = "H0STCNT0"  # 국내주식 실시간체결가
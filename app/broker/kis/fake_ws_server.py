@@ -0,0 +1,172 @@
+"""오프라인 개발·테스트용 KIS 실시간(H0STCNT0) WebSocket 대역 서버.
+
+실제 KIS 서버와 같은 형식으로 등록/해제 응답, PINGPONG, 체결가 프레임을 보낸다.
+
+    python -m app.broker.kis.fake_ws_server --port 31000
+
+으로 실행하면 등록된 종목마다 무작위 체결가를 1초 간격으로 보낸다
+(KIS_WS_ENABLED=true, KIS_WS_URL=ws://127.0.0.1:31000 과 함께 사용).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+from datetime import datetime
+
+from app.broker.kis.endpoints import KR_REALTIME_TRADE_TR
+
+_TRADE_FIELDS = 46
+
+
+def build_trade_frame(ticks: list[dict]) -> str:
+    """체결가 레코드 목록을 H0STCNT0 데이터 프레임으로 직렬화.
+
+    tick 키: symbol, price, change, change_pct, volume, open, high, low (누락 시 0)
+    """
+    records = []
+    now = datetime.now().strftime("%H%M%S")
+    for t in ticks:
+        fields = ["0"] * _TRADE_FIELDS
+        price = t["price"]
+        change = t.get("change", 0)
+        fields[0] = t["symbol"]
+        fields[1] = now
+        fields[2] = f"{price:g}"
+        fields[3] = "2" if change > 0 else ("5" if change < 0 else "3")  # 상승/하락/보합
+        fields[4] = f"{change:g}"
+        fields[5] = f"{t.get('change_pct', 0):.2f}"
+        fields[7] = f"{t.get('open', price):g}"
+        fields[8] = f"{t.get('high', price):g}"
+        fields[9] = f"{t.get('low', price):g}"
+        fields[13] = str(t.get("volume", 0))
+        records.append("^".join(fields))
+    return f"0|{KR_REALTIME_TRADE_TR}|{len(records):03d}|" + "^".join(records)
+
+
+class FakeKISWebSocketServer:
+    """등록 종목을 연결별로 추적하고 push_tick()으로 체결가를 보낸다.
+
+    rejected_keys에 든 접속키로 온 등록 요청은 KIS처럼 오류 응답으로 거부한다.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, rejected_keys: set[str] | None = None):
+        self.host = host
+        self.port = port
+        self.rejected_keys = rejected_keys or set()
+        self._server = None
+        # {연결: 등록 종목 집합}
+        self.connections: dict[object, set[str]] = {}
+        self.control_messages: list[dict] = []
+        self.pongs = 0
+        self.subscribed = asyncio.Event()
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        from websockets.asyncio.server import serve
+
+        self._server = await serve(self._handler, self.host, self.port, ping_interval=None)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.url
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def symbols(self) -> set[str]:
+        """전체 연결의 등록 종목 합집합."""
+        out: set[str] = set()
+        for subs in self.connections.values():
+            out |= subs
+        return out
+
+    async def _handler(self, ws) -> None:
+        self.connections[ws] = set()
+        try:
+            async for message in ws:
+                data = json.loads(message)
+                header = data.get("header", {})
+                if header.get("tr_id") == "PINGPONG":
+                    self.pongs += 1
+                    continue
+                self.control_messages.append(data)
+                tr = data["body"]["input"]
+                symbol = tr["tr_key"]
+                if header.get("approval_key") in self.rejected_keys:
+                    await ws.send(json.dumps({
+                        "header": {"tr_id": tr["tr_id"], "tr_key": symbol, "encrypt": "N"},
+                        "body": {"rt_cd": "1", "msg_cd": "OPSP0011", "msg1": "invalid approval : NOT FOUND"},
+                    }))
+                    continue
+                if header.get("tr_type") == "1":
+                    self.connections[ws].add(symbol)
+                    msg = "SUBSCRIBE SUCCESS"
+                else:
+                    self.connections[ws].discard(symbol)
+                    msg = "UNSUBSCRIBE SUCCESS"
+                await ws.send(json.dumps({
+                    "header": {"tr_id": tr["tr_id"], "tr_key": symbol, "encrypt": "N"},
+                    "body": {"rt_cd": "0", "msg_cd": "OPSP0000", "msg1": msg},
+                }))
+                self.subscribed.set()
+        except Exception:
+            pass
+        finally:
+            self.connections.pop(ws, None)
+
+    async def push_tick(self, **tick) -> int:
+        """등록한 연결에 체결가 1건 전송. 전송한 연결 수 반환."""
+        frame = build_trade_frame([tick])
+        sent = 0
+        for ws, subs in list(self.connections.items()):
+            if tick["symbol"] in subs:
+                await ws.send(frame)
+                sent += 1
+        return sent
+
+    async def send_ping(self) -> None:
+        ping = json.dumps({"header": {"tr_id": "PINGPONG", "datetime": datetime.now().strftime("%Y%m%d%H%M%S")}})
+        for ws in list(self.connections):
+            await ws.send(ping)
+
+    async def drop_connections(self) -> None:
+        """모든 연결 강제 종료 (재접속 테스트용)."""
+        for ws in list(self.connections):
+            await ws.close()
+
+
+async def _serve_forever(host: str, port: int, interval: float) -> None:
+    server = FakeKISWebSocketServer(host, port)
+    await server.start()
+    print(f"fake KIS WebSocket server: {server.url}")
+    prices: dict[str, float] = {}
+    while True:
+        await asyncio.sleep(interval)
+        for symbol in server.symbols():
+            base = prices.setdefault(symbol, 50_000.0)
+            price = max(100.0, round(base * (1 + random.uniform(-0.002, 0.002)), -1))
+            prices[symbol] = price
+            await server.push_tick(
+                symbol=symbol, price=price, change=price - 50_000.0,
+                change_pct=(price / 50_000.0 - 1) * 100, volume=random.randint(1, 10_000),
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="KIS 실시간 시세 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=31000)
+    parser.add_argument("--interval", type=float, default=1.0, help="체결가 전송 간격 (초)")
+    args = parser.parse_args()
+    asyncio.run(_serve_forever(args.host, args.port, args.interval))
+
+
+if __name__ == "__main__":
+    main()
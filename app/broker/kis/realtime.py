@@ -0,0 +1,304 @@
+"""KIS 실시간 체결가(H0STCNT0) WebSocket 수신 클라이언트.
+
+REST 현재가(inquire-price) 폴링 대신 체결 이벤트를 받아 시세 캐시에 바로 반영한다.
+
+- 접속키: /oauth2/Approval로 발급한 approval_key (KISClient가 재사용)
+- 구독 관리: set_symbols()로 원하는 종목 집합을 넘기면 차이만 등록/해제 (세션당 최대 41종목)
+- 프레임: "암호화여부|TR_ID|건수|필드^필드^..." — 건수만큼의 레코드가 '^'로 이어진 한 줄
+- PINGPONG: 서버가 보낸 JSON을 그대로 돌려보내 연결 유지
+- 끊기면 지수 백오프(+지터)로 재접속 후 전체 종목 재등록.
+  접속·핸드셰이크 실패나 등록 거부 뒤에는 접속키를 재발급받아 재접속 (만료·폐기된 키 복구)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+from collections.abc import Awaitable, Callable, Iterable
+
+from app.broker.base import PriceInfo
+from app.broker.kis.endpoints import KR_REALTIME_TRADE_TR
+
+logger = logging.getLogger(__name__)
+
+# H0STCNT0 레코드 필드 수와 사용하는 필드 위치
+_TRADE_FIELDS = 46
+_F_SYMBOL = 0  # 유가증권 단축 종목코드
+_F_PRICE = 2  # 주식 현재가
+_F_CHANGE = 4  # 전일 대비 (부호 포함)
+_F_CHANGE_PCT = 5  # 전일 대비율
+_F_OPEN = 7
+_F_HIGH = 8
+_F_LOW = 9
+_F_ACC_VOLUME = 13  # 누적 거래량
+
+QuoteHandler = Callable[[PriceInfo, dict], None]
+# 접속키 제공자: refresh=True면 캐시된 키 대신 새로 발급
+ApprovalKeyProvider = Callable[..., Awaitable[str]]
+
+
+def parse_trade_frame(frame: str) -> list[tuple[PriceInfo, dict]]:
+    """H0STCNT0 데이터 프레임을 (PriceInfo, ohlcv) 목록으로 변환.
+
+    필요한 필드만 인덱스로 읽어 레코드별 중간 리스트를 만들지 않는다.
+    """
+    flag, tr_id, count, payload = frame.split("|", 3)
+    if tr_id != KR_REALTIME_TRADE_TR or flag != "0":
+        return []  # 체결가는 평문 — 암호화 프레임(체결통보 등)은 대상 아님
+    n = int(count)
+    fields = payload.split("^")
+    stride = len(fields) // n if n else _TRADE_FIELDS
+    out: list[tuple[PriceInfo, dict]] = []
+    for base in range(0, n * stride, stride):
+        info = PriceInfo(
+            symbol=fields[base + _F_SYMBOL],
+            price=float(fields[base + _F_PRICE]),
+            change=float(fields[base + _F_CHANGE]),
+            change_pct=float(fields[base + _F_CHANGE_PCT]),
+            volume=int(fields[base + _F_ACC_VOLUME]),
+            market="KR",
+        )
+        ohlcv = {
+            "open": float(fields[base + _F_OPEN]),
+            "high": float(fields[base + _F_HIGH]),
+            "low": float(fields[base + _F_LOW]),
+        }
+        out.append((info, ohlcv))
+    return out
+
+
+def _control_message(approval_key: str, tr_type: str, symbol: str) -> str:
+    """등록(tr_type=1)/해제(2) 요청 JSON."""
+    return json.dumps({
+        "header": {
+            "approval_key": approval_key,
+            "custtype": "P",
+            "tr_type": tr_type,
+            "content-type": "utf-8",
+        },
+        "body": {"input": {"tr_id": KR_REALTIME_TRADE_TR, "tr_key": symbol}},
+    })
+
+
+class KISRealtimeClient:
+    """H0STCNT0 구독 세션 하나를 유지하는 백그라운드 수신기."""
+
+    def __init__(
+        self,
+        url: str,
+        approval_key: ApprovalKeyProvider,
+        on_quote: QuoteHandler,
+        max_symbols: int = 41,
+        backoff_initial: float = 1.0,
+        backoff_max: float = 60.0,
+    ):
+        self.url = url
+        self._approval_key = approval_key
+        self._on_quote = on_quote
+        self.max_symbols = max_symbols
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+
+        self._wanted: set[str] = set()  # 구독해야 할 종목
+        self._subscribed: set[str] = set()  # 현재 연결에 등록된 종목
+        self._ws = None
+        self._key = ""
+        self._refresh_key = False  # 다음 접속 시 접속키 재발급
+        self._backoff = backoff_initial
+        self._task: asyncio.Task | None = None
+        self._send_lock = asyncio.Lock()
+        self.connected = asyncio.Event()
+
+        self.stats_counters: dict[str, int] = {
+            "connects": 0,
+            "disconnects": 0,
+            "frames": 0,
+            "ticks": 0,
+            "pings": 0,
+            "parse_errors": 0,
+            "rejects": 0,
+            "key_refreshes": 0,
+        }
+
+    # ── 수명 주기 ────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.connected.clear()
+
+    # ── 구독 관리 ────────────────────────────────────────────
+
+    async def set_symbols(self, symbols: Iterable[str]) -> None:
+        """구독 종목 집합 갱신. 연결 중이면 차이만 등록/해제, 아니면 재접속 시 반영."""
+        wanted = list(dict.fromkeys(symbols))
+        if len(wanted) > self.max_symbols:
+            logger.warning(
+                "실시간 구독 한도 초과: %d종목 중 %d종목만 등록", len(wanted), self.max_symbols,
+            )
+            wanted = wanted[: self.max_symbols]
+        self._wanted = set(wanted)
+        if self._ws is not None:
+            await self._sync_subscriptions()
+
+    async def _sync_subscriptions(self) -> None:
+        async with self._send_lock:
+            ws = self._ws
+            if ws is None:
+                return
+            for symbol in sorted(self._subscribed - self._wanted):
+                await ws.send(_control_message(self._key, "2", symbol))
+                self._subscribed.discard(symbol)
+            for symbol in sorted(self._wanted - self._subscribed):
+                await ws.send(_control_message(self._key, "1", symbol))
+                self._subscribed.add(symbol)
+
+    # ── 수신 루프 ────────────────────────────────────────────
+
+    async def _run(self) -> None:
+        from websockets.asyncio.client import connect
+
+        self._backoff = self.backoff_initial
+        while True:
+            established = False
+            try:
+                if self._refresh_key:
+                    self.stats_counters["key_refreshes"] += 1
+                    self._key = await self._approval_key(refresh=True)
+                else:
+                    self._key = await self._approval_key()
+                self._refresh_key = False
+                async with connect(self.url, ping_interval=None) as ws:
+                    self._ws = ws
+                    self._subscribed = set()
+                    self.stats_counters["connects"] += 1
+                    established = True
+                    await self._sync_subscriptions()
+                    self.connected.set()
+                    logger.info("KIS 실시간 시세 연결 (%d종목)", len(self._subscribed))
+                    async for message in ws:
+                        await self._handle(ws, message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not established:
+                    self._refresh_key = True  # 접속키 발급·접속·핸드셰이크 실패
+                logger.warning("KIS 실시간 시세 연결 끊김: %s (%.1fs 후 재접속)", e, self._backoff)
+            finally:
+                if self._ws is not None:
+                    self.stats_counters["disconnects"] += 1
+                self._ws = None
+                self._subscribed = set()
+                self.connected.clear()
+            await asyncio.sleep(self._backoff * random.uniform(0.8, 1.2))
+            # 등록 성공·체결 수신 시 초기값으로 되돌린다 (_handle)
+            self._backoff = min(self._backoff * 2, self.backoff_max)
+
+    async def _handle(self, ws, message: str | bytes) -> None:
+        if isinstance(message, bytes):
+            message = message.decode("utf-8")
+        self.stats_counters["frames"] += 1
+        first = message[:1]
+        if first in ("0", "1"):
+            try:
+                ticks = parse_trade_frame(message)
+            except (ValueError, IndexError) as e:
+                self.stats_counters["parse_errors"] += 1
+                logger.debug("실시간 프레임 파싱 실패: %s", e)
+                return
+            self._backoff = self.backoff_initial
+            for info, ohlcv in ticks:
+                self.stats_counters["ticks"] += 1
+                self._on_quote(info, ohlcv)
+            return
+
+        # JSON 제어 메시지: PINGPONG 또는 등록/해제 응답
+        try:
+            data = json.loads(message)
+        except ValueError:
+            self.stats_counters["parse_errors"] += 1
+            return
+        header = data.get("header", {})
+        if header.get("tr_id") == "PINGPONG":
+            self.stats_counters["pings"] += 1
+            await ws.send(message)
+            return
+        body = data.get("body", {})
+        if body.get("rt_cd") not in (None, "0"):
+            # 만료·폐기된 접속키일 수 있으므로 키를 재발급받아 재접속 (백오프는 유지)
+            self.stats_counters["rejects"] += 1
+            self._refresh_key = True
+            logger.warning(
+                "KIS 실시간 등록 오류 %s: %s — 접속키 재발급 후 재접속",
+                header.get("tr_key"), body.get("msg1"),
+            )
+            await ws.close()
+        elif body.get("rt_cd") == "0":
+            self._backoff = self.backoff_initial
+
+    def stats(self) -> dict:
+        return {
+            **self.stats_counters,
+            "connected": self.connected.is_set(),
+            "subscribed": len(self._subscribed),
+            "wanted": len(self._wanted),
+        }
+
+
+# ── 프로세스 전역 수신기 ──────────────────────────────────────
+
+_realtime: KISRealtimeClient | None = None
+
+
+def get_realtime_client() -> KISRealtimeClient | None:
+    return _realtime
+
+
+async def start_realtime_feed() -> KISRealtimeClient | None:
+    """설정이 켜져 있으면 실시간 수신기를 시작 (실매매 브로커와 같은 KISClient의 접속키 사용).
+
+    시세 재생 모드에서는 기록 파일이 시세를 제공하므로 시작하지 않는다.
+    """
+    global _realtime
+    from app.config import settings
+    from app.schemas.common import MarketDataMode
+
+    if not settings.kis_ws_enabled or not settings.kis_app_key:
+        return None
+    if settings.market_data_mode == MarketDataMode.REPLAY:
+        logger.info("시세 재생 모드: KIS 실시간 시세 수신 비활성")
+        return None
+    if _realtime is not None:
+        return _realtime
+
+    from app.broker.kis.client import get_kis_client
+    from app.broker.kis.endpoints import WS_PATH, WS_URL_MOCK, WS_URL_REAL
+    from app.services.market_service import MarketService
+
+    client = get_kis_client()
+    url = settings.kis_ws_url or (
+        (WS_URL_MOCK if client.is_mock else WS_URL_REAL) + WS_PATH
+    )
+    _realtime = KISRealtimeClient(
+        url,
+        approval_key=client.get_approval_key,
+        on_quote=MarketService.ingest,
+        max_symbols=settings.kis_ws_max_symbols,
+    )
+    _realtime.start()
+    return _realtime
+
+
+async def stop_realtime_feed() -> None:
+    global _realtime
+    if _realtime is not None:
+        await _realtime.stop()
+        _realtime = None
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from app.bars import BarSeries
 from app.broker.base import AbstractBroker, BalanceInfo, OrderResult, PriceInfo
 from app.broker.paper.engine import PaperExecutionEngine
 from app.config import settings
@@ -15,9 +16,9 @@ logger = logging.getLogger(__name__)
 class PaperBroker(AbstractBroker):
     """Paper trading broker backed by SQLite for balances and real market data for prices."""
 
-    def __init__(self):
+    def __init__(self, price_provider=None):
         self._engine = PaperExecutionEngine()
-        self._price_provider = None  # Lazy init for price data
+        self._price_provider = price_provider  # Lazy init for price data unless given (replay)
 
     async def _get_price_provider(self):
         """Get price provider (lazy init). Uses KIS if configured, else FreeMarketProvider."""
@@ -106,13 +107,23 @@ class PaperBroker(AbstractBroker):
             logger.warning("Price fetch failed for %s: %s", symbol, e)
             return PriceInfo(symbol=symbol, price=0.0, market=market)
 
-    async def get_daily_prices(self, symbol: str, market: str, days: int = 60) -> list[dict]:
+    async def get_current_prices(self, symbols: list[str], market: str) -> dict[str, PriceInfo]:
         provider = await self._get_price_provider()
         try:
-            return await provider.get_daily_prices(symbol, market, days)
+            return await provider.get_current_prices(symbols, market)
+        except Exception as e:
+            logger.warning("Batch price fetch failed (%d symbols): %s", len(symbols), e)
+            return {}
+
+    async def get_daily_prices(
+        self, symbol: str, market: str, days: int = 60, start: str | None = None,
+    ) -> BarSeries:
+        provider = await self._get_price_provider()
+        try:
+            return await provider.get_daily_prices(symbol, market, days, start=start)
         except Exception as e:
             logger.warning("Daily prices failed for %s: %s", symbol, e)
-            return []
+            return BarSeries.empty()
 
     async def get_intraday_candles(
         self, symbol: str, market: str, interval: int = 1
@@ -123,3 +134,10 @@ class PaperBroker(AbstractBroker):
         except Exception as e:
             logger.warning("Intraday candles failed for %s: %s", symbol, e)
             return []
+
+    async def get_minute_candles(
+        self, symbol: str, market: str, since: str | None = None
+    ) -> list[dict]:
+        # 실패를 빈 목록으로 바꾸면 분봉 저장소가 빈 구간을 남긴 채 진행하므로 그대로 올린다
+        provider = await self._get_price_provider()
+        return await provider.get_minute_candles(symbol, market, since)
@@ -0,0 +1,191 @@
+"""시세 기록 파일 — gzip JSON Lines, 한 줄에 제공자 응답 하나.
+
+    {"v": 1, "started_at": "2026-10-17T09:00:00+09:00"}
+    {"t": 12.3, "op": "price", "k": ["005930", "KR"], "ms": 84.1, "d": [71000.0, 500.0, 0.71, 1234567]}
+    {"t": 12.9, "op": "daily", "k": ["005930", "KR"], "ms": 120.0, "d": {"date": [...], "open": [...], ...}}
+    {"t": 13.0, "op": "candles", "k": ["005930", "KR", 1], "ms": 50.0, "d": [["2026-10-17 09:00:00", o, h, l, c, v], ...]}
+    {"t": 14.0, "op": "price", "k": ["000660", "KR"], "ms": 15000.0, "e": "TimeoutError: ..."}
+
+t는 기록 시작 후 경과 초(monotonic), ms는 제공자 응답 시간, e는 실패 응답.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import pathlib
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, TextIO
+
+from app.broker.base import PriceInfo
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+PRICE = "price"
+DAILY = "daily"
+CANDLES = "candles"
+
+_CANDLE_FIELDS = ("datetime", "open", "high", "low", "close", "volume")
+
+
+# ── 응답 ↔ JSON 값 ───────────────────────────────────────────
+
+def encode_price(info: PriceInfo) -> list:
+    return [info.price, info.change, info.change_pct, info.volume]
+
+
+def decode_price(symbol: str, market: str, data: list) -> PriceInfo:
+    price, change, change_pct, volume = data
+    return PriceInfo(
+        symbol=symbol, price=price, change=change, change_pct=change_pct,
+        volume=volume, market=market,
+    )
+
+
+def encode_daily(bars) -> dict:
+    return {
+        "date": bars.dates(),
+        "open": bars.open.tolist(),
+        "high": bars.high.tolist(),
+        "low": bars.low.tolist(),
+        "close": bars.close.tolist(),
+        "volume": bars.volume.tolist(),
+    }
+
+
+def decode_daily(data: dict):
+    from app.bars import BarSeries
+    return BarSeries.from_columns(**data)
+
+
+def encode_candles(candles: list[dict]) -> list[list]:
+    return [[c[f] for f in _CANDLE_FIELDS] for c in candles]
+
+
+def decode_candles(data: list[list]) -> list[dict]:
+    return [dict(zip(_CANDLE_FIELDS, row)) for row in data]
+
+
+# ── 기록 ─────────────────────────────────────────────────────
+
+class MarketDataRecorder:
+    """응답 기록기. 첫 기록 시 파일을 새로 만든다 (기존 파일은 덮어씀).
+
+    기록은 gzip 버퍼에 쌓이고 close() 시 디스크에 반영된다.
+    """
+
+    def __init__(self, path: str | pathlib.Path):
+        self.path = pathlib.Path(path)
+        self.records = 0
+        self._file: TextIO | None = None
+        self._t0 = time.monotonic()
+
+    def _open(self) -> TextIO:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        f = gzip.open(self.path, "wt", encoding="utf-8")
+        f.write(_dumps({"v": FORMAT_VERSION, "started_at": datetime.now(timezone.utc).isoformat()}))
+        logger.info("시세 기록 시작: %s", self.path)
+        return f
+
+    def write(
+        self,
+        op: str,
+        key: tuple,
+        latency: float,
+        data: Any = None,
+        error: str | None = None,
+    ) -> None:
+        """응답 1건 기록 (latency: 초)."""
+        if self._file is None:
+            self._file = self._open()
+        record = {
+            "t": round(time.monotonic() - self._t0, 3),
+            "op": op,
+            "k": list(key),
+            "ms": round(latency * 1000, 1),
+        }
+        if error is not None:
+            record["e"] = error
+        else:
+            record["d"] = data
+        self._file.write(_dumps(record))
+        self.records += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            logger.info("시세 기록 종료: %s (%d건)", self.path, self.records)
+
+
+def _dumps(obj: dict) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+_recorder: MarketDataRecorder | None = None
+
+
+def get_recorder() -> MarketDataRecorder:
+    """프로세스 전역 기록기 (settings.market_data_log)."""
+    global _recorder
+    if _recorder is None:
+        from app.config import settings
+        _recorder = MarketDataRecorder(settings.market_data_log)
+    return _recorder
+
+
+def close_recorder() -> None:
+    global _recorder
+    if _recorder is not None:
+        _recorder.close()
+        _recorder = None
+
+
+# ── 재생용 색인 ──────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class Entry:
+    t: float  # 기록 시작 후 경과 초
+    ms: float  # 기록된 응답 시간
+    data: Any = None
+    error: str | None = None
+
+
+class Recording:
+    """기록 파일 색인: {(op, key): [Entry, ...]} (t 오름차순)."""
+
+    def __init__(self, entries: dict[tuple[str, tuple], list[Entry]]):
+        self._entries = entries
+        self.duration = max((e[-1].t for e in entries.values() if e), default=0.0)
+
+    @classmethod
+    def load(cls, path: str | pathlib.Path) -> Recording:
+        entries: dict[tuple[str, tuple], list[Entry]] = defaultdict(list)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                if "op" not in record:
+                    continue  # 헤더
+                entries[(record["op"], tuple(record["k"]))].append(
+                    Entry(record["t"], record["ms"], record.get("d"), record.get("e"))
+                )
+        for items in entries.values():
+            items.sort(key=lambda e: e.t)
+        recording = cls(dict(entries))
+        logger.info("시세 기록 적재: %s (%d개 키, %.0fs)", path, len(recording), recording.duration)
+        return recording
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def entries(self, op: str, key: tuple) -> list[Entry]:
+        return self._entries.get((op, key), [])
+
+    def keys(self, op: str) -> list[tuple]:
+        return [key for o, key in self._entries if o == op]
@@ -0,0 +1,174 @@
+"""Replay market-data provider — serves recorded responses on a compressed timeline.
+
+재생 시각 = 시작 후 경과 시간 × speed 이며, 각 조회는 그 시각까지 기록된 마지막 응답을 돌려준다
+(첫 응답 이전이면 첫 응답). loop면 기록 끝에서 처음으로 돌아간다.
+일봉은 그 시각까지 기록된 응답(전체 구간 + 당일 봉 증분)을 병합한 시계열을 돌려준다.
+응답 지연은 기록된 응답 시간 또는 고정 지연 + 지터(시드 고정)로 주입하며, speed로 압축하지 않는다.
+PaperBroker의 가격 제공자 자리에 쓰인다 (주문은 모의 체결).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import random
+import time
+
+from app.bars import BarSeries
+from app.broker.base import PriceInfo
+from app.broker.replay.log import (
+    CANDLES,
+    DAILY,
+    PRICE,
+    Entry,
+    Recording,
+    decode_candles,
+    decode_daily,
+    decode_price,
+)
+from app.candles import aggregate
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayError(RuntimeError):
+    """기록 당시 실패한 응답을 재생함."""
+
+
+class ReplayProvider:
+    """Price provider backed by a market-data recording."""
+
+    def __init__(
+        self,
+        recording: Recording,
+        speed: float = 1.0,
+        loop: bool = True,
+        latency_ms: float = -1.0,
+        jitter_ms: float = 0.0,
+        seed: int = 0,
+    ):
+        self.recording = recording
+        self.speed = speed
+        self.loop = loop
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._rng = random.Random(seed)
+        self._start = time.monotonic()
+        self._times: dict[tuple[str, tuple], list[float]] = {}
+        self._daily: dict[tuple, list[Entry]] = {}
+
+    def elapsed(self) -> float:
+        """현재 재생 시각 (기록 시작 후 초)."""
+        t = (time.monotonic() - self._start) * self.speed
+        if self.loop and self.recording.duration > 0:
+            # 마지막 응답도 (기록 시각 기준) 1초간 재생한 뒤 처음으로
+            t %= self.recording.duration + 1.0
+        return t
+
+    def _pick(self, op: str, key: tuple, entries: list[Entry]) -> Entry:
+        if not entries:
+            raise LookupError(f"기록 없음: {op} {key}")
+        times = self._times.get((op, key))
+        if times is None:
+            times = self._times[(op, key)] = [e.t for e in entries]
+        return entries[max(bisect.bisect_right(times, self.elapsed()) - 1, 0)]
+
+    def _delay(self, entry: Entry) -> float:
+        if self.latency_ms < 0:
+            ms = entry.ms
+        else:
+            ms = self.latency_ms + (self._rng.uniform(0, self.jitter_ms) if self.jitter_ms > 0 else 0.0)
+        return ms / 1000
+
+    async def _serve(self, op: str, key: tuple, entries: list[Entry]) -> Entry:
+        entry = self._pick(op, key, entries)
+        delay = self._delay(entry)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if entry.error is not None:
+            raise ReplayError(entry.error)
+        return entry
+
+    def _daily_entries(self, key: tuple) -> list[Entry]:
+        """일봉 응답을 시각 순으로 누적 병합한 목록 (키별 최초 조회 시 1회 계산)."""
+        merged = self._daily.get(key)
+        if merged is None:
+            merged, series = [], BarSeries.empty()
+            for e in self.recording.entries(DAILY, key):
+                if e.error is None:
+                    series = series.merge(decode_daily(e.data))
+                    e = Entry(e.t, e.ms, series)
+                merged.append(e)
+            self._daily[key] = merged
+        return merged
+
+    async def get_current_price(self, symbol: str, market: str) -> PriceInfo:
+        key = (symbol, market)
+        entry = await self._serve(PRICE, key, self.recording.entries(PRICE, key))
+        return decode_price(symbol, market, entry.data)
+
+    async def get_current_prices(
+        self, symbols: list[str], market: str
+    ) -> dict[str, PriceInfo]:
+        """일괄 조회는 종목별 응답 중 가장 긴 지연을 한 번만 기다린다 (기록 없는·실패 종목 제외)."""
+        picked = {}
+        for symbol in symbols:
+            key = (symbol, market)
+            try:
+                picked[symbol] = self._pick(PRICE, key, self.recording.entries(PRICE, key))
+            except LookupError:
+                logger.debug("재생 기록 없음: %s/%s", symbol, market)
+        delay = max((self._delay(e) for e in picked.values()), default=0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return {
+            symbol: decode_price(symbol, market, e.data)
+            for symbol, e in picked.items()
+            if e.error is None
+        }
+
+    async def get_daily_prices(
+        self, symbol: str, market: str, days: int = 60, start: str | None = None,
+    ) -> BarSeries:
+        key = (symbol, market)
+        entry = await self._serve(DAILY, key, self._daily_entries(key))
+        return entry.data.since(start) if start else entry.data[-days:]
+
+    async def get_intraday_candles(
+        self, symbol: str, market: str, interval: int = 1
+    ) -> list[dict]:
+        """기록된 interval분봉, 없으면 기록된 1분봉을 집계해 반환."""
+        key = (symbol, market, interval)
+        if self.recording.entries(CANDLES, key):
+            entry = await self._serve(CANDLES, key, self.recording.entries(CANDLES, key))
+            return decode_candles(entry.data)
+        key = (symbol, market, 1)
+        entry = await self._serve(CANDLES, key, self.recording.entries(CANDLES, key))
+        return aggregate(decode_candles(entry.data), interval)
+
+    async def get_minute_candles(
+        self, symbol: str, market: str, since: str | None = None
+    ) -> list[dict]:
+        candles = await self.get_intraday_candles(symbol, market, 1)
+        if since is None:
+            return candles
+        return [c for c in candles if c["datetime"] >= since]
+
+
+_provider: ReplayProvider | None = None
+
+
+def get_replay_provider() -> ReplayProvider:
+    """프로세스 전역 재생 제공자 (settings.market_data_log, 첫 호출 시 적재하고 재생 시작)."""
+    global _provider
+    if _provider is None:
+        from app.config import settings
+        _provider = ReplayProvider(
+            Recording.load(settings.market_data_log),
+            speed=settings.replay_speed,
+            loop=settings.replay_loop,
+            latency_ms=settings.replay_latency_ms,
+            jitter_ms=settings.replay_jitter_ms,
+        )
+    return _provider
@@ -0,0 +1,114 @@
+"""Recording broker — wraps a live broker and logs every market-data response.
+
+주문·잔고 등 시세 외 호출과 브로커 고유 속성(KIS _client 등)은 감싼 브로커에 그대로 위임한다.
+분봉 증분 조회(get_minute_candles)는 기본 구현(당일 1분봉 조회 후 필터)을 타므로
+기록 중에는 1분봉 전체 조회가 기록된다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.bars import BarSeries
+from app.broker.base import AbstractBroker, BalanceInfo, OrderResult, PriceInfo
+from app.broker.replay.log import (
+    CANDLES,
+    DAILY,
+    PRICE,
+    MarketDataRecorder,
+    encode_candles,
+    encode_daily,
+    encode_price,
+)
+
+
+class RecordingBroker(AbstractBroker):
+    """Delegates to the wrapped broker and records price, daily and candle responses."""
+
+    def __init__(self, inner: AbstractBroker, recorder: MarketDataRecorder):
+        self._inner = inner
+        self._recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+    async def _record(
+        self, op: str, key: tuple, call: Callable[[], Awaitable[Any]], encode: Callable[[Any], Any],
+    ) -> Any:
+        t0 = time.monotonic()
+        try:
+            result = await call()
+        except Exception as e:
+            self._recorder.write(op, key, time.monotonic() - t0, error=f"{type(e).__name__}: {e}")
+            raise
+        self._recorder.write(op, key, time.monotonic() - t0, data=encode(result))
+        return result
+
+    # ---- Delegated ----
+
+    async def connect(self) -> None:
+        await self._inner.connect()
+
+    async def disconnect(self) -> None:
+        await self._inner.disconnect()
+
+    async def place_order(
+        self,
+        symbol: str,
+        market: str,
+        side: str,
+        order_type: str,
+        quantity: int,
+        price: float | None = None,
+        **kwargs: Any,
+    ) -> OrderResult:
+        return await self._inner.place_order(symbol, market, side, order_type, quantity, price, **kwargs)
+
+    async def cancel_order(self, broker_order_id: str, **kwargs: Any) -> OrderResult:
+        return await self._inner.cancel_order(broker_order_id, **kwargs)
+
+    async def get_order_status(self, broker_order_id: str, **kwargs: Any) -> dict:
+        return await self._inner.get_order_status(broker_order_id, **kwargs)
+
+    async def get_balance(self) -> BalanceInfo:
+        return await self._inner.get_balance()
+
+    # ---- Recorded ----
+
+    async def get_current_price(self, symbol: str, market: str) -> PriceInfo:
+        return await self._record(
+            PRICE, (symbol, market),
+            lambda: self._inner.get_current_price(symbol, market), encode_price,
+        )
+
+    async def get_current_prices(self, symbols: list[str], market: str) -> dict[str, PriceInfo]:
+        """일괄 조회 결과를 종목별 응답으로 기록 (응답 시간은 일괄 호출 전체, 빠진 종목은 실패)."""
+        t0 = time.monotonic()
+        result = await self._inner.get_current_prices(symbols, market)
+        latency = time.monotonic() - t0
+        for symbol in symbols:
+            info = result.get(symbol)
+            if info is None:
+                self._recorder.write(PRICE, (symbol, market), latency, error="일괄 조회 응답 없음")
+            else:
+                self._recorder.write(PRICE, (symbol, market), latency, data=encode_price(info))
+        return result
+
+    async def get_daily_prices(
+        self, symbol: str, market: str, days: int = 60, start: str | None = None,
+    ) -> BarSeries:
+        return await self._record(
+            DAILY, (symbol, market),
+            lambda: self._inner.get_daily_prices(symbol, market, days, start=start),
+            lambda bars: encode_daily(BarSeries.coerce(bars)),
+        )
+
+    async def get_intraday_candles(
+        self, symbol: str, market: str, interval: int = 1
+    ) -> list[dict]:
+        return await self._record(
+            CANDLES, (symbol, market, interval),
+            lambda: self._inner.get_intraday_candles(symbol, market, interval), encode_candles,
+        )
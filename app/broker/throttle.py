@@ -0,0 +1,440 @@
+"""시세 제공자 호출 제한: 토큰 버킷 레이트 리미터(우선순위 차선 포함) + 동시성 제한 실행기
++ 차단 호출 전용 스레드 풀(호출별 제한 시간) + 엔드포인트별 서킷 브레이커."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from app.metrics import rate_limit_wait
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class RateLimiter:
+    """초당 rate회, 최대 burst회 연속 허용하는 토큰 버킷 (GCRA 방식).
+
+    '다음 허용 시각'만 관리하므로 await 없이 예약이 끝나 락이 필요 없고,
+    먼저 acquire한 호출이 먼저 통과한다 (FIFO).
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tat = 0.0  # theoretical arrival time (monotonic)
+        self.acquired = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def acquire(self) -> None:
+        """호출 허용 시각까지 대기. rate <= 0이면 제한 없음."""
+        self.acquired += 1
+        if self.rate <= 0:
+            return
+        interval = 1.0 / self.rate
+        now = time.monotonic()
+        tat = max(self._tat, now)
+        wait = tat - now - (self.burst - 1) * interval
+        self._tat = tat + interval
+        if wait > 0:
+            self.waited += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            await asyncio.sleep(wait)
+
+    def reserve(self, count: int) -> None:
+        """count회 호출 자리를 기다리지 않고 미리 예약 (이후 acquire는 그만큼 뒤로 밀린다).
+
+        호출 간격을 직접 지키는 일괄 실행(워커 batch)이 공유 한도를 함께 쓰도록 할 때 사용한다.
+        """
+        if count <= 0:
+            return
+        self.acquired += count
+        if self.rate > 0:
+            self._tat = max(self._tat, time.monotonic()) + count / self.rate
+
+    def stats(self) -> dict:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "avg_wait": round(self.total_wait / self.waited, 4) if self.waited else 0.0,
+            "max_wait": round(self.max_wait, 4),
+        }
+
+
+class PriorityRateLimiter:
+    """차선(lane)별 대기열을 둔 토큰 버킷 (GCRA 방식, 한도는 모든 차선이 공유).
+
+    lanes는 우선순위 순서이며, 허용 시각이 올 때마다 대기 중인 가장 높은 차선의
+    가장 먼저 온 호출을 통과시킨다. 낮은 차선 호출이 아무리 많이 쌓여 있어도
+    높은 차선 호출은 다음 허용 시각에 바로 나가므로 주문이 시세 조회에 밀리지 않는다.
+    """
+
+    def __init__(self, name: str, rate: float, lanes: tuple[str, ...], burst: int = 1):
+        self.name = name
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.lanes = lanes
+        self._tat = 0.0
+        self._queues: dict[str, deque[asyncio.Future]] = {lane: deque() for lane in lanes}
+        self._timer: asyncio.TimerHandle | None = None
+        self._lane_stats = {
+            lane: {"acquired": 0, "waited": 0, "total_wait": 0.0, "max_wait": 0.0} for lane in lanes
+        }
+
+    def _ready_at(self) -> float:
+        """다음 호출 허용 시각 (monotonic)."""
+        return self._tat - (self.burst - 1) / self.rate
+
+    def _take(self, now: float) -> None:
+        self._tat = max(self._tat, now) + 1.0 / self.rate
+
+    def queued(self, lane: str) -> int:
+        return len(self._queues[lane])
+
+    async def acquire(self, lane: str) -> None:
+        """lane 차선으로 호출 허용 시각까지 대기. rate <= 0이면 제한 없음."""
+        queue = self._queues[lane]  # 모르는 차선은 KeyError
+        stats = self._lane_stats[lane]
+        stats["acquired"] += 1
+        if self.rate <= 0:
+            rate_limit_wait.observe(0.0, self.name, lane)
+            return
+        now = time.monotonic()
+        if self._ready_at() <= now and not any(self._queues.values()):
+            self._take(now)
+            rate_limit_wait.observe(0.0, self.name, lane)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        self._schedule()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future in queue:
+                queue.remove(future)
+            raise
+        wait = time.monotonic() - now
+        stats["waited"] += 1
+        stats["total_wait"] += wait
+        stats["max_wait"] = max(stats["max_wait"], wait)
+        rate_limit_wait.observe(wait, self.name, lane)
+
+    def _schedule(self) -> None:
+        if self._timer is not None or not any(self._queues.values()):
+            return
+        delay = max(self._ready_at() - time.monotonic(), 0.0)
+        self._timer = asyncio.get_running_loop().call_later(delay, self._release)
+
+    def _release(self) -> None:
+        """허용 시각 도달: 가장 높은 차선의 맨 앞 호출 하나를 통과시키고 다음 시각을 예약."""
+        self._timer = None
+        for lane in self.lanes:
+            queue = self._queues[lane]
+            while queue:
+                future = queue.popleft()
+                if not future.done():
+                    self._take(time.monotonic())
+                    future.set_result(None)
+                    self._schedule()
+                    return
+        self._schedule()
+
+    def stats(self) -> dict:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "acquired": sum(s["acquired"] for s in self._lane_stats.values()),
+            "waited": sum(s["waited"] for s in self._lane_stats.values()),
+            "lanes": {
+                lane: {
+                    "queued": len(self._queues[lane]),
+                    "acquired": s["acquired"],
+                    "waited": s["waited"],
+                    "avg_wait": round(s["total_wait"] / s["waited"], 4) if s["waited"] else 0.0,
+                    "max_wait": round(s["max_wait"], 4),
+                }
+                for lane, s in self._lane_stats.items()
+            },
+        }
+
+
+# 제공자별 공유 리미터 레지스트리: 같은 앱 키/스크래핑 대상을 쓰는 인스턴스가 한도를 공유
+_limiters: dict[str, RateLimiter | PriorityRateLimiter] = {}
+
+
+def get_rate_limiter(name: str, rate: float, burst: int = 1) -> RateLimiter:
+    """이름별 공유 RateLimiter 반환 (최초 호출 시 생성)."""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limiter = RateLimiter(rate, burst)
+        _limiters[name] = limiter
+    return limiter
+
+
+def get_priority_limiter(
+    name: str, rate: float, lanes: tuple[str, ...], burst: int = 1,
+) -> PriorityRateLimiter:
+    """이름별 공유 PriorityRateLimiter 반환 (최초 호출 시 생성)."""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limiter = PriorityRateLimiter(name, rate, lanes, burst)
+        _limiters[name] = limiter
+    return limiter
+
+
+def get_rate_limiter_stats() -> dict[str, dict]:
+    return {name: limiter.stats() for name, limiter in _limiters.items()}
+
+
+def get_queue_depths() -> dict[tuple[str, str], int]:
+    """{(리미터 이름, 차선): 대기 호출 수} — 우선순위 리미터만."""
+    return {
+        (name, lane): limiter.queued(lane)
+        for name, limiter in _limiters.items()
+        if isinstance(limiter, PriorityRateLimiter)
+        for lane in limiter.lanes
+    }
+
+
+async def gather_limited(
+    keys: Iterable[K],
+    fn: Callable[[K], Awaitable[V]],
+    *,
+    concurrency: int,
+    timeout: float | None = None,
+) -> dict[K, V]:
+    """keys마다 fn을 최대 concurrency개 동시 실행. {key: 결과} 반환.
+
+    실패한 키는 결과에서 제외하고, timeout(초)이 지나면 남은 호출을 취소해
+    완료된 결과만 반환한다 (주기 작업이 자기 간격을 넘기지 않도록).
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    results: dict[K, V] = {}
+
+    async def _run(key: K) -> None:
+        async with semaphore:
+            try:
+                results[key] = await fn(key)
+            except Exception as e:
+                logger.warning("일괄 조회 실패 %s: %s", key, e)
+
+    tasks = [asyncio.ensure_future(_run(k)) for k in keys]
+    if not tasks:
+        return results
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+    if pending:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        logger.warning("일괄 조회 시간 초과 (%.1fs): %d/%d건 미완료", timeout, len(pending), len(tasks))
+    return results
+
+
+class CircuitOpenError(RuntimeError):
+    """서킷 브레이커가 열려 있어 호출하지 않고 즉시 거부함."""
+
+
+class CircuitBreaker:
+    """연속 실패가 임계치에 닿으면 열리고(open), reset_timeout 후 시험 호출 1건만 허용(half_open),
+    시험 호출이 성공하면 닫히는(closed) 서킷 브레이커.
+
+    열려 있는 동안은 제공자를 호출하지 않고 CircuitOpenError를 던지므로
+    호출자는 곧바로 DB/만료 캐시 대체값으로 응답할 수 있다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0  # 연속 실패 수
+        self.opened_at = 0.0  # monotonic
+        self._probing = False  # half_open 시험 호출 진행 중
+        self.opens = 0
+        self.rejected = 0
+        self.last_error: str | None = None
+
+    def allow(self) -> bool:
+        """지금 호출해도 되는지. open 상태에서 reset_timeout이 지나면 half_open으로 전환."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            logger.info("서킷 half-open: %s (시험 호출 1건 허용)", self.name)
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info("서킷 닫힘: %s", self.name)
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self, error: BaseException) -> None:
+        self.failures += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        self._probing = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.opens += 1
+                logger.warning(
+                    "서킷 열림: %s (연속 실패 %d회, %.0f초 후 재시도): %s",
+                    self.name, self.failures, self.reset_timeout, self.last_error,
+                )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    async def call(self, fn: Callable[[], Awaitable[V]]) -> V:
+        """브레이커를 거쳐 fn 실행. 열려 있으면 CircuitOpenError."""
+        if not self.allow():
+            self.rejected += 1
+            raise CircuitOpenError(f"{self.name} 서킷 열림 ({self.retry_in():.0f}초 후 재시도)")
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self._probing = False  # 시험 호출이 취소되면 다음 호출이 다시 시험
+            raise
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
+
+    def retry_in(self) -> float:
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opens": self.opens,
+            "rejected": self.rejected,
+            "retry_in": round(self.retry_in(), 1),
+            "last_error": self.last_error,
+        }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """엔드포인트별 공유 CircuitBreaker 반환 (최초 호출 시 설정값으로 생성)."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        from app.config import settings
+        breaker = CircuitBreaker(
+            name,
+            failure_threshold=settings.circuit_failure_threshold,
+            reset_timeout=settings.circuit_reset_timeout,
+        )
+        _breakers[name] = breaker
+    return breaker
+
+
+def get_circuit_breaker_stats() -> dict[str, dict]:
+    return {name: breaker.stats() for name, breaker in _breakers.items()}
+
+
+class BlockingExecutor:
+    """차단(blocking) 시세 호출 전용 스레드 풀. 호출마다 제한 시간을 둔다.
+
+    기본 실행기(asyncio.to_thread)와 분리해 멈춘 스크래핑이 다른 작업의 스레드를 잡지 않게 한다.
+    제한 시간이 지나면 호출자는 TimeoutError를 받고, 대기열에 있던 호출은 실행되지 않는다.
+    이미 실행 중인 스레드는 강제로 멈출 수 없으므로 끝날 때까지 작업자 1개를 점유한다 (running에 집계).
+    """
+
+    def __init__(self, name: str, max_workers: int, timeout: float):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.running = 0  # 실제 실행 중인 작업자 수 (제한 시간 초과 후에도 끝나지 않은 호출 포함)
+        self.submitted = 0
+        self.timeouts = 0
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix=self.name)
+        return self._pool
+
+    def _track(self, fn: Callable[..., V], *args) -> V:
+        with self._lock:
+            self.running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    async def run(self, fn: Callable[..., V], *args, timeout: float | None = None) -> V:
+        """fn(*args)를 전용 풀에서 실행하고 결과 반환 (제한 시간 초과 시 TimeoutError)."""
+        self.submitted += 1
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_pool(), self._track, fn, *args)
+        try:
+            return await asyncio.wait_for(future, self.timeout if timeout is None else timeout)
+        except TimeoutError:
+            self.timeouts += 1
+            raise TimeoutError(f"{self.name} 호출 제한 시간 초과") from None
+
+    def shutdown(self) -> None:
+        """대기 중인 호출을 취소하고 풀 종료 (실행 중인 스레드는 기다리지 않음)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "timeout": self.timeout,
+            "running": self.running,
+            "submitted": self.submitted,
+            "timeouts": self.timeouts,
+        }
+
+
+_executors: dict[str, BlockingExecutor] = {}
+
+
+def get_executor(name: str, max_workers: int, timeout: float) -> BlockingExecutor:
+    """이름별 공유 BlockingExecutor 반환 (최초 호출 시 생성)."""
+    executor = _executors.get(name)
+    if executor is None:
+        executor = BlockingExecutor(name, max_workers, timeout)
+        _executors[name] = executor
+    return executor
+
+
+def get_executor_stats() -> dict[str, dict]:
+    return {name: executor.stats() for name, executor in _executors.items()}
+
+
+def shutdown_executors() -> None:
+    for executor in _executors.values():
+        executor.shutdown()
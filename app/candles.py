@@ -0,0 +1,76 @@
+"""분봉 집계 — 1분봉을 벽시계 구간(N분 단위)으로 벡터화 집계한다.
+
+구간 시작은 자정 기준 분(minute)을 interval로 내림한 값이므로
+중간에 빠진 분봉이 있어도 09:00, 09:05, 09:10 … 경계가 어긋나지 않는다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+# API에서 허용하는 집계 단위 (분)
+SUPPORTED_INTERVALS = (1, 3, 5, 10, 15, 30, 60)
+
+
+def _minute_of_day(dt: str) -> int:
+    """'YYYY-MM-DD HH:MM[:SS]' → 자정 기준 분."""
+    return int(dt[11:13]) * 60 + int(dt[14:16])
+
+
+def aggregate_arrays(
+    minutes: np.ndarray,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    interval: int,
+) -> tuple[np.ndarray, ...]:
+    """분 오름차순 배열을 interval분 벽시계 구간으로 집계.
+
+    반환: (구간 시작 분, open, high, low, close, volume) — 봉이 있는 구간만.
+    """
+    if interval <= 1 or len(minutes) == 0:
+        return minutes, open_, high, low, close, volume
+    buckets = minutes // interval * interval
+    # 정렬된 입력이므로 구간 경계 = 값이 바뀌는 위치
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+    return (
+        buckets[starts],
+        open_[starts],
+        np.maximum.reduceat(high, starts),
+        np.minimum.reduceat(low, starts),
+        close[ends],
+        np.add.reduceat(volume, starts),
+    )
+
+
+def aggregate(candles: Sequence[dict], interval: int) -> list[dict]:
+    """1분봉 dict 목록(오름차순, 같은 날짜)을 interval분봉 dict 목록으로 집계."""
+    if interval <= 1 or not candles:
+        return list(candles)
+    n = len(candles)
+    minutes = np.fromiter((_minute_of_day(c["datetime"]) for c in candles), dtype=np.int64, count=n)
+    cols = [
+        np.fromiter((c[f] for c in candles), dtype=np.float64, count=n)
+        for f in ("open", "high", "low", "close")
+    ]
+    volume = np.fromiter((c["volume"] for c in candles), dtype=np.int64, count=n)
+    day = candles[0]["datetime"][:10]
+    starts, o, h, lo, c, v = aggregate_arrays(minutes, *cols, volume, interval)
+    return [
+        {
+            "datetime": f"{day} {m // 60:02d}:{m % 60:02d}:00",
+            "open": op,
+            "high": hi,
+            "low": lw,
+            "close": cl,
+            "volume": vol,
+        }
+        for m, op, hi, lw, cl, vol in zip(
+            starts.tolist(), o.tolist(), h.tolist(), lo.tolist(), c.tolist(), v.tolist()
+        )
+    ]
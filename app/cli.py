@@ -0,0 +1,160 @@
+"""운영 보조 명령 — `python -m app.cli <command>`.
+
+    importtime [--module app.main] [--top 25] [--sort self|cumulative]
+        새 프로세스에서 `python -X importtime`으로 모듈을 적재해 import 비용 상위 모듈을 출력
+    startup [--module app.main] [--json]
+        새 프로세스에서 모듈 적재 시간·직후 RSS·무거운 의존성 적재 여부를 측정해 기동 예산과 비교
+        (예산 초과 또는 무거운 의존성 적재 시 종료 코드 1)
+
+두 명령 모두 측정 대상을 별도 프로세스에서 적재하므로 이 프로세스의 import 상태와 무관하다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import subprocess
+import sys
+from dataclasses import dataclass
+
+_PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+# 기동 시 적재되면 안 되는 의존성 — 첫 실제 사용(시세 조회, KIS 연결, 스케줄러 시작) 때 적재한다
+HEAVY_MODULES = ("pandas", "pykrx", "yfinance", "numpy", "httpx", "websockets", "apscheduler")
+
+_STARTUP_PROBE = """
+import json, os, resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+try:  # 현재 RSS (ru_maxrss는 fork한 부모의 최대치를 물려받아 부풀 수 있다)
+    with open("/proc/self/statm") as f:
+        rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+except OSError:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"import_seconds": elapsed, "rss_bytes": rss, "modules": len(sys.modules), "heavy": heavy}}))
+"""
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # 중첩 깊이 (최상위 import = 0)
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_PROJECT_ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """`-X importtime` stderr 출력 → 모듈별 기록 (헤더·기타 줄은 무시)."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # 헤더 줄
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        records.append(ImportRecord(stripped, self_us, cumulative_us, (len(name) - len(stripped) - 1) // 2))
+    return records
+
+
+def profile_imports(module: str = "app.main") -> list[ImportRecord]:
+    """새 인터프리터에서 module을 적재하며 모듈별 import 시간 수집."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=_env(), cwd=_PROJECT_ROOT, check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{module} 적재 실패:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def measure_startup(module: str = "app.main") -> dict:
+    """새 인터프리터에서 module 적재 시간(초)·직후 RSS·적재된 무거운 의존성 측정."""
+    code = _STARTUP_PROBE.format(module=module, heavy=HEAVY_MODULES)
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, env=_env(), cwd=_PROJECT_ROOT, check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{module} 적재 실패:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def check_startup(result: dict) -> list[str]:
+    """측정 결과를 기동 예산과 비교해 위반 항목 목록 반환 (없으면 빈 목록)."""
+    from app.config import settings
+
+    problems = []
+    if result["import_seconds"] > settings.startup_import_budget:
+        problems.append(
+            f"적재 시간 {result['import_seconds']:.2f}s > 예산 {settings.startup_import_budget:.2f}s"
+        )
+    rss_mb = result["rss_bytes"] / 1024 / 1024
+    if rss_mb > settings.startup_rss_budget_mb:
+        problems.append(f"RSS {rss_mb:.1f}MB > 예산 {settings.startup_rss_budget_mb:.1f}MB")
+    if result["heavy"]:
+        problems.append(f"기동 시 적재된 무거운 의존성: {', '.join(result['heavy'])}")
+    return problems
+
+
+def _cmd_importtime(args: argparse.Namespace) -> int:
+    records = profile_imports(args.module)
+    key = (lambda r: r.self_us) if args.sort == "self" else (lambda r: r.cumulative_us)
+    total = next((r.cumulative_us for r in records if r.module == args.module), 0)
+    print(f"{args.module}: {total / 1000:.1f}ms, 모듈 {len(records)}개")
+    print(f"{'self(ms)':>9} {'cumul(ms)':>10}  module")
+    for r in sorted(records, key=key, reverse=True)[: args.top]:
+        print(f"{r.self_us / 1000:9.1f} {r.cumulative_us / 1000:10.1f}  {'  ' * r.depth}{r.module}")
+    return 0
+
+
+def _cmd_startup(args: argparse.Namespace) -> int:
+    result = measure_startup(args.module)
+    problems = check_startup(result)
+    if args.json:
+        print(json.dumps({**result, "problems": problems}, ensure_ascii=False))
+    else:
+        print(f"적재 시간: {result['import_seconds']:.3f}s")
+        print(f"RSS: {result['rss_bytes'] / 1024 / 1024:.1f}MB")
+        print(f"모듈 수: {result['modules']}")
+        for problem in problems:
+            print(f"예산 초과: {problem}")
+    return 1 if problems else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="micro-trading 운영 보조 명령")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("importtime", help="모듈 적재 import 비용 상위 목록")
+    p.add_argument("--module", default="app.main")
+    p.add_argument("--top", type=int, default=25)
+    p.add_argument("--sort", choices=("self", "cumulative"), default="cumulative")
+    p.set_defaults(func=_cmd_importtime)
+
+    p = sub.add_parser("startup", help="기동 시간·RSS를 기동 예산과 비교")
+    p.add_argument("--module", default="app.main")
+    p.add_argument("--json", action="store_true", help="JSON 한 줄로 출력")
+    p.set_defaults(func=_cmd_startup)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,7 @@ import pathlib
 
 from pydantic_settings import BaseSettings
 
-from app.schemas.common import TradingMode
+from app.schemas.common import MarketDataMode, TradingMode
 
 logger = logging.getLogger(__name__)
 
@@ -62,12 +62,95 @@ class Settings(BaseSettings):
     paper_commission_rate: float = 0.0005  # 0.05%
     real_commission_rate: float = 0.0015  # KIS 실거래 수수료 기본값 0.15%
 
+    # Quote cache (메모리 LRU + TTL)
+    quote_cache_max_entries: int = 2000
+    quote_cache_ttl: float = 15.0  # seconds
+    quote_cache_max_stale: float = 3600.0  # 만료 후에도 대체값으로 보관하는 최대 시간
+    # stale-while-revalidate: 만료 후 grace 초 이내면 이전 시세를 즉시 반환하고 백그라운드 갱신
+    quote_swr_enabled: bool = False
+    quote_swr_grace: float = 60.0  # seconds
+
+    # 분봉 저장소 보관 일수 (이전 분봉은 야간 정리 잡이 삭제)
+    minute_bar_retention_days: int = 5
+
+    # 일봉 메모리 캐시 최대 종목 수 (LRU)
+    daily_cache_max_symbols: int = 200
+
+    # 시세 갱신 잡: 간격, 종목별 호출 동시성, 주기 내 마감 시간
+    price_refresh_interval: int = 30  # seconds
+    price_refresh_concurrency: int = 4
+    price_refresh_deadline: float = 20.0  # seconds (간격보다 짧게)
+    # 장 시작 전·장 마감 후 시간대 갱신 간격 (휴장 시간에는 갱신하지 않음)
+    price_refresh_interval_slow: int = 300  # seconds
+    # 우선순위 계층별 갱신 주기 (초): 미체결 주문·활성 전략, 보유, 관심, 최근 조회 순
+    price_refresh_tier_intervals: tuple[float, float, float, float] = (30, 30, 90, 180)
+    # 주기당 최대 갱신 종목 수 (0=무제한). 기본값은 KIS 모의투자 한도(초당 2회 × 마감 20초) 기준
+    price_refresh_budget: int = 40
+    # UI에서 조회한 종목을 계층 4 갱신 대상으로 유지하는 시간
+    price_view_ttl: float = 600.0  # seconds
+
+    # 시세 이벤트 버스 구독자별 큐 크기 (가득 차면 가장 오래된 이벤트부터 버림)
+    price_bus_queue_size: int = 256
+    # 재접속 스트림의 Last-Event-ID 재생용 최근 이벤트 보관 수
+    price_bus_history_size: int = 1024
+
+    # SSE 시세 스트림: 하트비트 간격, 연결당 최대 종목 수
+    sse_heartbeat_interval: float = 15.0  # seconds
+    sse_max_symbols: int = 50
+
+    # KRX 임시 휴장일 (쉼표 구분 YYYY-MM-DD, 내장 휴장일 목록에 추가)
+    krx_extra_holidays: str = ""
+
+    # 지표 스냅샷 유효 시간: 이보다 오래된 스냅샷은 전략·API가 일봉으로 직접 계산
+    indicator_snapshot_max_age: float = 120.0  # seconds
+    indicator_snapshot_max_entries: int = 2000  # 초과 시 가장 오래 갱신되지 않은 종목부터 제거
+
+    # KIS 실시간 체결가(WebSocket) 수신: 켜면 관심·보유·전략 종목을 실시간 구독해 REST 폴링을 대체
+    kis_ws_enabled: bool = False
+    kis_ws_url: str = ""  # 비우면 kis_base_url(실전/모의)에 맞는 기본 주소
+    kis_ws_max_symbols: int = 41  # KIS 세션당 실시간 등록 한도
+
+    # 제공자별 초당 호출 한도 (KIS 모의투자 서버는 실전보다 훨씬 낮음)
+    kis_rate_limit_real: float = 15.0
+    kis_rate_limit_mock: float = 2.0
+    pykrx_rate_limit: float = 5.0
+    # pykrx 전종목 스냅샷 유효 시간 (장중). 장외에는 다음 장 시작까지 재사용
+    pykrx_snapshot_max_age: float = 15.0  # seconds
+    # pykrx 호출을 별도 워커 프로세스에서 실행 (pandas/pykrx 메모리를 웹 프로세스 밖에 둠).
+    # 워커는 호출 수 또는 RSS 기준을 넘으면 새 프로세스로 교체된다 (0=제한 없음)
+    pykrx_worker_enabled: bool = True
+    pykrx_worker_max_calls: int = 500
+    pykrx_worker_max_rss_mb: float = 300.0
+    # pykrx 호출별 제한 시간, 워커 비활성 시 프로세스 내 전용 스레드 수
+    pykrx_call_timeout: float = 15.0  # seconds
+    pykrx_max_workers: int = 4
+    # 제공자 엔드포인트별 서킷 브레이커: 연속 실패 임계치, 열린 뒤 시험 호출까지 대기
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 30.0  # seconds
+
+    # 시세 기록/재생: RECORD는 브로커 시세 응답을 market_data_log에 기록하고,
+    # REPLAY는 기록 파일로 시세를 제공한다 (주문은 모의 체결 — 오프라인 부하 테스트용)
+    market_data_mode: MarketDataMode = MarketDataMode.LIVE
+    market_data_log: str = "./market_data.jsonl.gz"
+    # 재생 시간 압축 배율 (60이면 기록 1분을 1초에 재생), 기록 끝에 닿으면 처음부터 반복
+    replay_speed: float = 1.0
+    replay_loop: bool = True
+    # 재생 응답 지연: 음수면 기록된 응답 시간 그대로, 0 이상이면 고정 지연 + 0~jitter 균등 지터
+    replay_latency_ms: float = -1.0
+    replay_jitter_ms: float = 0.0
+
+    # 시세 DB 캐시 쓰기 지연(write-behind) 반영 간격
+    price_cache_flush_interval: int = 10  # seconds
+
     # Database
     database_url: str = "sqlite+aiosqlite:///./trading.db"
 
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    # 기동 예산: app.main 적재 시간·직후 RSS 상한 (`python -m app.cli startup`, 회귀 테스트 기준)
+    startup_import_budget: float = 3.0  # seconds
+    startup_rss_budget_mb: float = 100.0
 
     def get_trading_mode(self) -> TradingMode:
         """현재 활성 거래 모드 반환 (영속화 파일 → .env 순 우선순위)."""
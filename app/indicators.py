@@ -0,0 +1,167 @@
+"""NumPy 기반 기술적 지표 엔진 (SMA, EMA, Wilder RSI, MACD, 볼린저 밴드, ATR).
+
+모든 함수는 날짜 오름차순 배열을 받아 같은 길이의 배열을 반환하며,
+계산에 필요한 데이터가 부족한 초반 구간은 NaN으로 채운다. 모두 O(n).
+
+MarketService와 내장 전략이 공유하며, 같은 시계열 버전에 대한 반복 계산은
+memoize()로 재사용한다 (전략 틱마다 동일 일봉에 대해 재계산하지 않도록).
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from typing import TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+_MEMO_MAX_ENTRIES = 512
+# {(series_key, version, name, params): 결과} — LRU
+_memo: OrderedDict[tuple, object] = OrderedDict()
+
+
+# ── 입력 변환 ────────────────────────────────────────────────
+
+def column(bars: Sequence[dict], field: str = "close") -> np.ndarray:
+    """일봉 dict 목록에서 한 컬럼을 float64 배열로 추출."""
+    return np.fromiter((b[field] for b in bars), dtype=np.float64, count=len(bars))
+
+
+def series_version(bars: Sequence[dict]) -> tuple:
+    """시계열 버전 토큰 — 길이·시작/마지막 날짜·마지막 종가가 같으면 같은 시계열로 본다."""
+    if not bars:
+        return (0,)
+    first, last = bars[0], bars[-1]
+    return (len(bars), first.get("date"), last.get("date"), last.get("close"))
+
+
+def memoize(
+    series_key: Hashable,
+    version: Hashable,
+    name: str,
+    params: tuple,
+    compute: Callable[[], T],
+) -> T:
+    """(시계열, 버전, 지표, 파라미터) 단위로 계산 결과를 재사용."""
+    key = (series_key, version, name, params)
+    if key in _memo:
+        _memo.move_to_end(key)
+        return _memo[key]  # type: ignore[return-value]
+    value = compute()
+    _memo[key] = value
+    while len(_memo) > _MEMO_MAX_ENTRIES:
+        _memo.popitem(last=False)
+    return value
+
+
+def clear_memo() -> None:
+    _memo.clear()
+
+
+def last_value(values: np.ndarray, offset: int = 1) -> float | None:
+    """뒤에서 offset번째 값 (NaN이거나 범위 밖이면 None)."""
+    if len(values) < offset:
+        return None
+    v = values[-offset]
+    return None if np.isnan(v) else float(v)
+
+
+# ── 지표 ─────────────────────────────────────────────────────
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """단순 이동평균 (누적합 차분)."""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if period <= 0 or len(values) < period:
+        return out
+    csum = np.cumsum(values)
+    out[period - 1] = csum[period - 1]
+    out[period:] = csum[period:] - csum[:-period]
+    out[period - 1:] /= period
+    return out
+
+
+def _recursive_smooth(values: np.ndarray, alpha: float, start: int, seed: float) -> np.ndarray:
+    """y[t] = y[t-1] + alpha * (x[t] - y[t-1]) 재귀 평활 (start 위치를 seed로 시작)."""
+    out = np.full(len(values), np.nan)
+    if start >= len(values):
+        return out
+    prev = seed
+    out[start] = prev
+    xs = values.tolist()
+    for i in range(start + 1, len(xs)):
+        prev += alpha * (xs[i] - prev)
+        out[i] = prev
+    return out
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """지수 이동평균 (첫 period개의 SMA로 시작, alpha = 2 / (period + 1))."""
+    values = np.asarray(values, dtype=np.float64)
+    if period <= 0 or len(values) < period:
+        return np.full(len(values), np.nan)
+    seed = float(values[:period].mean())
+    return _recursive_smooth(values, 2.0 / (period + 1), period - 1, seed)
+
+
+def rsi(values: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder RSI (평균 상승/하락폭을 1/period로 평활)."""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if period <= 0 or len(values) <= period:
+        return out
+    deltas = np.diff(values)
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+    alpha = 1.0 / period
+    avg_gain = _recursive_smooth(gains, alpha, period - 1, float(gains[:period].mean()))
+    avg_loss = _recursive_smooth(losses, alpha, period - 1, float(losses[:period].mean()))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+        result = 100.0 - 100.0 / (1.0 + rs)
+    # 하락이 전혀 없으면 100, 변동이 전혀 없으면 중립 50
+    result = np.where(avg_loss == 0, np.where(avg_gain == 0, 50.0, 100.0), result)
+    out[1:] = result
+    out[:period] = np.nan
+    return out
+
+
+def macd(
+    values: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD 선, 시그널 선, 히스토그램."""
+    values = np.asarray(values, dtype=np.float64)
+    line = ema(values, fast) - ema(values, slow)
+    sig = np.full(len(values), np.nan)
+    valid = ~np.isnan(line)
+    if valid.any():
+        start = int(np.argmax(valid))
+        sig[start:] = ema(line[start:], signal)
+    return line, sig, line - sig
+
+
+def bollinger(
+    values: np.ndarray, period: int = 20, k: float = 2.0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """볼린저 밴드 (중심선, 상단, 하단) — 모표준편차 기준."""
+    values = np.asarray(values, dtype=np.float64)
+    mid = sma(values, period)
+    mean_sq = sma(values * values, period)
+    std = np.sqrt(np.maximum(mean_sq - mid * mid, 0.0))
+    return mid, mid + k * std, mid - k * std
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder ATR (True Range의 1/period 평활)."""
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    n = len(close)
+    if period <= 0 or n < period:
+        return np.full(n, np.nan)
+    prev_close = np.concatenate(([close[0]], close[:-1]))
+    tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+    tr[0] = high[0] - low[0]
+    return _recursive_smooth(tr, 1.0 / period, period - 1, float(tr[:period].mean()))
@@ -90,24 +90,63 @@ async def lifespan(app: FastAPI):
             await session.commit()
             logger.info("Created default account")
 
-    # 종목 마스터 동기화 (pykrx → DB)
+    # 종목 마스터 동기화 (pykrx → DB) — 시세 재생(오프라인) 모드에서는 기존 DB 사용
+    from app.schemas.common import MarketDataMode
     try:
         from app.services.stock_master_service import StockMasterService
-        async with async_session() as session:
-            stock_svc = StockMasterService(session)
-            await stock_svc.sync_if_needed()
+        if settings.market_data_mode != MarketDataMode.REPLAY:
+            async with async_session() as session:
+                stock_svc = StockMasterService(session)
+                await stock_svc.sync_if_needed()
     except Exception:
         logger.exception("종목 마스터 동기화 실패 (앱 시작은 정상 진행)")
 
+    # 시세 메모리 캐시 웜 스타트: DB price_cache 일괄 적재 후 백그라운드 일괄 갱신 1회
+    try:
+        from app.services.market_service import MarketService, start_warmup_refresh
+        async with async_session() as session:
+            loaded = await MarketService(session).warm_start()
+        logger.info("시세 메모리 캐시 적재: %d건", loaded)
+        start_warmup_refresh()
+    except Exception:
+        logger.exception("시세 캐시 웜 스타트 실패 (앱 시작은 정상 진행)")
+
     # Start scheduler
     from app.scheduler.scheduler import start_scheduler
     scheduler = start_scheduler()
 
+    # KIS 실시간 체결가 수신 (kis_ws_enabled일 때만)
+    from app.broker.kis.realtime import start_realtime_feed, stop_realtime_feed
+    from app.scheduler.jobs import sync_realtime_subscriptions
+    try:
+        if await start_realtime_feed() is not None:
+            await sync_realtime_subscriptions()
+    except Exception:
+        logger.exception("KIS 실시간 시세 수신 시작 실패 (REST 폴링으로 동작)")
+
     yield
 
     # Shutdown
     if scheduler.running:
         scheduler.shutdown(wait=False)
+    await stop_realtime_feed()
+    # 브로커·실시간 수신기가 공유하는 KIS HTTP 연결 풀 종료
+    from app.broker.kis.client import close_kis_client
+    await close_kis_client()
+    from app.services.market_service import cancel_warmup_refresh
+    cancel_warmup_refresh()
+
+    # 쓰기 지연 버퍼에 남은 시세를 DB에 반영
+    from app.scheduler.jobs import flush_price_cache
+    await flush_price_cache()
+    # pykrx 워커 프로세스와 시세 제공자 전용 스레드 풀 종료 (멈춘 스크래핑 스레드는 기다리지 않음)
+    from app.broker.free.worker_client import stop_market_data_worker
+    from app.broker.throttle import shutdown_executors
+    await stop_market_data_worker()
+    shutdown_executors()
+    # 시세 기록 모드: gzip 버퍼를 파일에 반영
+    from app.broker.replay.log import close_recorder
+    close_recorder()
     await engine.dispose()
     logger.info("Shutdown complete")
 
@@ -0,0 +1,288 @@
+"""프로세스 내 경량 메트릭 (카운터·히스토그램) — Prometheus 텍스트 / JSON 노출.
+
+외부 의존성 없이 dict 갱신과 bisect 한 번으로 기록하므로 시세 조회 경로에 부담이 없다.
+레이블 값은 위치 인자 튜플로 받으며, 메트릭은 모듈 로드 시 한 번 정의해 재사용한다.
+
+    provider_requests.inc("pykrx", "price")
+    with provider_timer("kis", "daily"):
+        data = await client.get(...)
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# 외부 호출 지연 버킷 (초): 로컬 캐시 수준 ~ 스크래핑 타임아웃 수준
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Counter:
+    """단조 증가 카운터. 레이블 조합별 값을 보관한다."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> Iterator[tuple[str, tuple[tuple[str, str], ...], float]]:
+        for labels, value in sorted(self._values.items()):
+            yield self.name, tuple(zip(self.labelnames, labels)), value
+
+    def to_dict(self) -> dict:
+        return {",".join(k) if k else "": v for k, v in sorted(self._values.items())}
+
+    def reset(self) -> None:
+        self._values.clear()
+
+
+class Histogram:
+    """고정 버킷 히스토그램. observe는 bisect 한 번 + 리스트 원소 증가."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # {레이블: [버킷별 개수(누적 아님, 마지막 칸은 +Inf), 합계, 개수]}
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return series[2] if series else 0
+
+    def samples(self) -> Iterator[tuple[str, tuple[tuple[str, str], ...], float]]:
+        for labels, (counts, total, n) in sorted(self._series.items()):
+            base = tuple(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, c in zip(self.buckets, counts):
+                cumulative += c
+                yield f"{self.name}_bucket", base + (("le", _fmt(bound)),), cumulative
+            yield f"{self.name}_bucket", base + (("le", "+Inf"),), n
+            yield f"{self.name}_sum", base, total
+            yield f"{self.name}_count", base, n
+
+    def to_dict(self) -> dict:
+        out = {}
+        for labels, (counts, total, n) in sorted(self._series.items()):
+            cumulative, buckets = 0, {}
+            for bound, c in zip(self.buckets, counts):
+                cumulative += c
+                buckets[_fmt(bound)] = cumulative
+            out[",".join(labels) if labels else ""] = {
+                "count": n,
+                "sum": round(total, 6),
+                "avg": round(total / n, 6) if n else 0.0,
+                "buckets": buckets,
+            }
+        return out
+
+    def reset(self) -> None:
+        self._series.clear()
+
+
+class Gauge:
+    """수집 시점에 콜백으로 값을 읽는 게이지 (기존 통계 dict 노출용).
+
+    labelnames가 있으면 fn은 {레이블 튜플: 값} dict를 반환한다.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, fn: Callable[[], Any], labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._fn = fn
+
+    def samples(self) -> Iterator[tuple[str, tuple[tuple[str, str], ...], float]]:
+        if not self.labelnames:
+            yield self.name, (), float(self._fn())
+            return
+        for labels, value in sorted(self._fn().items()):
+            yield self.name, tuple(zip(self.labelnames, labels)), float(value)
+
+    def to_dict(self) -> float | dict:
+        if not self.labelnames:
+            return float(self._fn())
+        return {",".join(k): float(v) for k, v in sorted(self._fn().items())}
+
+    def reset(self) -> None:
+        pass
+
+
+_registry: dict[str, Counter | Histogram | Gauge] = {}
+
+
+def _register(metric):
+    if metric.name in _registry:
+        raise ValueError(f"메트릭 이름 중복: {metric.name}")
+    _registry[metric.name] = metric
+    return metric
+
+
+def counter(name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+    return _register(Counter(name, help, labelnames))
+
+
+def histogram(
+    name: str, help: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = LATENCY_BUCKETS,
+) -> Histogram:
+    return _register(Histogram(name, help, labelnames, buckets))
+
+
+def gauge(
+    name: str, help: str, fn: Callable[[], Any], labelnames: tuple[str, ...] = (),
+) -> Gauge:
+    return _register(Gauge(name, help, fn, labelnames))
+
+
+def _fmt(value: float) -> str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_prometheus() -> str:
+    """등록된 메트릭 전체를 Prometheus 텍스트 노출 형식(0.0.4)으로 직렬화."""
+    lines: list[str] = []
+    for metric in _registry.values():
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            if labels:
+                body = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+                lines.append(f"{name}{{{body}}} {_fmt(value)}")
+            else:
+                lines.append(f"{name} {_fmt(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def snapshot() -> dict:
+    """메트릭 전체를 JSON 직렬화 가능한 dict로 반환 (레이블 값은 쉼표로 연결한 키)."""
+    return {
+        name: {"type": m.kind, "labels": list(m.labelnames), "values": m.to_dict()}
+        for name, m in _registry.items()
+    }
+
+
+def reset() -> None:
+    """카운터·히스토그램 값 초기화 (테스트용)."""
+    for metric in _registry.values():
+        metric.reset()
+
+
+# ── 시세 캐시 / 제공자 메트릭 ─────────────────────────────────────
+
+# 시세 조회가 어느 계층에서 응답됐는지:
+#   memory=TTL 이내 캐시, stale=SWR 만료 직후, warm=시작 적재분, provider=브로커 조회, fallback=대체값
+quote_lookups = counter(
+    "market_quote_lookups_total", "시세 조회 응답 계층별 횟수", ("tier",),
+)
+# 브로커 조회 실패 시 대체값 출처: db=DB 캐시/쓰기 버퍼, memory=만료 메모리 캐시, none=대체값 없음
+quote_fallbacks = counter(
+    "market_quote_fallbacks_total", "시세 대체값 출처별 횟수", ("source",),
+)
+provider_requests = counter(
+    "provider_requests_total", "시세 제공자 호출 수", ("provider", "op"),
+)
+provider_errors = counter(
+    "provider_errors_total", "시세 제공자 호출 실패 수", ("provider", "op"),
+)
+provider_latency = histogram(
+    "provider_request_duration_seconds",
+    "시세 제공자 호출 지연 (pykrx는 호출 한도 대기 제외, KIS는 포함 — 대기만은 rate_limit_wait_seconds)",
+    ("provider", "op"),
+)
+# 우선순위 호출 한도(KIS)의 차선별 대기 시간 — 대기 없이 통과한 호출도 0으로 기록
+rate_limit_wait = histogram(
+    "rate_limit_wait_seconds", "호출 한도 차선별 대기 시간", ("limiter", "lane"),
+)
+rate_limit_queue_depth = gauge(
+    "rate_limit_queue_depth", "호출 한도 차선별 대기 중인 호출 수",
+    lambda: _rate_limit_queue_depths(), ("limiter", "lane"),
+)
+quote_cache_evictions = counter(
+    "quote_cache_evictions_total", "시세 메모리 캐시 LRU 제거 수",
+)
+price_cache_flush_latency = histogram(
+    "price_cache_flush_duration_seconds", "시세 DB 쓰기 지연 버퍼 flush 소요 시간",
+)
+price_cache_flushed_rows = counter(
+    "price_cache_flushed_rows_total", "시세 DB 쓰기 지연 버퍼에서 반영한 행 수",
+)
+price_cache_flush_failures = counter(
+    "price_cache_flush_failures_total", "시세 DB 쓰기 지연 버퍼 flush 실패 수",
+)
+
+
+@contextmanager
+def provider_timer(provider: str, op: str) -> Iterator[None]:
+    """제공자 호출 1회의 횟수·실패·지연 기록. 예외는 그대로 전파한다."""
+    provider_requests.inc(provider, op)
+    t0 = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        provider_errors.inc(provider, op)
+        raise
+    finally:
+        provider_latency.observe(time.perf_counter() - t0, provider, op)
+
+
+def _rate_limit_queue_depths() -> dict[tuple[str, str], int]:
+    from app.broker.throttle import get_queue_depths
+    return get_queue_depths()
+
+
+def _register_cache_gauges() -> None:
+    from app.services.price_cache_service import get_write_behind_stats
+    from app.services.quote_cache import quote_cache
+
+    gauge("quote_cache_entries", "시세 메모리 캐시 엔트리 수", lambda: len(quote_cache))
+    gauge(
+        "price_cache_pending_rows", "시세 DB 쓰기 지연 버퍼 대기 행 수",
+        lambda: get_write_behind_stats()["pending"],
+    )
+
+
+_cache_gauges_registered = False
+
+
+def ensure_cache_gauges() -> None:
+    """캐시 상태 게이지 등록 (서비스 모듈 순환 import를 피하려고 첫 노출 시 1회)."""
+    global _cache_gauges_registered
+    if not _cache_gauges_registered:
+        _cache_gauges_registered = True
+        _register_cache_gauges()
@@ -7,6 +7,8 @@ from app.models.portfolio_snapshot import PortfolioSnapshot
 from app.models.watchlist import WatchlistItem
 from app.models.price_cache import PriceCache
 from app.models.stock_master import StockMaster
+from app.models.daily_bar import DailyBar
+from app.models.minute_bar import MinuteBar
 from app.models.base import Base
 
 __all__ = [
@@ -20,4 +22,6 @@ __all__ = [
     "WatchlistItem",
     "PriceCache",
     "StockMaster",
+    "DailyBar",
+    "MinuteBar",
 ]
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+from sqlalchemy import Date, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class DailyBar(Base):
+    """일봉 OHLCV 저장소 (과거 봉은 종목당 한 번만 수집, 당일 봉만 장중 갱신)"""
+
+    __tablename__ = "daily_bars"
+    # (symbol, market, date) 복합 PK + WITHOUT ROWID: 별도 id/인덱스 없이 키 순서로 저장
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    symbol: Mapped[str] = mapped_column(String(20), primary_key=True)
+    market: Mapped[str] = mapped_column(String(5), primary_key=True)
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    open: Mapped[float] = mapped_column(default=0.0)
+    high: Mapped[float] = mapped_column(default=0.0)
+    low: Mapped[float] = mapped_column(default=0.0)
+    close: Mapped[float] = mapped_column(default=0.0)
+    volume: Mapped[int] = mapped_column(default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    def __repr__(self) -> str:
+        return f"<DailyBar {self.symbol!r} {self.market} {self.date} close={self.close}>"
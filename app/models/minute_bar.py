@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import Date, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class MinuteBar(Base):
+    """당일 1분봉 저장소 (마지막 저장 분 이후만 증분 수집, N분봉은 조회 시 집계)"""
+
+    __tablename__ = "minute_bars"
+    # (symbol, market, date, minute) 복합 PK + WITHOUT ROWID: 종목·일자별 분 순서로 저장
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    symbol: Mapped[str] = mapped_column(String(20), primary_key=True)
+    market: Mapped[str] = mapped_column(String(5), primary_key=True)
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    minute: Mapped[int] = mapped_column(SmallInteger, primary_key=True)  # 자정 기준 분 (09:00 = 540)
+    open: Mapped[float] = mapped_column(default=0.0)
+    high: Mapped[float] = mapped_column(default=0.0)
+    low: Mapped[float] = mapped_column(default=0.0)
+    close: Mapped[float] = mapped_column(default=0.0)
+    volume: Mapped[int] = mapped_column(default=0)
+
+    def __repr__(self) -> str:
+        return f"<MinuteBar {self.symbol!r} {self.market} {self.date} {self.minute // 60:02d}:{self.minute % 60:02d}>"
@@ -1,30 +1,108 @@
 from __future__ import annotations
 
 import logging
+import time
+from datetime import datetime
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 logger = logging.getLogger(__name__)
 
+# 마지막 시세 갱신 시각 (monotonic) — 장 시작 전·마감 후 느린 간격 판단용
+_last_refresh_at: float | None = None
+
 
 async def run_strategy_tick():
-    """Execute all active strategies."""
+    """Execute all active strategies (KRX regular session only)."""
+    from app.services.market_calendar import MarketPhase, market_calendar
+    if market_calendar.phase() is not MarketPhase.REGULAR:
+        return
     from app.strategies.runner import StrategyRunner
     runner = StrategyRunner()
     await runner.run_all()
 
 
 async def refresh_prices():
-    """관심종목 및 보유종목 시세 갱신 (30초 간격)."""
+    """관심종목·보유종목·전략 종목 시세 및 지표 스냅샷 갱신.
+
+    잡은 정규장 간격(기본 30초)으로 깨어나고, 실제 갱신 여부는 KRX 캘린더 시간대로 정한다:
+    정규장은 매번, 장 시작 전·마감 후는 느린 간격(기본 300초), 휴장 시간에는 건너뛴다.
+    """
+    global _last_refresh_at
+    from app.services.market_calendar import market_calendar, refresh_interval
+    interval = refresh_interval(market_calendar.phase())
+    if interval is None:
+        return
+    now = time.monotonic()
+    # 1초 여유: 잡 실행 시각의 미세한 지연으로 한 주기를 건너뛰지 않도록
+    if _last_refresh_at is not None and now - _last_refresh_at < interval - 1:
+        return
+    _last_refresh_at = now
+
     from app.database import async_session
     from app.services.market_service import MarketService
     async with async_session() as session:
         svc = MarketService(session)
         await svc.refresh_watchlist_prices()
+        # 갱신 직후 지표 스냅샷 재계산 — 현재가 API·전략은 이를 O(1)로 조회
+        try:
+            await svc.refresh_indicator_snapshots()
+        except Exception as e:
+            logger.warning("지표 스냅샷 갱신 실패: %s", e)
+
+
+async def sync_realtime_subscriptions():
+    """KIS 실시간 체결가 구독 종목을 관심·보유·전략·스트림 종목과 맞춤 (변경분만 등록/해제)."""
+    from app.broker.kis.realtime import get_realtime_client
+    client = get_realtime_client()
+    if client is None:
+        return
+    from app.database import async_session
+    from app.services.market_service import MarketService
+    async with async_session() as session:
+        keys = await MarketService(session).collect_refresh_keys()
+    await client.set_symbols(symbol for symbol, market in keys if market == "KR")
+
+
+async def flush_price_cache():
+    """쓰기 지연 버퍼의 시세를 DB price_cache 테이블에 일괄 반영."""
+    from app.database import async_session
+    from app.services.price_cache_service import PriceCacheService
+    async with async_session() as session:
+        try:
+            count = await PriceCacheService(session).flush()
+        except Exception as e:
+            logger.warning("시세 DB 캐시 반영 실패 (다음 주기 재시도): %s", e)
+            return
+    if count:
+        logger.debug("시세 DB 캐시 반영: %d건", count)
+
+
+async def prune_quote_cache():
+    """만료 후 오래 지난 시세 메모리 캐시 정리 (대체값은 DB 캐시가 보관)."""
+    from app.config import settings
+    from app.services.quote_cache import quote_cache
+    removed = quote_cache.purge(settings.quote_cache_max_stale)
+    if removed:
+        logger.info("시세 메모리 캐시 정리: %d건 제거 (잔여 %d건)", removed, len(quote_cache))
+
+
+async def prune_minute_bars():
+    """보관 기간이 지난 분봉 삭제."""
+    from app.config import settings
+    from app.database import async_session
+    from app.services.candle_service import CandleService
+    async with async_session() as session:
+        removed = await CandleService(session).prune(settings.minute_bar_retention_days)
+    if removed:
+        logger.info("분봉 저장소 정리: %d건 삭제", removed)
 
 
 async def take_portfolio_snapshot():
-    """Take a daily portfolio snapshot for all accounts."""
+    """Take a daily portfolio snapshot for all accounts (trading days only)."""
+    from app.services.market_calendar import KST, market_calendar
+    if not market_calendar.is_trading_day(datetime.now(KST).date()):
+        return
     from app.database import async_session
     from app.services.portfolio_service import PortfolioService
     async with async_session() as session:
@@ -37,16 +115,14 @@ async def refresh_kis_token():
     from app.config import settings
     if not settings.kis_app_key or not settings.kis_app_secret:
         return
-    from app.broker.factory import _broker_cache
-    from app.schemas.common import TradingMode
-    broker = _broker_cache.get(TradingMode.REAL)
-    if broker is None:
-        return  # 실매매 브로커가 아직 초기화되지 않음
-    client = getattr(broker, "_client", None)
-    if client is None:
-        return
+    from app.schemas.common import MarketDataMode
+    if settings.market_data_mode == MarketDataMode.REPLAY:
+        return  # 재생 모드는 KIS를 호출하지 않음
+    from app.broker.kis.client import get_kis_client
+    # 브로커 래퍼(RecordingBroker 등)와 무관하게 공유 클라이언트의 토큰을 갱신
+    client = get_kis_client()
     try:
-        if client._token.is_expired or client._token.is_expiring_soon:
+        if client.token_expiring_soon:
             await client.force_refresh_token()
             logger.info("KIS 토큰 선제 갱신 완료")
     except Exception as e:
@@ -54,26 +130,62 @@ async def refresh_kis_token():
 
 
 def register_jobs(scheduler: AsyncIOScheduler):
-    # 시세 갱신: 30초 간격 (장중 KST 09:00-15:30 + US 프리마켓 포함)
+    from app.config import settings
+
+    # 시세 갱신: 기본 30초 간격 (장외 시간대는 잡 내부에서 느리게/건너뜀).
+    # 이전 주기가 끝나지 않았으면 겹쳐 실행하지 않고 건너뜀
     scheduler.add_job(
         refresh_prices,
         "interval",
-        seconds=30,
+        seconds=settings.price_refresh_interval,
         id="refresh_prices",
         replace_existing=True,
+        max_instances=1,
+        coalesce=True,
     )
 
-    # Strategy tick every minute during market hours (KST 09:00-15:30)
+    # 시세 DB 캐시 쓰기 지연 반영: 기본 10초 간격
+    scheduler.add_job(
+        flush_price_cache,
+        "interval",
+        seconds=settings.price_cache_flush_interval,
+        id="flush_price_cache",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
+    # KIS 실시간 구독 종목 동기화: 30초 간격 (실시간 수신 비활성 시 즉시 반환)
+    scheduler.add_job(
+        sync_realtime_subscriptions,
+        "interval",
+        seconds=30,
+        id="sync_realtime_subscriptions",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
+    # 시세 메모리 캐시 정리: 10분 간격
+    scheduler.add_job(
+        prune_quote_cache,
+        "interval",
+        minutes=10,
+        id="prune_quote_cache",
+        replace_existing=True,
+    )
+
+    # Strategy tick every minute during market hours (KST 09:00-15:30, gated by the KRX calendar)
     scheduler.add_job(
         run_strategy_tick,
         "cron",
-        hour="9-15",
+        hour="9-16",  # 지연 개장일(수능일 등) 포함, 실제 실행 여부는 캘린더가 판단
         minute="*/1",
         id="strategy_tick",
         replace_existing=True,
     )
 
-    # Daily portfolio snapshot at 16:00 KST (after market close)
+    # Daily portfolio snapshot at 16:00 KST (after market close, skipped on holidays)
     scheduler.add_job(
         take_portfolio_snapshot,
         "cron",
@@ -83,6 +195,16 @@ def register_jobs(scheduler: AsyncIOScheduler):
         replace_existing=True,
     )
 
+    # 분봉 저장소 정리: 매일 18:30 KST (장 마감 후)
+    scheduler.add_job(
+        prune_minute_bars,
+        "cron",
+        hour=18,
+        minute=30,
+        id="prune_minute_bars",
+        replace_existing=True,
+    )
+
     # KIS 토큰 선제 갱신: 30분 간격 (만료 1시간 이내일 때만 실제 갱신)
     scheduler.add_job(
         refresh_kis_token,
@@ -31,6 +31,12 @@ class TradingMode(str, Enum):
     PAPER = "PAPER"
 
 
+class MarketDataMode(str, Enum):
+    LIVE = "LIVE"  # 브로커 실시세
+    RECORD = "RECORD"  # 실시세 + 응답 기록
+    REPLAY = "REPLAY"  # 기록 파일 재생 (모의 체결)
+
+
 class OrderSource(str, Enum):
     MANUAL = "MANUAL"
     STRATEGY = "STRATEGY"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, Field
 
@@ -15,6 +15,37 @@ class PriceResponse(BaseModel):
     market: str = Field("KR", description="시장 구분 (KR/US)")
     ma5: float | None = Field(None, description="5일 이동평균 (MA5)")
     ma20: float | None = Field(None, description="20일 이동평균 (MA20)")
+    stale: bool = Field(False, description="만료된 캐시/DB 대체값 여부 (true면 백그라운드 갱신 중인 지연 시세)")
+
+
+class IndicatorSnapshotResponse(BaseModel):
+    symbol: str = Field(..., description="종목 코드")
+    market: str = Field("KR", description="시장 구분 (KR/US)")
+    as_of: str = Field(..., description="기준 봉 날짜 (장중이면 당일, 현재가 반영)")
+    close: float = Field(..., description="기준 봉 종가 (장중이면 현재가)")
+    bars: int = Field(..., description="계산에 사용한 일봉 수")
+    ma5: float | None = Field(None, description="5일 이동평균 (MA5)")
+    ma20: float | None = Field(None, description="20일 이동평균 (MA20)")
+    rsi14: float | None = Field(None, description="14일 RSI (Wilder)")
+    macd: float | None = Field(None, description="MACD 선 (EMA12 - EMA26)")
+    macd_signal: float | None = Field(None, description="MACD 시그널 선 (MACD의 EMA9)")
+    bb_upper: float | None = Field(None, description="볼린저 밴드 상단 (20일, 2σ)")
+    bb_lower: float | None = Field(None, description="볼린저 밴드 하단 (20일, 2σ)")
+    atr14: float | None = Field(None, description="14일 ATR (평균 실제 변동폭)")
+    computed_at: datetime = Field(..., description="스냅샷 계산 시각 (UTC)")
+    age: float = Field(..., description="계산 후 경과 시간 (초)")
+
+
+class MarketScheduleResponse(BaseModel):
+    now: datetime = Field(..., description="현재 시각 (KST)")
+    phase: str = Field(..., description="현재 시간대 (PRE_MARKET/REGULAR/AFTER_HOURS/CLOSED)")
+    is_trading_day: bool = Field(..., description="오늘이 KRX 거래일인지 여부")
+    session_open: datetime | None = Field(None, description="오늘 정규장 시작 시각 (휴장일이면 null)")
+    session_close: datetime | None = Field(None, description="오늘 정규장 마감 시각 (휴장일이면 null)")
+    next_session_open: datetime = Field(..., description="다음 정규장 시작 시각")
+    refresh_interval: int | None = Field(None, description="현재 시간대의 시세 갱신 간격 (초, null이면 갱신 중지)")
+    strategy_enabled: bool = Field(..., description="전략 자동 실행 여부 (정규장에서만 true)")
+    upcoming_holidays: list[date] = Field(default_factory=list, description="다가오는 평일 휴장일")
 
 
 class PriceCacheResponse(BaseModel):
@@ -30,3 +61,65 @@ class PriceCacheResponse(BaseModel):
     updated_at: datetime | None = Field(None, description="캐시 마지막 갱신 시각 (UTC)")
 
     model_config = {"from_attributes": True}
+
+
+class RefreshStatsResponse(BaseModel):
+    cycles: int = Field(0, description="누적 시세 갱신 주기 수")
+    overruns: int = Field(0, description="잡 간격을 초과한 주기 수")
+    last_started_at: datetime | None = Field(None, description="마지막 주기 시작 시각 (UTC)")
+    last_duration: float = Field(0.0, description="마지막 주기 소요 시간 (초)")
+    max_duration: float = Field(0.0, description="최대 주기 소요 시간 (초)")
+    last_total: int = Field(0, description="마지막 주기 대상 종목 수")
+    last_success: int = Field(0, description="마지막 주기 갱신 성공 종목 수")
+    last_failed: int = Field(0, description="마지막 주기 갱신 실패 종목 수 (대체값 사용 포함)")
+    total_failed: int = Field(0, description="누적 갱신 실패 종목 수")
+    rate_limiters: dict[str, dict] = Field(
+        default_factory=dict,
+        description="제공자별 초당 호출 한도 통계 (rate, acquired, waited, avg_wait, max_wait). "
+                    "KIS는 차선(order/balance/quote)별 queued·acquired·waited·avg_wait·max_wait를 lanes에 담는다",
+    )
+    circuit_breakers: dict[str, dict] = Field(
+        default_factory=dict,
+        description="제공자 엔드포인트별 서킷 브레이커 (state=closed/open/half_open, failures, opens, rejected, retry_in, last_error)",
+    )
+    executors: dict[str, dict] = Field(
+        default_factory=dict,
+        description="차단 호출 전용 스레드 풀 (max_workers, timeout, running, submitted, timeouts)",
+    )
+    market_data_worker: dict | None = Field(
+        None,
+        description="pykrx 워커 프로세스 (pid, alive, rss_mb, calls, spawns, recycles, crashes, timeouts, 비활성 시 null)",
+    )
+    indicator_snapshots: dict = Field(
+        default_factory=dict,
+        description="지표 스냅샷 갱신 통계 (refreshes, last_count, last_duration, size)",
+    )
+    realtime: dict | None = Field(
+        None,
+        description="KIS 실시간 체결가 수신 통계 (connected, subscribed, ticks, connects 등, 비활성 시 null)",
+    )
+    planner: dict = Field(
+        default_factory=dict,
+        description="우선순위 갱신 계획 (budget, deferred=예산 초과로 미룬 종목 수, 계층별 symbols/interval/max_age)",
+    )
+
+
+class QuoteCacheStatsResponse(BaseModel):
+    size: int = Field(..., description="현재 메모리 캐시 엔트리 수")
+    max_entries: int = Field(..., description="최대 엔트리 수 (초과 시 LRU 제거)")
+    ttl: float = Field(..., description="엔트리 유효 시간 (초)")
+    hits: int = Field(0, description="캐시 히트 수")
+    misses: int = Field(0, description="캐시 미스 수 (만료 포함)")
+    evictions: int = Field(0, description="용량 초과로 제거된 엔트리 수")
+    expirations: int = Field(0, description="만료로 미스 처리된 조회 수")
+    hit_rate: float = Field(0.0, description="히트율 (0~1)")
+    broker_calls: int = Field(0, description="실제 브로커 시세 호출 수")
+    coalesced: int = Field(0, description="동시 요청 병합으로 절약된 브로커 호출 수")
+    db_pending: int = Field(0, description="DB 반영 대기 중인 시세 수 (쓰기 지연 버퍼)")
+    db_flushes: int = Field(0, description="DB 일괄 반영(flush) 횟수")
+    db_rows_flushed: int = Field(0, description="DB에 일괄 반영된 누적 행 수")
+    db_flush_failures: int = Field(0, description="DB 일괄 반영 실패 횟수")
+    bus: dict = Field(
+        default_factory=dict,
+        description="시세 이벤트 버스 통계 (subscribers, symbols, published, delivered, dropped, last_seq)",
+    )
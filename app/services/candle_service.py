@@ -0,0 +1,161 @@
+"""분봉 저장소 서비스 — 당일 1분봉을 저장하고 마지막 저장 분 이후만 증분 수집한다.
+
+N분봉(3/5/10/15/30/60)은 저장된 1분봉을 벽시계 구간으로 벡터화 집계해 만들므로
+집계 단위가 달라도 브로커를 다시 호출하지 않는다.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.candles import aggregate_arrays
+from app.config import settings
+from app.models.minute_bar import MinuteBar
+from app.services.market_calendar import KST, market_calendar
+
+logger = logging.getLogger(__name__)
+
+# 마지막 증분 조회 시각 (monotonic): {(symbol, market): t} — 조회 간격 제한용.
+# 간격이 지난 항목은 다시 조회해도 되므로 정리 잡과 항목 수 초과 시 제거한다
+_last_fetch: dict[tuple[str, str], float] = {}
+
+
+def _prune_fetch_times() -> int:
+    """조회 간격(quote_cache_ttl)이 지난 증분 조회 시각 제거. 제거 건수 반환."""
+    cutoff = time.monotonic() - settings.quote_cache_ttl
+    stale = [key for key, t in _last_fetch.items() if t <= cutoff]
+    for key in stale:
+        del _last_fetch[key]
+    return len(stale)
+
+
+def _parse_minute(dt: str) -> tuple[date, int]:
+    """'YYYY-MM-DD HH:MM[:SS]' → (날짜, 자정 기준 분)."""
+    return date.fromisoformat(dt[:10]), int(dt[11:13]) * 60 + int(dt[14:16])
+
+
+def _format(day: date, minute: int) -> str:
+    return f"{day.isoformat()} {minute // 60:02d}:{minute % 60:02d}:00"
+
+
+class CandleService:
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_candles(self, symbol: str, market: str, interval: int, broker) -> list[dict]:
+        """최근 거래일 분봉을 interval분 단위로 반환 (저장소 우선, 새 분봉만 브로커 조회)."""
+        now = datetime.now(KST)
+        day = market_calendar.last_trading_day(now)
+        rows = await self._load(symbol, market, day)
+
+        if self._needs_fetch((symbol, market), rows, day, now):
+            # 마지막 저장 분은 진행 중이던 봉일 수 있으므로 다시 받아 덮어쓴다
+            since = _format(day, rows[-1].minute) if rows else None
+            try:
+                fetched = await broker.get_minute_candles(symbol, market, since)
+            except Exception as e:
+                logger.warning("분봉 증분 조회 실패 %s/%s (저장분 사용): %s", symbol, market, e)
+                fetched = []
+            _last_fetch[(symbol, market)] = time.monotonic()
+            if len(_last_fetch) > settings.quote_cache_max_entries:
+                _prune_fetch_times()
+            if await self._upsert(symbol, market, day, fetched):
+                rows = await self._load(symbol, market, day)
+
+        return self._to_candles(rows, day, interval)
+
+    def _needs_fetch(
+        self, key: tuple[str, str], rows: list[MinuteBar], day: date, now: datetime
+    ) -> bool:
+        sess = market_calendar.session(day)
+        if sess is None:
+            return False
+        if rows:
+            # 장 마감 봉까지 저장됐으면 더 받을 분봉이 없다
+            close_minute = sess.close.hour * 60 + sess.close.minute
+            if rows[-1].minute >= close_minute - 1:
+                return False
+        last = _last_fetch.get(key)
+        return last is None or time.monotonic() - last >= settings.quote_cache_ttl
+
+    async def _load(self, symbol: str, market: str, day: date) -> list[MinuteBar]:
+        result = await self.session.execute(
+            select(MinuteBar)
+            .where(MinuteBar.symbol == symbol, MinuteBar.market == market, MinuteBar.date == day)
+            .order_by(MinuteBar.minute)
+            .execution_options(populate_existing=True)  # Core upsert로 갱신된 마지막 봉 반영
+        )
+        return list(result.scalars().all())
+
+    async def _upsert(self, symbol: str, market: str, day: date, candles: list[dict]) -> int:
+        """브로커 1분봉을 단일 executemany upsert로 저장 (해당 거래일 분봉만). 저장 건수 반환."""
+        rows = []
+        for c in candles:
+            if not c.get("datetime"):
+                continue
+            bar_day, minute = _parse_minute(c["datetime"])
+            if bar_day != day:
+                continue
+            rows.append({
+                "symbol": symbol,
+                "market": market,
+                "date": bar_day,
+                "minute": minute,
+                "open": float(c.get("open", 0.0)),
+                "high": float(c.get("high", 0.0)),
+                "low": float(c.get("low", 0.0)),
+                "close": float(c.get("close", 0.0)),
+                "volume": int(c.get("volume", 0)),
+            })
+        if not rows:
+            return 0
+
+        stmt = sqlite_insert(MinuteBar.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["symbol", "market", "date", "minute"],
+            set_={
+                "open": stmt.excluded.open,
+                "high": stmt.excluded.high,
+                "low": stmt.excluded.low,
+                "close": stmt.excluded.close,
+                "volume": stmt.excluded.volume,
+            },
+        )
+        await self.session.execute(stmt, rows)
+        await self.session.commit()
+        return len(rows)
+
+    @staticmethod
+    def _to_candles(rows: list[MinuteBar], day: date, interval: int) -> list[dict]:
+        if not rows:
+            return []
+        n = len(rows)
+        minutes = np.fromiter((r.minute for r in rows), dtype=np.int64, count=n)
+        cols = [
+            np.fromiter((getattr(r, f) for r in rows), dtype=np.float64, count=n)
+            for f in ("open", "high", "low", "close")
+        ]
+        volume = np.fromiter((r.volume for r in rows), dtype=np.int64, count=n)
+        m, o, h, lo, c, v = aggregate_arrays(minutes, *cols, volume, interval)
+        return [
+            {"datetime": _format(day, mi), "open": op, "high": hi, "low": lw, "close": cl, "volume": vol}
+            for mi, op, hi, lw, cl, vol in zip(
+                m.tolist(), o.tolist(), h.tolist(), lo.tolist(), c.tolist(), v.tolist()
+            )
+        ]
+
+    async def prune(self, keep_days: int) -> int:
+        """keep_days일보다 오래된 분봉과 지난 증분 조회 시각 삭제. 분봉 삭제 건수 반환."""
+        _prune_fetch_times()
+        cutoff = datetime.now(KST).date() - timedelta(days=keep_days)
+        result = await self.session.execute(delete(MinuteBar).where(MinuteBar.date < cutoff))
+        await self.session.commit()
+        return result.rowcount or 0
@@ -0,0 +1,183 @@
+"""일봉 저장소 서비스 — 누락된 거래일만 브로커에서 증분 수집한다.
+
+과거 일봉은 변하지 않으므로 DB(daily_bars)에 한 번 저장한 뒤 재사용하고,
+장중에는 당일 봉만 시세 TTL 간격으로 갱신한다. 거래일 판단은 KRX 캘린더를 따른다.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.bars import BarSeries
+from app.config import settings
+from app.models.daily_bar import DailyBar
+from app.services.market_calendar import KST, market_calendar
+
+logger = logging.getLogger(__name__)
+
+# 장 마감 후 종가 확정까지 당일 봉을 계속 갱신하는 여유 시간
+_CLOSE_SETTLE = timedelta(minutes=30)
+
+# 전체 기간 수집을 이미 시도한 최대 일수: {(symbol, market): days}
+# 상장 기간이 짧아 요청 일수만큼 봉이 없는 종목을 매번 재수집하지 않기 위함
+_backfilled: dict[tuple[str, str], int] = {}
+
+
+def _last_trading_day(now: datetime) -> date:
+    """now(KST) 기준 가장 최근 거래일 (장 시작 전이면 직전 거래일, 휴장일 제외)."""
+    return market_calendar.last_trading_day(now)
+
+
+def is_bar_live(now: datetime) -> bool:
+    """당일 봉이 변할 수 있는 시간대인지 (거래일 정규장 + 종가 확정 여유)."""
+    sess = market_calendar.session(now.date())
+    return sess is not None and sess.open <= now < sess.close + _CLOSE_SETTLE
+
+
+def next_session_open(now: datetime) -> datetime:
+    """now(KST) 이후 가장 가까운 장 시작 시각 (휴장일 제외)."""
+    return market_calendar.next_session_open(now)
+
+
+def _is_today_bar_live(now: datetime, bar_date: date) -> bool:
+    """bar_date가 당일이고 아직 변할 수 있는 시간대인지."""
+    return bar_date == now.date() and is_bar_live(now)
+
+
+def _business_days_between(start: date, end: date) -> int:
+    """start 이후 end까지의 거래일 수 (start 제외, end 포함)."""
+    return market_calendar.trading_days_between(start, end)
+
+
+def _to_series(stored: list[DailyBar]) -> BarSeries:
+    """저장된 ORM 행(날짜 오름차순) → 열 배열."""
+    return BarSeries.from_columns(
+        [b.date for b in stored],
+        [b.open for b in stored],
+        [b.high for b in stored],
+        [b.low for b in stored],
+        [b.close for b in stored],
+        [b.volume for b in stored],
+    )
+
+
+class DailyBarService:
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_bars(self, symbol: str, market: str, days: int, broker) -> BarSeries:
+        """최근 days개 일봉을 날짜 오름차순으로 반환 (저장소 우선, 누락분만 브로커 조회)."""
+        key = (symbol, market)
+        stored = await self._load(symbol, market, days)
+        now = datetime.now(KST)
+        fetch_days, start = self._fetch_window(key, stored, days, now)
+
+        if fetch_days:
+            try:
+                fetched = BarSeries.coerce(await broker.get_daily_prices(
+                    symbol, market, fetch_days, start=start.isoformat() if start else None,
+                ))
+            except Exception as e:
+                if not stored:
+                    raise
+                logger.warning("일봉 증분 조회 실패 %s/%s (저장분 사용): %s", symbol, market, e)
+                fetched = BarSeries.empty()
+            if fetch_days >= days:
+                _backfilled[key] = max(_backfilled.get(key, 0), days)
+            if len(fetched):
+                await self._upsert(symbol, market, fetched)
+                return _to_series(stored).merge(fetched)[-days:]
+
+        return _to_series(stored)
+
+    def _fetch_window(
+        self, key: tuple[str, str], stored: list[DailyBar], days: int, now: datetime
+    ) -> tuple[int, date | None]:
+        """브로커에서 가져올 (일수, 시작일) 결정. 일수가 0이면 저장소만으로 충분.
+
+        시작일이 있으면 일수 대신 그 날짜부터 오늘까지 날짜 구간으로 조회한다
+        (일수 기반 조회는 연휴를 사이에 두면 마지막 저장일을 놓칠 수 있다).
+        """
+        if not stored:
+            return days, None
+
+        # 요청 기간보다 저장된 봉이 적으면 전체 기간 1회 수집 (상장 기간이 짧으면 이후 생략)
+        if len(stored) < days and _backfilled.get(key, 0) < days:
+            return days, None
+
+        last = stored[-1]
+        expected = _last_trading_day(now)
+        if last.date < expected:
+            # 마지막 저장일 이후 누락된 거래일 + 마지막 봉(종가 확정용)
+            return _business_days_between(last.date, expected) + 1, last.date
+
+        updated = last.updated_at
+        if updated.tzinfo is None:
+            updated = updated.replace(tzinfo=timezone.utc)
+
+        # 장중에는 당일 봉만 시세 TTL 간격으로 갱신
+        if _is_today_bar_live(now, last.date):
+            if (now - updated).total_seconds() >= settings.quote_cache_ttl:
+                return 1, None
+            return 0, None
+
+        # 장중에 저장된 뒤 마감+확정 여유 이후 갱신되지 않은 봉은 확정 종가로 재조회
+        sess = market_calendar.session(last.date)
+        if sess is not None and updated < sess.close + _CLOSE_SETTLE:
+            return 1, last.date
+        return 0, None
+
+    async def _load(self, symbol: str, market: str, days: int) -> list[DailyBar]:
+        """저장된 최근 days개 일봉 (날짜 오름차순)."""
+        result = await self.session.execute(
+            select(DailyBar)
+            .where(DailyBar.symbol == symbol, DailyBar.market == market)
+            .order_by(DailyBar.date.desc())
+            .limit(days)
+            .execution_options(populate_existing=True)  # Core upsert로 갱신된 당일 봉 반영
+        )
+        return list(reversed(result.scalars().all()))
+
+    async def _upsert(self, symbol: str, market: str, bars: BarSeries) -> None:
+        """브로커 일봉을 단일 executemany upsert로 저장."""
+        if not len(bars):
+            return
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "symbol": symbol,
+                "market": market,
+                "date": d,
+                "open": o,
+                "high": h,
+                "low": lo,
+                "close": c,
+                "volume": v,
+                "updated_at": now,
+            }
+            for d, o, h, lo, c, v in zip(
+                bars.date.tolist(), bars.open.tolist(), bars.high.tolist(),
+                bars.low.tolist(), bars.close.tolist(), bars.volume.tolist(),
+            )
+        ]
+
+        stmt = sqlite_insert(DailyBar.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["symbol", "market", "date"],
+            set_={
+                "open": stmt.excluded.open,
+                "high": stmt.excluded.high,
+                "low": stmt.excluded.low,
+                "close": stmt.excluded.close,
+                "volume": stmt.excluded.volume,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self.session.execute(stmt, rows)
+        await self.session.commit()
@@ -0,0 +1,140 @@
+"""종목별 최신 지표 스냅샷 (메모리 맵).
+
+시세 갱신 잡이 끝날 때마다 관심·보유·전략 종목의 지표를 한 번 계산해 저장하고,
+현재가 API와 전략은 브로커·일봉 조회 없이 O(1)로 읽는다.
+장중에는 방금 갱신된 현재가를 당일 봉 종가로 반영해 계산한다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    from app.bars import BarSeries
+
+
+@dataclass(frozen=True)
+class IndicatorSnapshot:
+    symbol: str
+    market: str
+    as_of: str  # 기준 봉 날짜 (YYYY-MM-DD 또는 YYYYMMDD)
+    close: float  # 기준 봉 종가 (장중이면 현재가)
+    bars: int  # 계산에 사용한 봉 수
+    ma5: float | None = None
+    ma20: float | None = None
+    ma5_prev: float | None = None  # 직전 봉 기준 (교차 판단용)
+    ma20_prev: float | None = None
+    rsi14: float | None = None
+    macd: float | None = None
+    macd_signal: float | None = None
+    bb_upper: float | None = None
+    bb_lower: float | None = None
+    atr14: float | None = None
+    computed_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # 경과 시간 판단용 (monotonic)
+    computed_mono: float = field(default_factory=time.monotonic, repr=False, compare=False)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.computed_mono
+
+
+# {(symbol, market): IndicatorSnapshot} — 뒤쪽일수록 최근 저장, indicator_snapshot_max_entries개로 제한
+_snapshots: OrderedDict[tuple[str, str], IndicatorSnapshot] = OrderedDict()
+_snapshot_stats: dict = {"refreshes": 0, "last_count": 0, "last_duration": 0.0, "evictions": 0}
+
+
+def get_snapshot(
+    symbol: str, market: str = "KR", max_age: float | None = None
+) -> IndicatorSnapshot | None:
+    """저장된 스냅샷 반환. max_age(초)보다 오래됐으면 None."""
+    snap = _snapshots.get((symbol, market))
+    if snap is None or (max_age is not None and snap.age > max_age):
+        return None
+    return snap
+
+
+def store_snapshot(snap: IndicatorSnapshot) -> None:
+    """저장 (갱신 대상에서 빠져 오래 저장되지 않은 종목부터 한도 초과분 제거)."""
+    key = (snap.symbol, snap.market)
+    _snapshots[key] = snap
+    _snapshots.move_to_end(key)
+    while len(_snapshots) > max(1, settings.indicator_snapshot_max_entries):
+        _snapshots.popitem(last=False)
+        _snapshot_stats["evictions"] += 1
+
+
+def get_snapshot_stats() -> dict:
+    return {**_snapshot_stats, "size": len(_snapshots)}
+
+
+def clear_snapshots() -> None:
+    _snapshots.clear()
+
+
+def compute_snapshot(
+    symbol: str,
+    market: str,
+    bars: BarSeries | list[dict],
+    live_price: float | None = None,
+    today: str | None = None,
+) -> IndicatorSnapshot | None:
+    """일봉(날짜 오름차순)으로 스냅샷 계산.
+
+    live_price와 today(당일 날짜)가 주어지면 당일 봉 종가를 현재가로 교체하고,
+    당일 봉이 아직 없으면 현재가로 당일 봉을 덧붙여 계산한다.
+    """
+    # numpy는 첫 계산 시점에 적재 (앱 기동 시 import 비용 제외)
+    import numpy as np
+
+    from app import indicators
+    from app.bars import BarSeries
+
+    bars = BarSeries.coerce(bars)
+    if not len(bars):
+        return None
+
+    closes, highs, lows = bars.close, bars.high, bars.low
+    as_of = bars.last_date
+
+    if live_price and live_price > 0 and today:
+        if as_of.replace("-", "") == today.replace("-", ""):
+            # 일봉 캐시와 배열을 공유하므로 복사 후 당일 봉 교체
+            closes, highs, lows = closes.copy(), highs.copy(), lows.copy()
+            closes[-1] = live_price
+            highs[-1] = max(highs[-1], live_price)
+            lows[-1] = min(lows[-1], live_price) if lows[-1] > 0 else live_price
+        elif as_of.replace("-", "") < today.replace("-", ""):
+            closes = np.append(closes, live_price)
+            highs = np.append(highs, live_price)
+            lows = np.append(lows, live_price)
+            as_of = today
+
+    ma5 = indicators.sma(closes, 5)
+    ma20 = indicators.sma(closes, 20)
+    macd_line, macd_sig, _ = indicators.macd(closes)
+    _, bb_upper, bb_lower = indicators.bollinger(closes)
+    last = indicators.last_value
+    return IndicatorSnapshot(
+        symbol=symbol,
+        market=market,
+        as_of=as_of,
+        close=float(closes[-1]),
+        bars=len(closes),
+        ma5=last(ma5),
+        ma20=last(ma20),
+        ma5_prev=last(ma5, 2),
+        ma20_prev=last(ma20, 2),
+        rsi14=last(indicators.rsi(closes, 14)),
+        macd=last(macd_line),
+        macd_signal=last(macd_sig),
+        bb_upper=last(bb_upper),
+        bb_lower=last(bb_lower),
+        atr14=last(indicators.atr(highs, lows, closes, 14)),
+    )
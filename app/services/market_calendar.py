@@ -0,0 +1,180 @@
+"""KRX 거래 캘린더 — 휴장일과 거래일별 세션 시각을 미리 계산해 둔다.
+
+시세 갱신·전략 실행·포트폴리오 스냅샷 잡과 일봉 저장소가 같은 캘린더로
+장 운영 여부를 판단한다. 시간대 구분:
+
+- PRE_MARKET  08:00 ~ 정규장 시작 (장 시작 전 동시호가·시간외)
+- REGULAR     정규장 (기본 09:00 ~ 15:30)
+- AFTER_HOURS 정규장 마감 ~ 18:00 (종가 확정·시간외 단일가)
+- CLOSED      그 외 시간, 주말, 휴장일
+
+휴장일 목록에 없는 임시 휴장일은 설정(krx_extra_holidays)으로 추가한다.
+"""
+
+from __future__ import annotations
+
+import enum
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+
+from app.config import settings
+
+KST = timezone(timedelta(hours=9))
+
+_PRE_MARKET_OPEN = time(8, 0)
+_REGULAR_OPEN = time(9, 0)
+_REGULAR_CLOSE = time(15, 30)
+_AFTER_HOURS_CLOSE = time(18, 0)
+
+# KRX 휴장일 (공휴일·대체공휴일·선거일·근로자의 날·연말 휴장)
+_KRX_HOLIDAYS: frozenset[date] = frozenset(
+    date.fromisoformat(d) for d in (
+        # 2025
+        "2025-01-01", "2025-01-27", "2025-01-28", "2025-01-29", "2025-01-30",
+        "2025-03-03", "2025-05-01", "2025-05-05", "2025-05-06", "2025-06-03",
+        "2025-06-06", "2025-08-15", "2025-10-03", "2025-10-06", "2025-10-07",
+        "2025-10-08", "2025-10-09", "2025-12-25", "2025-12-31",
+        # 2026
+        "2026-01-01", "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02",
+        "2026-05-01", "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17",
+        "2026-09-24", "2026-09-25", "2026-10-05", "2026-10-09", "2026-12-25",
+        "2026-12-31",
+        # 2027
+        "2027-01-01", "2027-02-08", "2027-02-09", "2027-03-01", "2027-05-05",
+        "2027-05-13", "2027-08-16", "2027-09-14", "2027-09-15", "2027-09-16",
+        "2027-10-04", "2027-10-11", "2027-12-27", "2027-12-31",
+    )
+)
+
+# 정규장 시각이 다른 날: {날짜: (개장, 마감)} — 새해 첫 거래일 10시 개장, 수능일 1시간 지연
+_SPECIAL_SESSIONS: dict[date, tuple[time, time]] = {
+    date(2025, 1, 2): (time(10, 0), _REGULAR_CLOSE),
+    date(2025, 11, 13): (time(10, 0), time(16, 30)),
+    date(2026, 1, 2): (time(10, 0), _REGULAR_CLOSE),
+    date(2026, 11, 19): (time(10, 0), time(16, 30)),
+    date(2027, 1, 4): (time(10, 0), _REGULAR_CLOSE),
+    date(2027, 11, 18): (time(10, 0), time(16, 30)),
+}
+
+
+class MarketPhase(str, enum.Enum):
+    PRE_MARKET = "PRE_MARKET"
+    REGULAR = "REGULAR"
+    AFTER_HOURS = "AFTER_HOURS"
+    CLOSED = "CLOSED"
+
+
+@dataclass(frozen=True)
+class TradingSession:
+    """거래일 하루의 시간대 경계 (모두 KST)."""
+
+    day: date
+    pre_open: datetime
+    open: datetime
+    close: datetime
+    after_close: datetime
+
+    def phase_at(self, now: datetime) -> MarketPhase:
+        if self.pre_open <= now < self.open:
+            return MarketPhase.PRE_MARKET
+        if self.open <= now < self.close:
+            return MarketPhase.REGULAR
+        if self.close <= now < self.after_close:
+            return MarketPhase.AFTER_HOURS
+        return MarketPhase.CLOSED
+
+
+def _parse_extra_holidays(value: str) -> frozenset[date]:
+    return frozenset(
+        date.fromisoformat(d.strip()) for d in value.split(",") if d.strip()
+    )
+
+
+class MarketCalendar:
+    """KRX 거래일·세션 조회. 세션은 거래일별로 한 번만 계산해 캐시한다."""
+
+    def __init__(self, holidays: frozenset[date] = _KRX_HOLIDAYS):
+        self.holidays = holidays
+        self._sessions: dict[date, TradingSession | None] = {}
+
+    def is_trading_day(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in self.holidays
+
+    def session(self, day: date) -> TradingSession | None:
+        """거래일이면 세션, 휴장일이면 None."""
+        if day in self._sessions:
+            return self._sessions[day]
+        result = None
+        if self.is_trading_day(day):
+            open_t, close_t = _SPECIAL_SESSIONS.get(day, (_REGULAR_OPEN, _REGULAR_CLOSE))
+            result = TradingSession(
+                day=day,
+                pre_open=datetime.combine(day, _PRE_MARKET_OPEN, KST),
+                open=datetime.combine(day, open_t, KST),
+                close=datetime.combine(day, close_t, KST),
+                after_close=datetime.combine(day, _AFTER_HOURS_CLOSE, KST),
+            )
+        self._sessions[day] = result
+        return result
+
+    def phase(self, now: datetime | None = None) -> MarketPhase:
+        now = now or datetime.now(KST)
+        sess = self.session(now.astimezone(KST).date())
+        return sess.phase_at(now) if sess else MarketPhase.CLOSED
+
+    def next_trading_day(self, day: date) -> date:
+        """day 다음 거래일 (day 제외)."""
+        day += timedelta(days=1)
+        while not self.is_trading_day(day):
+            day += timedelta(days=1)
+        return day
+
+    def previous_trading_day(self, day: date) -> date:
+        """day 이전 거래일 (day 제외)."""
+        day -= timedelta(days=1)
+        while not self.is_trading_day(day):
+            day -= timedelta(days=1)
+        return day
+
+    def last_trading_day(self, now: datetime) -> date:
+        """now 기준 가장 최근 거래일 (당일 장 시작 전이면 직전 거래일)."""
+        sess = self.session(now.date())
+        if sess is not None and now >= sess.open:
+            return now.date()
+        return self.previous_trading_day(now.date())
+
+    def next_session_open(self, now: datetime) -> datetime:
+        """now 이후 가장 가까운 정규장 시작 시각."""
+        sess = self.session(now.date())
+        if sess is not None and now < sess.open:
+            return sess.open
+        return self.session(self.next_trading_day(now.date())).open
+
+    def trading_days_between(self, start: date, end: date) -> int:
+        """start 이후 end까지의 거래일 수 (start 제외, end 포함)."""
+        days = 0
+        day = start
+        while day < end:
+            day += timedelta(days=1)
+            if self.is_trading_day(day):
+                days += 1
+        return days
+
+    def upcoming_holidays(self, today: date, limit: int = 5) -> list[date]:
+        """today 이후 평일 휴장일 목록 (가까운 순)."""
+        return sorted(d for d in self.holidays if d >= today and d.weekday() < 5)[:limit]
+
+
+def refresh_interval(phase: MarketPhase) -> int | None:
+    """시간대별 시세 갱신 간격(초). None이면 갱신하지 않는다."""
+    if phase is MarketPhase.REGULAR:
+        return settings.price_refresh_interval
+    if phase in (MarketPhase.PRE_MARKET, MarketPhase.AFTER_HOURS):
+        return settings.price_refresh_interval_slow
+    return None
+
+
+# 프로세스 전역 공유 인스턴스
+market_calendar = MarketCalendar(
+    _KRX_HOLIDAYS | _parse_extra_holidays(settings.krx_extra_holidays)
+)
@@ -1,41 +1,134 @@
-"""시장 데이터 서비스 (메모리 TTL 캐시 + DB 영속 캐시)."""
+"""시장 데이터 서비스 (메모리 LRU/TTL 캐시 + DB 영속 캐시)."""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.broker.base import PriceInfo
 from app.broker.factory import get_broker
+from app.broker.throttle import CircuitOpenError
+from app.config import settings
+from app.metrics import quote_fallbacks, quote_lookups
 from app.schemas.common import TradingMode
+from app.services.price_bus import price_bus
+from app.services.quote_cache import quote_cache
+from app.services.refresh_planner import RefreshTier, recent_views, refresh_planner
+
+if TYPE_CHECKING:
+    from app.bars import BarSeries
 
 logger = logging.getLogger(__name__)
 
-# 메모리 TTL 캐시: {(symbol, market): (PriceInfo, timestamp)}
-_price_cache: dict[tuple[str, str], tuple[PriceInfo, float]] = {}
-CACHE_TTL = 15  # seconds
+# 단일 비행(single-flight): {(symbol, market): 진행 중인 브로커 조회 Task}
+# 같은 키의 동시 캐시 미스는 하나의 브로커 호출을 함께 기다린다.
+_inflight: dict[tuple[str, str], asyncio.Task] = {}
+# 병합 통계: broker_calls=실제 브로커 호출 수, coalesced=병합되어 절약된 호출 수
+_coalesce_stats: dict[str, int] = {"broker_calls": 0, "coalesced": 0}
 
 
-def _add_moving_averages(prices: list[dict]) -> list[dict]:
-    """일별 가격 목록에 MA5/MA20을 계산해 추가.
+def get_coalesce_stats() -> dict[str, int]:
+    """시세 조회 병합 통계 스냅샷 반환."""
+    return dict(_coalesce_stats)
+
+
+# 시세 갱신 잡 주기별 통계 (마지막 주기 + 누적)
+_refresh_stats: dict = {
+    "cycles": 0,
+    "overruns": 0,
+    "last_started_at": None,
+    "last_duration": 0.0,
+    "max_duration": 0.0,
+    "last_total": 0,
+    "last_success": 0,
+    "last_failed": 0,
+    "total_failed": 0,
+}
+
+
+def get_refresh_stats() -> dict:
+    """시세 갱신 잡 통계 스냅샷 반환."""
+    return dict(_refresh_stats)
+
+
+# 시작 직후 일괄 갱신 Task — 진행 중에는 DB에서 적재한 시세를 stale로 즉시 응답
+_warmup_task: asyncio.Task | None = None
+
+
+def _serving_warm_cache() -> bool:
+    """시작 갱신이 진행 중이고, 호출자가 그 갱신 자신이 아닌지."""
+    task = _warmup_task
+    return task is not None and not task.done() and asyncio.current_task() is not task
+
+
+def start_warmup_refresh() -> asyncio.Task:
+    """관심·보유·전략 종목 일괄 갱신 + 지표 스냅샷 계산을 백그라운드로 1회 실행."""
+    global _warmup_task
+
+    async def _run() -> None:
+        from app.database import async_session
+        try:
+            async with async_session() as session:
+                svc = MarketService(session)
+                await svc.refresh_watchlist_prices()
+                await svc.refresh_indicator_snapshots()
+        except Exception as e:
+            logger.warning("시작 시세 갱신 실패 (스케줄러 주기에서 재시도): %s", e)
+
+    _warmup_task = asyncio.ensure_future(_run())
+    return _warmup_task
+
+
+def cancel_warmup_refresh() -> None:
+    """종료 시 진행 중인 시작 갱신 취소."""
+    if _warmup_task is not None and not _warmup_task.done():
+        _warmup_task.cancel()
+
+
+@dataclass
+class _DailyEntry:
+    bars: BarSeries  # ma5/ma20 열 포함, 날짜 오름차순
+    window: int  # 조회한 일수 (이하 요청은 슬라이스로 응답)
+    expires_at: datetime  # 마지막 봉 만료 시각 (KST)
 
-    날짜 오름차순(과거→현재)으로 정렬 후 계산, 동일 순서로 반환.
-    데이터가 부족한 초반 행은 None으로 표시.
-    """
-    if not prices:
-        return prices
 
-    # 날짜 오름차순 정렬 (broker별 정렬 순서 차이 정규화)
-    sorted_prices = sorted(prices, key=lambda x: x["date"])
-    closes = [p["close"] for p in sorted_prices]
+# 일봉 메모리 캐시: {(symbol, market): _DailyEntry} — 종목별 가장 큰 조회 구간만 보관 (LRU)
+_daily_cache: OrderedDict[tuple[str, str], _DailyEntry] = OrderedDict()
+_daily_stats: dict[str, int] = {"hits": 0, "misses": 0, "tail_refreshes": 0}
 
-    for i, p in enumerate(sorted_prices):
-        p["ma5"] = round(sum(closes[i - 4:i + 1]) / 5, 2) if i >= 4 else None
-        p["ma20"] = round(sum(closes[i - 19:i + 1]) / 20, 2) if i >= 19 else None
 
-    return sorted_prices
+# 지표 스냅샷 계산에 쓰는 일봉 수 (MACD 26+9 이상, 전략 러너 기본 조회 구간과 동일)
+_SNAPSHOT_DAYS = 60
+
+
+def _daily_expiry(now: datetime) -> datetime:
+    """마지막 봉 만료 시각: 장중이면 시세 TTL 후, 아니면 다음 장 시작."""
+    from app.services.daily_bar_service import is_bar_live, next_session_open
+    if is_bar_live(now):
+        return now + timedelta(seconds=settings.quote_cache_ttl)
+    return next_session_open(now)
+
+
+def _add_moving_averages(bars: BarSeries) -> BarSeries:
+    """일봉 시계열(날짜 오름차순)에 ma5/ma20 열을 추가.
+
+    데이터가 부족한 초반 행은 NaN (dict 변환 시 None).
+    """
+    import numpy as np
+
+    from app import indicators
+
+    return bars.with_columns(
+        ma5=np.round(indicators.sma(bars.close, 5), 2),
+        ma20=np.round(indicators.sma(bars.close, 20), 2),
+    )
 
 
 class MarketService:
@@ -44,104 +137,440 @@ class MarketService:
         self.session = session
 
     async def get_price(self, symbol: str, market: str = "KR") -> PriceInfo:
-        """시세 조회 (메모리 캐시 → API → DB 저장)."""
-        key = (symbol, market)
-        now = time.monotonic()
+        """시세 조회 (메모리 캐시 → API → DB 저장).
 
+        stale-while-revalidate 활성 시 만료 후 grace 이내 엔트리는
+        stale=True로 즉시 반환하고 백그라운드에서 갱신한다.
+        """
         # 1) 메모리 캐시 확인
-        cached = _price_cache.get(key)
-        if cached and (now - cached[1]) < CACHE_TTL:
-            return cached[0]
-
-        # 2) API에서 실시간 시세 조회
+        cached = quote_cache.get((symbol, market))
+        if cached is not None:
+            quote_lookups.inc("memory")
+            return cached
+
+        # 1-1) stale-while-revalidate: 만료 직후 엔트리는 바로 반환 + 백그라운드 갱신
+        if settings.quote_swr_enabled:
+            entry = quote_cache.peek((symbol, market))
+            if entry is not None:
+                info, age = entry
+                if info.price > 0 and age < quote_cache.ttl + settings.quote_swr_grace:
+                    self._schedule_revalidate(symbol, market)
+                    quote_lookups.inc("stale")
+                    return replace(info, stale=True)
+
+        # 1-2) 시작 갱신 진행 중: DB에서 적재한 마지막 시세로 즉시 응답
+        if _serving_warm_cache():
+            warm = self._peek_warm((symbol, market))
+            if warm is not None:
+                quote_lookups.inc("warm")
+                return warm
+
+        # 2) API에서 실시간 시세 조회 (동시 미스는 하나의 호출로 병합, DB 저장은 쓰기 지연)
         try:
-            broker = await self._get_broker()
-            price_info = await broker.get_current_price(symbol, market)
-            _price_cache[key] = (price_info, now)
-
-            # 3) DB 캐시에 저장 (session이 있을 때만)
-            if self.session and price_info.price > 0:
-                await self._save_to_db(price_info)
-
-            return price_info
-
+            info = await self._fetch_coalesced(symbol, market)
+            quote_lookups.inc("provider")
+            return info
+
+        except CircuitOpenError as e:
+            # 제공자 서킷이 열려 있으면 호출 없이 곧바로 대체값 (주기마다 경고 로그를 남기지 않음)
+            logger.debug("시세 제공자 차단 중 %s/%s: %s", symbol, market, e)
+            return await self._fallback_price(symbol, market)
         except Exception as e:
             logger.warning("API 시세 조회 실패 %s/%s: %s", symbol, market, e)
+            return await self._fallback_price(symbol, market)
+
+    async def get_prices(
+        self, keys: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], PriceInfo]:
+        """여러 종목 시세 일괄 조회 (메모리 캐시 → 브로커 일괄 API → DB 저장).
+
+        캐시 미스 종목은 시장별로 묶어 get_current_prices 1회로 조회하고,
+        조회 실패 종목은 get_price와 동일하게 DB/만료 캐시로 대체한다.
+        """
+        result: dict[tuple[str, str], PriceInfo] = {}
+        misses: dict[str, list[str]] = {}
+        warming = _serving_warm_cache()
+        for key in dict.fromkeys(keys):  # 순서 유지 중복 제거
+            cached = quote_cache.get(key)
+            if cached is not None:
+                quote_lookups.inc("memory")
+            elif warming:
+                cached = self._peek_warm(key)
+                if cached is not None:
+                    quote_lookups.inc("warm")
+            if cached is not None:
+                result[key] = cached
+            else:
+                misses.setdefault(key[1], []).append(key[0])
+
+        for market, symbols in misses.items():
+            fetched: dict[str, PriceInfo] = {}
+            try:
+                broker = await self._get_broker()
+                _coalesce_stats["broker_calls"] += 1
+                fetched = await broker.get_current_prices(symbols, market)
+            except CircuitOpenError as e:
+                logger.debug("시세 제공자 차단 중 %s (%d종목): %s", market, len(symbols), e)
+            except Exception as e:
+                logger.warning("API 일괄 시세 조회 실패 %s (%d종목): %s", market, len(symbols), e)
+
+            for symbol in symbols:
+                info = fetched.get(symbol)
+                if info is not None and info.price > 0:
+                    quote_cache.set((symbol, market), info)
+                    self._save_to_db(info)
+                    price_bus.publish(info)
+                    quote_lookups.inc("provider")
+                    result[(symbol, market)] = info
+                else:
+                    result[(symbol, market)] = await self._fallback_price(symbol, market)
+        return result
+
+    @staticmethod
+    def _peek_warm(key: tuple[str, str]) -> PriceInfo | None:
+        """만료 여부와 무관한 메모리 시세 (stale 표시)."""
+        entry = quote_cache.peek(key)
+        if entry is None or entry[0].price <= 0:
+            return None
+        return replace(entry[0], stale=True)
+
+    async def warm_start(self) -> int:
+        """price_cache 테이블 전체를 한 번의 쿼리로 메모리 캐시에 적재. 적재 건수 반환.
+
+        엔트리 저장 시각은 DB의 updated_at 기준이므로 오래된 시세는 곧바로 만료 상태이며,
+        start_warmup_refresh()의 갱신이 끝날 때까지만 stale 값으로 응답에 쓰인다.
+        """
+        from app.services.price_cache_service import PriceCacheService
+
+        rows = await PriceCacheService(self.session).get_all()
+        now_wall = datetime.now(timezone.utc)
+        now_mono = time.monotonic()
+        # get_all은 최신순 — 오래된 것부터 넣어 용량 초과 시 최신 시세가 남도록
+        for row in reversed(rows):
+            if row.price <= 0:
+                continue
+            updated = row.updated_at
+            if updated.tzinfo is None:
+                updated = updated.replace(tzinfo=timezone.utc)
+            age = max(0.0, (now_wall - updated).total_seconds())
+            quote_cache.set(
+                (row.symbol, row.market),
+                PriceInfo(
+                    symbol=row.symbol,
+                    price=row.price,
+                    change=row.change,
+                    change_pct=row.change_pct,
+                    volume=row.volume,
+                    market=row.market,
+                ),
+                stored_at=now_mono - age,
+            )
+        return len(rows)
+
+    async def _fallback_price(self, symbol: str, market: str) -> PriceInfo:
+        """API 실패 시 DB 캐시 → 만료된 메모리 캐시 순으로 시세 복원."""
+        quote_lookups.inc("fallback")
+        if self.session:
+            db_price = await self._load_from_db(symbol, market)
+            if db_price:
+                quote_fallbacks.inc("db")
+                return db_price
+
+        stale = quote_cache.peek((symbol, market))
+        if stale is not None:
+            quote_fallbacks.inc("memory")
+            return replace(stale[0], stale=True)
+
+        quote_fallbacks.inc("none")
+        return PriceInfo(symbol=symbol, price=0.0, market=market)
+
+    async def get_daily_prices(
+        self, symbol: str, market: str = "KR", days: int = 60, refresh_tail: bool = True,
+    ) -> BarSeries:
+        """일봉 조회 (메모리 캐시 → daily_bars 저장소 → 누락 거래일만 브로커). ma5/ma20 열 포함.
+
+        과거 봉은 만료되지 않고, 마지막 봉만 장중 시세 TTL / 장외 다음 장 시작 시 만료된다.
+        더 큰 구간이 캐시돼 있으면 슬라이스로 응답한다.
+        refresh_tail=False면 만료된 마지막 봉도 그대로 반환한다 (현재가를 따로 반영하는 호출자용).
+        """
+        from app.services.market_calendar import KST
 
-            # 4) API 실패 시 DB 캐시에서 복원
-            if self.session:
-                db_price = await self._load_from_db(symbol, market)
-                if db_price:
-                    return db_price
-
-            # 5) 메모리 캐시에 만료된 데이터라도 있으면 반환
-            if cached:
-                return cached[0]
-
-            return PriceInfo(symbol=symbol, price=0.0, market=market)
+        key = (symbol, market)
+        now = datetime.now(KST)
+        entry = _daily_cache.get(key)
+        if entry is not None and days <= entry.window:
+            _daily_cache.move_to_end(key)
+            if refresh_tail and now >= entry.expires_at:
+                # 과거 봉은 유지하고 마지막 봉(당일)만 다시 조회해 교체
+                tail = await self._fetch_daily(symbol, market, 2)
+                if len(tail):
+                    entry.bars = _add_moving_averages(entry.bars.merge(tail))[-entry.window:]
+                entry.expires_at = _daily_expiry(now)
+                _daily_stats["tail_refreshes"] += 1
+            else:
+                _daily_stats["hits"] += 1
+            return entry.bars[-days:]
+
+        _daily_stats["misses"] += 1
+        bars = _add_moving_averages(await self._fetch_daily(symbol, market, days))
+        if len(bars):
+            _daily_cache[key] = _DailyEntry(bars=bars, window=days, expires_at=_daily_expiry(now))
+            _daily_cache.move_to_end(key)
+            while len(_daily_cache) > settings.daily_cache_max_symbols:
+                _daily_cache.popitem(last=False)
+        return bars
+
+    async def _fetch_daily(self, symbol: str, market: str, days: int) -> BarSeries:
+        """daily_bars 저장소(세션이 있을 때) 또는 브로커에서 일봉 조회 (MA 미포함)."""
+        from app.bars import BarSeries
 
-    async def get_daily_prices(self, symbol: str, market: str = "KR", days: int = 60) -> list[dict]:
         broker = await self._get_broker()
-        prices = await broker.get_daily_prices(symbol, market, days)
-        return _add_moving_averages(prices)
+        if self.session:
+            from app.services.daily_bar_service import DailyBarService
+            try:
+                return await DailyBarService(self.session).get_bars(symbol, market, days, broker)
+            except Exception as e:
+                logger.warning("일봉 저장소 조회 실패 %s/%s, 브로커 직접 조회: %s", symbol, market, e)
+        return BarSeries.coerce(await broker.get_daily_prices(symbol, market, days))
 
     async def get_intraday_candles(
         self, symbol: str, market: str = "KR", interval: int = 1
     ) -> list[dict]:
-        """분봉 데이터 조회 (interval: 1 또는 5분)."""
+        """분봉 데이터 조회 (interval: 집계 단위 분, 벽시계 구간 정렬).
+
+        세션이 있으면 분봉 저장소에서 읽고 새 분봉만 브로커에서 가져온다.
+        """
         broker = await self._get_broker()
+        if self.session:
+            from app.services.candle_service import CandleService
+            try:
+                return await CandleService(self.session).get_candles(symbol, market, interval, broker)
+            except Exception as e:
+                logger.warning("분봉 저장소 조회 실패 %s/%s, 브로커 직접 조회: %s", symbol, market, e)
         return await broker.get_intraday_candles(symbol, market, interval)
 
     async def get_latest_indicators(self, symbol: str, market: str = "KR") -> dict:
         """현재가에 포함할 MA5/MA20 지표를 계산한다. 일별 데이터 마지막 행 기준."""
         try:
-            prices = await self.get_daily_prices(symbol, market, days=21)
-            if prices:
-                last = prices[-1]
-                return {"ma5": last.get("ma5"), "ma20": last.get("ma20")}
+            bars = await self.get_daily_prices(symbol, market, days=21)
+            if len(bars):
+                last = bars[-1]
+                return {"ma5": last["ma5"], "ma20": last["ma20"]}
         except Exception as e:
             logger.debug("지표 계산 실패 %s/%s: %s", symbol, market, e)
         return {"ma5": None, "ma20": None}
 
     async def refresh_watchlist_prices(self) -> int:
-        """관심종목 + 보유종목 시세 일괄 갱신 (스케줄러용). 갱신 건수 반환."""
+        """갱신 대상 종목 중 이번 주기 차례인 종목 시세 일괄 갱신 (스케줄러용). 갱신 건수 반환.
+
+        계층별 주기가 된 종목을 우선순위 순으로 주기당 예산만큼만 조회한다 (refresh_planner).
+        """
         if not self.session:
             return 0
 
-        from app.models.watchlist import WatchlistItem
-        from app.models.position import Position
+        refresh_planner.sync(await self.collect_refresh_tiers())
+        symbols = refresh_planner.take_due()
+        if not symbols:
+            return 0
+
+        # 시장별 일괄 조회 — 종목 수가 아니라 호출 수에 비례하는 비용.
+        # 종목별 호출 제공자(KIS)는 제한 동시성·초당 한도·마감 시간 내에서 실행된다.
+        started_at = datetime.now(timezone.utc)
+        t0 = time.monotonic()
+        prices = await self.get_prices(list(symbols))
+        duration = time.monotonic() - t0
+
+        # DB/만료 캐시 대체값(stale)은 갱신 실패로 집계
+        count = sum(1 for info in prices.values() if info.price > 0 and not info.stale)
+        failed = len(symbols) - count
+        self._record_refresh(started_at, duration, len(symbols), count, failed)
+
+        logger.info(
+            "시세 갱신 완료: %d/%d건 (실패 %d, %.2fs)", count, len(symbols), failed, duration,
+        )
+        return count
+
+    async def collect_refresh_keys(self) -> list[tuple[str, str]]:
+        """주기 갱신 대상 (미체결 주문·전략 → 보유 → 관심 → 최근 조회 순, 중복 제거)."""
+        tiers = await self.collect_refresh_tiers()
+        return sorted(tiers, key=tiers.__getitem__)
+
+    async def collect_refresh_tiers(self) -> dict[tuple[str, str], RefreshTier]:
+        """주기 갱신 대상과 우선순위 계층. 여러 계층에 속한 종목은 가장 높은 계층을 갖는다."""
+        import json
+
         from sqlalchemy import select
 
-        # 관심종목 조회
-        result = await self.session.execute(select(WatchlistItem))
-        watchlist = list(result.scalars().all())
+        from app.models.order import Order
+        from app.models.position import Position
+        from app.models.strategy import StrategyConfig
+        from app.models.watchlist import WatchlistItem
+
+        tiers: dict[tuple[str, str], RefreshTier] = {}
 
-        # 보유종목 조회 (수량 > 0)
+        def _add(key: tuple[str, str], tier: RefreshTier) -> None:
+            if tier < tiers.get(key, RefreshTier.VIEWED + 1):
+                tiers[key] = tier
+
+        # 1) 미체결 주문 + 활성 전략 종목
         result = await self.session.execute(
-            select(Position).where(Position.quantity > 0)
+            select(Order.symbol, Order.market)
+            .where(Order.status.in_(("PENDING", "SUBMITTED", "PARTIALLY_FILLED")))
+            .distinct()
+        )
+        for symbol, market in result.all():
+            _add((symbol, market), RefreshTier.ACTIVE)
+
+        result = await self.session.execute(
+            select(StrategyConfig).where(StrategyConfig.is_active == True)  # noqa: E712
+        )
+        for config in result.scalars().all():
+            try:
+                symbols = json.loads(config.symbols) if isinstance(config.symbols, str) else config.symbols
+            except ValueError:
+                continue
+            for symbol in symbols or []:
+                _add((symbol, config.market), RefreshTier.ACTIVE)
+
+        # 2) 보유종목 (수량 > 0)
+        result = await self.session.execute(select(Position).where(Position.quantity > 0))
+        for pos in result.scalars().all():
+            _add((pos.symbol, pos.market), RefreshTier.POSITION)
+
+        # 3) 관심종목
+        result = await self.session.execute(select(WatchlistItem))
+        for item in result.scalars().all():
+            _add((item.symbol, item.market), RefreshTier.WATCHLIST)
+
+        # 4) 최근 UI 조회 + SSE 등 이벤트 버스 구독 종목 (접속자 수와 무관하게 종목당 한 번만 조회)
+        for key in recent_views():
+            _add(key, RefreshTier.VIEWED)
+        for key in sorted(price_bus.subscribed_keys()):
+            _add(key, RefreshTier.VIEWED)
+        return tiers
+
+    async def refresh_indicator_snapshots(
+        self, keys: list[tuple[str, str]] | None = None
+    ) -> int:
+        """갱신 대상 종목의 지표 스냅샷을 재계산 (시세 갱신 직후 스케줄러가 호출). 계산 건수 반환.
+
+        현재가는 방금 갱신된 메모리 캐시에서, 일봉은 일봉 캐시에서 읽으므로
+        (최초 1회 적재 외에는) 브로커를 호출하지 않는다.
+        """
+        from app.services.daily_bar_service import is_bar_live
+        from app.services.market_calendar import KST
+        from app.services.indicator_snapshot import (
+            _snapshot_stats,
+            compute_snapshot,
+            store_snapshot,
         )
-        positions = list(result.scalars().all())
 
-        # 중복 제거
-        symbols: set[tuple[str, str]] = set()
-        for item in watchlist:
-            symbols.add((item.symbol, item.market))
-        for pos in positions:
-            symbols.add((pos.symbol, pos.market))
+        if keys is None:
+            if not self.session:
+                return 0
+            keys = await self.collect_refresh_keys()
 
+        t0 = time.monotonic()
+        now = datetime.now(KST)
+        today = now.date().isoformat() if is_bar_live(now) else None
         count = 0
-        for symbol, market in symbols:
+        for symbol, market in keys:
             try:
-                await self.get_price(symbol, market)
-                count += 1
+                bars = await self.get_daily_prices(
+                    symbol, market, days=_SNAPSHOT_DAYS, refresh_tail=False,
+                )
             except Exception as e:
-                logger.warning("시세 갱신 실패 %s/%s: %s", symbol, market, e)
+                logger.debug("지표 스냅샷 일봉 조회 실패 %s/%s: %s", symbol, market, e)
+                continue
+            entry = quote_cache.peek((symbol, market))
+            live_price = entry[0].price if entry is not None else None
+            snap = compute_snapshot(symbol, market, bars, live_price, today)
+            if snap is not None:
+                store_snapshot(snap)
+                count += 1
 
-        logger.info("시세 갱신 완료: %d/%d건", count, len(symbols))
+        _snapshot_stats["refreshes"] += 1
+        _snapshot_stats["last_count"] = count
+        _snapshot_stats["last_duration"] = round(time.monotonic() - t0, 3)
         return count
 
+    @staticmethod
+    def _record_refresh(
+        started_at: datetime, duration: float, total: int, success: int, failed: int
+    ) -> None:
+        """갱신 주기 통계 기록. 주기가 잡 간격을 넘기면 overrun으로 집계."""
+        _refresh_stats["cycles"] += 1
+        _refresh_stats["last_started_at"] = started_at
+        _refresh_stats["last_duration"] = round(duration, 3)
+        _refresh_stats["max_duration"] = round(max(_refresh_stats["max_duration"], duration), 3)
+        _refresh_stats["last_total"] = total
+        _refresh_stats["last_success"] = success
+        _refresh_stats["last_failed"] = failed
+        _refresh_stats["total_failed"] += failed
+        if duration > settings.price_refresh_interval:
+            _refresh_stats["overruns"] += 1
+            logger.warning(
+                "시세 갱신 주기 초과: %.2fs > %ds", duration, settings.price_refresh_interval,
+            )
+
     def clear_cache(self):
-        _price_cache.clear()
+        quote_cache.clear()
+        _daily_cache.clear()
+
+    async def _fetch_coalesced(self, symbol: str, market: str) -> PriceInfo:
+        """진행 중인 동일 키 조회가 있으면 합류, 없으면 새로 시작한다."""
+        key = (symbol, market)
+        task = _inflight.get(key)
+        if task is not None:
+            _coalesce_stats["coalesced"] += 1
+        else:
+            task = self._start_flight(key, self._fetch_from_broker(symbol, market))
+        # shield: 호출자가 취소돼도 다른 대기자를 위해 조회는 계속 진행
+        return await asyncio.shield(task)
+
+    def _schedule_revalidate(self, symbol: str, market: str) -> None:
+        """백그라운드 시세 갱신 예약 (동일 키 조회가 진행 중이면 생략)."""
+        key = (symbol, market)
+        if key in _inflight:
+            return
+        self._start_flight(key, self._fetch_from_broker(symbol, market))
+
+    @staticmethod
+    def _start_flight(key: tuple[str, str], coro) -> asyncio.Task:
+        """단일 비행 Task 등록. 완료 시 _inflight에서 제거된다."""
+        task = asyncio.ensure_future(coro)
+        _inflight[key] = task
+
+        def _done(t: asyncio.Task) -> None:
+            if _inflight.get(key) is t:
+                del _inflight[key]
+            if not t.cancelled() and t.exception() is not None:
+                # 대기자가 없는 백그라운드 갱신 실패도 로그로 남긴다
+                logger.debug("시세 조회 실패 %s/%s: %s", key[0], key[1], t.exception())
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _fetch_from_broker(self, symbol: str, market: str) -> PriceInfo:
+        """브로커 시세 조회 후 메모리 캐시·DB 쓰기 버퍼·이벤트 버스에 반영 (단일 비행 Task 본체)."""
+        broker = await self._get_broker()
+        _coalesce_stats["broker_calls"] += 1
+        price_info = await broker.get_current_price(symbol, market)
+        quote_cache.set((symbol, market), price_info)
+        if price_info.price > 0:
+            self._save_to_db(price_info)
+            price_bus.publish(price_info)
+        return price_info
+
+    @staticmethod
+    def ingest(info: PriceInfo, ohlcv: dict | None = None) -> None:
+        """외부 수신 시세(실시간 체결 등)를 메모리 캐시·DB 쓰기 버퍼·이벤트 버스에 반영."""
+        if info.price <= 0:
+            return
+        quote_cache.set((info.symbol, info.market), info)
+        from app.services.price_cache_service import PriceCacheService
+        PriceCacheService.enqueue(info, ohlcv)
+        price_bus.publish(info)
 
     async def _get_broker(self):
         """가격 조회용 브로커 반환."""
@@ -153,19 +582,19 @@ class MarketService:
             pass
         return await get_broker()
 
-    async def _save_to_db(self, info: PriceInfo) -> None:
-        """시세를 DB 캐시에 저장."""
-        try:
-            from app.services.price_cache_service import PriceCacheService
-            svc = PriceCacheService(self.session)
-            await svc.upsert(info)
-        except Exception as e:
-            logger.debug("DB 캐시 저장 실패: %s", e)
+    @staticmethod
+    def _save_to_db(info: PriceInfo) -> None:
+        """시세를 DB 캐시 쓰기 지연 버퍼에 적재 (스케줄러가 주기적으로 일괄 반영)."""
+        from app.services.price_cache_service import PriceCacheService
+        PriceCacheService.enqueue(info)
 
     async def _load_from_db(self, symbol: str, market: str) -> PriceInfo | None:
-        """DB 캐시에서 시세 복원."""
+        """DB 캐시에서 시세 복원 (아직 반영 전인 쓰기 버퍼 우선)."""
         try:
             from app.services.price_cache_service import PriceCacheService
+            pending = PriceCacheService.get_pending(symbol, market)
+            if pending is not None and pending.price > 0:
+                return replace(pending, stale=True)
             svc = PriceCacheService(self.session)
             cache = await svc.get(symbol, market)
             if cache and cache.price > 0:
@@ -176,6 +605,7 @@ class MarketService:
                     change_pct=cache.change_pct,
                     volume=cache.volume,
                     market=cache.market,
+                    stale=True,
                 )
         except Exception as e:
             logger.debug("DB 캐시 조회 실패: %s", e)
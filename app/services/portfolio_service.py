@@ -36,13 +36,16 @@ class PortfolioService:
         symbols = [(p.symbol, p.market) for p in positions]
         name_map = await stock_svc.get_names_bulk(symbols)
 
+        # 시세 일괄 조회 (캐시 미스 종목만 브로커 배치 API 1회)
+        try:
+            price_map = await self.market_svc.get_prices(symbols)
+        except Exception:
+            price_map = {}
+
         enriched = []
         for pos in positions:
-            try:
-                price_info = await self.market_svc.get_price(pos.symbol, pos.market)
-                current_price = price_info.price
-            except Exception:
-                current_price = pos.avg_price
+            price_info = price_map.get((pos.symbol, pos.market))
+            current_price = price_info.price if price_info else pos.avg_price
 
             unrealized_pnl = (current_price - pos.avg_price) * pos.quantity
             pnl_pct = ((current_price / pos.avg_price) - 1) * 100 if pos.avg_price > 0 else 0
@@ -0,0 +1,172 @@
+"""프로세스 내 시세 이벤트 버스 (asyncio pub/sub).
+
+MarketService가 브로커에서 새로 받은 PriceInfo를 한 번씩 발행하면
+구독자(스트리밍 API, 지정가 체결, 가격 알림 등)가 추가 제공자 호출 없이 받는다.
+
+- 종목 필터 구독: 관심 종목 이벤트만 해당 구독자 큐에 넣는다 (전체 구독도 가능)
+- 구독자별 제한 큐: 가득 차면 가장 오래된 이벤트를 버린다 (느린 구독자가 발행자를 막지 않음)
+- 발행·전달·버림 카운터
+- 최근 이벤트 링 버퍼: 재접속한 스트림 구독자가 놓친 이벤트를 seq 이후부터 재생
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from app.broker.base import PriceInfo
+from app.config import settings
+
+SymbolKey = tuple[str, str]  # (symbol, market)
+
+
+@dataclass(frozen=True)
+class PriceEvent:
+    seq: int  # 버스 전역 단조 증가 번호
+    info: PriceInfo
+    published_at: float = field(default_factory=time.time)  # epoch 초
+
+    @property
+    def key(self) -> SymbolKey:
+        return (self.info.symbol, self.info.market)
+
+
+class Subscription:
+    """구독자 한 명의 제한 큐. with 블록을 벗어나면 자동 해지된다."""
+
+    def __init__(self, bus: PriceBus, keys: frozenset[SymbolKey] | None, maxsize: int):
+        self._bus = bus
+        self.keys = keys  # None이면 전체 종목
+        self.queue: asyncio.Queue[PriceEvent] = asyncio.Queue(maxsize=max(1, maxsize))
+        self.delivered = 0
+        self.dropped = 0
+        self.closed = False
+
+    def _offer(self, event: PriceEvent) -> None:
+        """이벤트 적재 (가득 차면 가장 오래된 이벤트를 버림)."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            self._bus.dropped += 1
+        self.queue.put_nowait(event)
+        self.delivered += 1
+
+    async def get(self, timeout: float | None = None) -> PriceEvent | None:
+        """다음 이벤트 대기. timeout이 지나면 None."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self._bus.unsubscribe(self)
+
+    def __enter__(self) -> Subscription:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PriceBus:
+
+    def __init__(self, queue_size: int = 256, history_size: int = 1024):
+        self.queue_size = queue_size
+        self._seq = itertools.count(1)
+        self.last_seq = 0
+        self._history: deque[PriceEvent] = deque(maxlen=history_size)
+        # 종목별 구독자 색인 + 전체 구독자 — 발행 비용은 해당 종목 구독자 수에 비례
+        self._by_key: dict[SymbolKey, set[Subscription]] = {}
+        self._wildcard: set[Subscription] = set()
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        subs = set(self._wildcard)
+        for group in self._by_key.values():
+            subs |= group
+        return len(subs)
+
+    def subscribe(
+        self, keys: Iterable[SymbolKey] | None = None, maxsize: int | None = None
+    ) -> Subscription:
+        """keys 종목(없으면 전체) 구독 시작."""
+        key_set = frozenset(keys) if keys is not None else None
+        sub = Subscription(self, key_set, maxsize or self.queue_size)
+        if key_set is None:
+            self._wildcard.add(sub)
+        else:
+            for key in key_set:
+                self._by_key.setdefault(key, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        if sub.closed:
+            return
+        sub.closed = True
+        if sub.keys is None:
+            self._wildcard.discard(sub)
+            return
+        for key in sub.keys:
+            group = self._by_key.get(key)
+            if group is not None:
+                group.discard(sub)
+                if not group:
+                    del self._by_key[key]
+
+    def has_subscribers(self, key: SymbolKey) -> bool:
+        return bool(self._wildcard) or key in self._by_key
+
+    def subscribed_keys(self) -> set[SymbolKey]:
+        """종목 필터 구독 중인 종목 목록 (전체 구독 제외)."""
+        return set(self._by_key)
+
+    def publish(self, info: PriceInfo) -> PriceEvent:
+        """이벤트 발행 후 해당 종목 구독자 전원에게 전달 (대기 없음)."""
+        event = PriceEvent(seq=next(self._seq), info=info)
+        self.last_seq = event.seq
+        self.published += 1
+        self._history.append(event)
+        for sub in itertools.chain(self._wildcard, self._by_key.get(event.key, ())):
+            sub._offer(event)
+            self.delivered += 1
+        return event
+
+    def replay(
+        self, after_seq: int, keys: Iterable[SymbolKey] | None = None
+    ) -> list[PriceEvent] | None:
+        """after_seq 이후 발행된 이벤트 (keys 필터).
+
+        링 버퍼 밖으로 밀려났거나 알 수 없는 seq(프로세스 재시작 전 번호)면 None.
+        """
+        if after_seq > self.last_seq:
+            return None
+        if after_seq == self.last_seq:
+            return []
+        if not self._history or self._history[0].seq > after_seq + 1:
+            return None
+        key_set = set(keys) if keys is not None else None
+        return [
+            e for e in self._history
+            if e.seq > after_seq and (key_set is None or e.key in key_set)
+        ]
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": self.subscriber_count,
+            "symbols": len(self._by_key),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "last_seq": self.last_seq,
+        }
+
+
+# 프로세스 전역 공유 인스턴스
+price_bus = PriceBus(settings.price_bus_queue_size, settings.price_bus_history_size)
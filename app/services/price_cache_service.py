@@ -1,24 +1,118 @@
-"""시세 캐시 DB 영속화 서비스."""
+"""시세 캐시 DB 영속화 서비스.
+
+시세 조회마다 개별 트랜잭션을 여는 대신 쓰기 지연(write-behind) 버퍼에 모았다가
+주기적으로(또는 종료 시) 단일 트랜잭션의 INSERT ... ON CONFLICT DO UPDATE로 일괄 반영한다.
+"""
 
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import case, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.broker.base import PriceInfo
+from app.metrics import price_cache_flush_failures, price_cache_flush_latency, price_cache_flushed_rows
 from app.models.price_cache import PriceCache
 
 logger = logging.getLogger(__name__)
 
+# 쓰기 지연 버퍼: {(symbol, market): 행 dict} — 같은 종목은 마지막 값만 유지
+_pending: dict[tuple[str, str], dict] = {}
+_flush_stats: dict[str, int] = {"flushes": 0, "rows_flushed": 0, "failures": 0}
+
+
+def get_write_behind_stats() -> dict[str, int]:
+    """쓰기 지연 버퍼 통계 (대기 행 수, flush 횟수, 반영 행 수, 실패 횟수)."""
+    return {"pending": len(_pending), **_flush_stats}
+
 
 class PriceCacheService:
 
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @staticmethod
+    def enqueue(info: PriceInfo, ohlcv: dict | None = None) -> None:
+        """시세를 쓰기 지연 버퍼에 적재 (DB 반영은 flush 시)."""
+        ohlcv = ohlcv or {}
+        _pending[(info.symbol, info.market)] = {
+            "symbol": info.symbol,
+            "market": info.market,
+            "price": info.price,
+            "change": info.change,
+            "change_pct": info.change_pct,
+            "volume": info.volume,
+            "high": ohlcv.get("high", 0.0),
+            "low": ohlcv.get("low", 0.0),
+            "open": ohlcv.get("open", 0.0),
+            "updated_at": datetime.now(timezone.utc),
+        }
+
+    @staticmethod
+    def get_pending(symbol: str, market: str) -> PriceInfo | None:
+        """아직 DB에 반영되지 않은 버퍼 시세 조회 (read-your-writes)."""
+        row = _pending.get((symbol, market))
+        if row is None:
+            return None
+        return PriceInfo(
+            symbol=row["symbol"],
+            price=row["price"],
+            change=row["change"],
+            change_pct=row["change_pct"],
+            volume=row["volume"],
+            market=row["market"],
+        )
+
+    async def flush(self) -> int:
+        """버퍼의 시세를 단일 트랜잭션 executemany upsert로 반영. 반영 행 수 반환.
+
+        실패 시 롤백 후 행을 버퍼에 되돌린다 (그 사이 들어온 최신 값이 우선).
+        """
+        if not _pending:
+            return 0
+        rows = list(_pending.values())
+        _pending.clear()
+
+        table = PriceCache.__table__
+        stmt = sqlite_insert(table)
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.symbol, table.c.market],
+            set_={
+                "price": excluded.price,
+                "change": excluded.change,
+                "change_pct": excluded.change_pct,
+                "volume": excluded.volume,
+                # OHLC 미제공(0) 시 기존 값 유지
+                "high": case((excluded.high > 0, excluded.high), else_=table.c.high),
+                "low": case((excluded.low > 0, excluded.low), else_=table.c.low),
+                "open": case((excluded.open > 0, excluded.open), else_=table.c.open),
+                "updated_at": excluded.updated_at,
+            },
+        )
+        t0 = time.perf_counter()
+        try:
+            await self.session.execute(stmt, rows)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            for row in rows:
+                _pending.setdefault((row["symbol"], row["market"]), row)
+            _flush_stats["failures"] += 1
+            price_cache_flush_failures.inc()
+            raise
+        finally:
+            price_cache_flush_latency.observe(time.perf_counter() - t0)
+
+        _flush_stats["flushes"] += 1
+        _flush_stats["rows_flushed"] += len(rows)
+        price_cache_flushed_rows.inc(amount=len(rows))
+        return len(rows)
+
     async def upsert(self, info: PriceInfo, ohlcv: dict | None = None) -> PriceCache:
         """시세 정보를 DB에 저장 (있으면 갱신, 없으면 생성)."""
         result = await self.session.execute(
@@ -0,0 +1,110 @@
+"""시세 메모리 캐시 (LRU + TTL, 최대 엔트리 수 제한).
+
+검색 등으로 조회된 종목이 메모리에 무한히 쌓이지 않도록
+최대 엔트리 수를 넘으면 가장 오래 사용되지 않은 종목부터 제거한다.
+만료된 엔트리는 즉시 지우지 않고 API 장애 시 대체값(peek)으로 사용한다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+from app.broker.base import PriceInfo
+from app.config import settings
+from app.metrics import quote_cache_evictions
+
+CacheKey = tuple[str, str]  # (symbol, market)
+
+
+class QuoteCache:
+    """(symbol, market) → PriceInfo LRU 캐시. 엔트리별 TTL과 히트/미스 통계를 가진다."""
+
+    def __init__(self, max_entries: int = 2000, ttl: float = 15.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # {key: (PriceInfo, 저장 시각(monotonic), TTL)} — 뒤쪽일수록 최근 사용
+        self._data: OrderedDict[CacheKey, tuple[PriceInfo, float, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._data
+
+    def get(self, key: CacheKey) -> PriceInfo | None:
+        """TTL 이내 엔트리만 반환 (히트 시 LRU 순서 갱신)."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, stored_at, ttl = entry
+        if time.monotonic() - stored_at >= ttl:
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: CacheKey) -> tuple[PriceInfo, float] | None:
+        """만료 여부와 무관하게 (PriceInfo, 경과 초)를 반환. 통계·LRU 순서에 영향 없음."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        return entry[0], time.monotonic() - entry[1]
+
+    def set(
+        self,
+        key: CacheKey,
+        value: PriceInfo,
+        ttl: float | None = None,
+        stored_at: float | None = None,
+    ) -> None:
+        """엔트리 저장. 용량 초과 시 가장 오래 사용되지 않은 엔트리부터 제거."""
+        self._data[key] = (
+            value,
+            time.monotonic() if stored_at is None else stored_at,
+            self.ttl if ttl is None else ttl,
+        )
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+            quote_cache_evictions.inc()
+
+    def purge(self, max_age: float) -> int:
+        """저장 후 max_age초가 지난 엔트리 제거. 제거 건수 반환."""
+        now = time.monotonic()
+        stale = [k for k, (_, stored_at, _) in self._data.items() if now - stored_at >= max_age]
+        for key in stale:
+            del self._data[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        """캐시 크기 및 히트/미스/제거 통계."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# 프로세스 전역 공유 인스턴스 (MarketService·스케줄러·API가 함께 사용)
+quote_cache = QuoteCache(
+    max_entries=settings.quote_cache_max_entries,
+    ttl=settings.quote_cache_ttl,
+)
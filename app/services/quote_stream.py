@@ -0,0 +1,119 @@
+"""SSE 시세 스트림 — 이벤트 버스 구독을 text/event-stream 프레임으로 변환한다.
+
+연결마다 DB 세션·종목명 조회·지표 계산 없이 버스 이벤트만 전달하므로
+여러 클라이언트가 종목당 하나의 상위 조회(스케줄러 갱신 / 단일 비행)를 공유한다.
+
+프레임 형식:
+- event: quote — 압축 JSON {"s", "m", "p", "c", "r", "v"} 중 직전 전송 대비 바뀐 필드만
+  (s=종목, m=시장, p=현재가, c=변동액, r=변동률, v=거래량; s·m은 항상 포함)
+- id: 버스 seq — 재접속 시 Last-Event-ID로 놓친 이벤트를 재생
+- ": ping" 주석 — 하트비트 (프록시 유휴 연결 끊김 방지)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from app.broker.base import PriceInfo
+from app.services.price_bus import PriceBus, PriceEvent, SymbolKey, price_bus
+from app.services.quote_cache import quote_cache
+
+
+def _compact(info: PriceInfo) -> dict:
+    return {
+        "s": info.symbol,
+        "m": info.market,
+        "p": info.price,
+        "c": info.change,
+        "r": info.change_pct,
+        "v": info.volume,
+    }
+
+
+def _delta(record: dict, previous: dict | None) -> dict | None:
+    """직전 전송 대비 변경 필드만 추림. 바뀐 값이 없으면 None."""
+    if previous is None:
+        return record
+    changed = {k: v for k, v in record.items() if k in ("s", "m") or previous.get(k) != v}
+    return changed if len(changed) > 2 else None
+
+
+def _frame(data: dict, event_id: int | None = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append("event: quote")
+    lines.append("data: " + json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+    return "\n".join(lines) + "\n\n"
+
+
+async def _prime(keys: list[SymbolKey]) -> None:
+    """캐시에 없는 종목 시세를 단일 비행 조회로 채움 (동시 접속자끼리 호출 공유)."""
+    from app.services.market_service import MarketService
+
+    missing = [k for k in keys if quote_cache.peek(k) is None]
+    if not missing:
+        return
+    svc = MarketService()
+    await asyncio.gather(*(svc.get_price(s, m) for s, m in missing), return_exceptions=True)
+
+
+async def quote_event_stream(
+    keys: list[SymbolKey],
+    *,
+    last_event_id: int | None = None,
+    heartbeat: float = 15.0,
+    is_disconnected: Callable[[], Awaitable[bool]] | None = None,
+    bus: PriceBus = price_bus,
+) -> AsyncIterator[str]:
+    """keys 종목 시세 SSE 프레임 생성기.
+
+    last_event_id가 있으면 버스 링 버퍼에서 놓친 이벤트를 재생하고,
+    재생 범위를 벗어났거나 처음 접속이면 현재 캐시 시세 스냅샷부터 보낸다.
+    """
+    sent: dict[SymbolKey, dict] = {}
+
+    def _encode(info: PriceInfo, event_id: int | None) -> str | None:
+        key = (info.symbol, info.market)
+        record = _compact(info)
+        data = _delta(record, sent.get(key))
+        if data is None:
+            return None
+        sent[key] = record
+        return _frame(data, event_id)
+
+    # 구독을 먼저 시작해 스냅샷/재생과 실시간 이벤트 사이의 누락을 막는다
+    with bus.subscribe(keys) as sub:
+        yield f"retry: 3000\n: connected seq={bus.last_seq}\n\n"
+
+        replayed = bus.replay(last_event_id, keys) if last_event_id is not None else None
+        if replayed is not None:
+            high_water = bus.last_seq  # 재생 범위 (이후 발행분은 구독 큐로 전달)
+            for event in replayed:
+                frame = _encode(event.info, event.seq)
+                if frame:
+                    yield frame
+        else:
+            await _prime(keys)
+            high_water = bus.last_seq  # 스냅샷에 반영된 이벤트까지 (전송 중 발행분은 이후 전달)
+            for key in keys:
+                entry = quote_cache.peek(key)
+                if entry is not None and entry[0].price > 0:
+                    frame = _encode(entry[0], None)
+                    if frame:
+                        yield frame
+
+        while True:
+            event: PriceEvent | None = await sub.get(timeout=heartbeat)
+            if is_disconnected is not None and await is_disconnected():
+                break
+            if event is None:
+                yield ": ping\n\n"
+                continue
+            if event.seq <= high_water:
+                continue  # 재생/스냅샷으로 이미 보낸 이벤트
+            frame = _encode(event.info, event.seq)
+            if frame:
+                yield frame
@@ -0,0 +1,163 @@
+"""우선순위 계층별 시세 갱신 계획 (단일 우선순위 큐).
+
+갱신 대상 종목마다 계층을 매기고, 계층별 주기로 다음 갱신 시각을 정해 하나의 힙에 넣는다.
+주기마다 갱신 시각이 된 종목을 꺼내 (계층, 갱신 예정 시각) 순으로 호출 예산만큼만 갱신하고,
+예산을 넘는 종목은 예정 시각을 유지한 채 다음 주기로 미룬다.
+따라서 제공자 예산이 부족하면 관심·조회 종목이 먼저 밀리고, 손익에 직결되는 종목은 항상 가장 신선하다.
+
+    1 = 미체결 주문·활성 전략 종목
+    2 = 보유 종목
+    3 = 관심 종목
+    4 = 최근 UI 조회 종목 (시세 조회 API, SSE 스트림 구독)
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from collections.abc import Mapping
+from enum import IntEnum
+
+from app.config import settings
+
+CacheKey = tuple[str, str]  # (symbol, market)
+
+
+class RefreshTier(IntEnum):
+    ACTIVE = 1  # 미체결 주문·활성 전략
+    POSITION = 2  # 보유
+    WATCHLIST = 3  # 관심
+    VIEWED = 4  # 최근 조회
+
+
+# 최근 UI 조회 기록: {(symbol, market): 마지막 조회 시각(monotonic)}
+_recent_views: dict[CacheKey, float] = {}
+
+
+def note_view(symbol: str, market: str) -> None:
+    """UI에서 종목 시세를 조회했음을 기록 (계층 4 갱신 대상)."""
+    now = time.monotonic()
+    _recent_views[(symbol, market)] = now
+    if len(_recent_views) > settings.quote_cache_max_entries:
+        _prune_views(now)
+
+
+def _prune_views(now: float) -> None:
+    expired = [k for k, t in _recent_views.items() if now - t >= settings.price_view_ttl]
+    for key in expired:
+        del _recent_views[key]
+
+
+def recent_views() -> list[CacheKey]:
+    """조회 후 price_view_ttl초가 지나지 않은 종목 (최근 조회순)."""
+    _prune_views(time.monotonic())
+    return sorted(_recent_views, key=_recent_views.__getitem__, reverse=True)
+
+
+class RefreshPlanner:
+    """계층별 주기와 주기당 예산으로 갱신할 종목을 고르는 우선순위 큐.
+
+    힙 엔트리: (갱신 예정 시각, 계층, 일련번호, 키). 종목의 계층이 바뀌거나 대상에서 빠지면
+    기존 엔트리는 지우지 않고 일련번호 불일치로 무효 처리한다 (lazy deletion).
+    """
+
+    def __init__(self, intervals: Mapping[RefreshTier, float], budget: int):
+        self.intervals = dict(intervals)
+        self.budget = budget
+        self._heap: list[tuple[float, int, int, CacheKey]] = []
+        # {키: (계층, 유효 엔트리 일련번호)}
+        self._current: dict[CacheKey, tuple[RefreshTier, int]] = {}
+        # {키: 마지막 갱신 시각(monotonic)}
+        self._refreshed_at: dict[CacheKey, float] = {}
+        self._seq = 0
+        self.deferred = 0  # 마지막 주기에 예산 초과로 미룬 종목 수
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def tier_of(self, key: CacheKey) -> RefreshTier | None:
+        cur = self._current.get(key)
+        return cur[0] if cur else None
+
+    def _push(self, key: CacheKey, tier: RefreshTier, due: float) -> None:
+        self._seq += 1
+        self._current[key] = (tier, self._seq)
+        heapq.heappush(self._heap, (due, int(tier), self._seq, key))
+
+    def sync(self, tiers: Mapping[CacheKey, RefreshTier], now: float | None = None) -> None:
+        """갱신 대상·계층 반영. 새 종목은 즉시, 계층이 바뀐 종목은 마지막 갱신 + 새 주기로 예약."""
+        now = time.monotonic() if now is None else now
+        for key in [k for k in self._current if k not in tiers]:
+            del self._current[key]
+            self._refreshed_at.pop(key, None)
+
+        for key, tier in tiers.items():
+            cur = self._current.get(key)
+            if cur is not None and cur[0] == tier:
+                continue
+            last = self._refreshed_at.get(key)
+            self._push(key, tier, now if last is None else last + self.intervals[tier])
+
+        # 무효 엔트리가 많이 쌓이면 힙 재구성
+        if len(self._heap) > 2 * len(self._current) + 64:
+            self._heap = [e for e in self._heap if self._is_live(e)]
+            heapq.heapify(self._heap)
+
+    def _is_live(self, entry: tuple[float, int, int, CacheKey]) -> bool:
+        cur = self._current.get(entry[3])
+        return cur is not None and cur[1] == entry[2]
+
+    def take_due(self, now: float | None = None) -> list[CacheKey]:
+        """이번 주기에 갱신할 종목을 우선순위 순으로 반환하고 다음 주기로 재예약.
+
+        예산(budget, 0이면 무제한)을 넘는 종목은 예정 시각을 유지해 다음 주기 맨 앞에 선다.
+        """
+        now = time.monotonic() if now is None else now
+        due: list[tuple[float, int, int, CacheKey]] = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                due.append(entry)
+
+        # 계층 우선, 같은 계층은 오래 기다린 종목 우선
+        due.sort(key=lambda e: (e[1], e[0]))
+        limit = self.budget if self.budget > 0 else len(due)
+        selected, overflow = due[:limit], due[limit:]
+        for entry in overflow:
+            heapq.heappush(self._heap, entry)
+        self.deferred = len(overflow)
+
+        keys = []
+        for _, tier, _, key in selected:
+            self._refreshed_at[key] = now
+            self._push(key, RefreshTier(tier), now + self.intervals[RefreshTier(tier)])
+            keys.append(key)
+        return keys
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._current.clear()
+        self._refreshed_at.clear()
+        self.deferred = 0
+
+    def stats(self, now: float | None = None) -> dict:
+        """계층별 종목 수와 최대 경과 시간(마지막 갱신 후, 미갱신 종목 제외)."""
+        now = time.monotonic() if now is None else now
+        tiers: dict[str, dict] = {
+            t.name.lower(): {"symbols": 0, "interval": self.intervals[t], "max_age": 0.0}
+            for t in RefreshTier
+        }
+        for key, (tier, _) in self._current.items():
+            row = tiers[tier.name.lower()]
+            row["symbols"] += 1
+            last = self._refreshed_at.get(key)
+            if last is not None:
+                row["max_age"] = round(max(row["max_age"], now - last), 1)
+        return {"budget": self.budget, "deferred": self.deferred, "tiers": tiers}
+
+
+# 시세 갱신 잡이 공유하는 프로세스 전역 인스턴스
+refresh_planner = RefreshPlanner(
+    dict(zip(RefreshTier, settings.price_refresh_tier_intervals)),
+    budget=settings.price_refresh_budget,
+)
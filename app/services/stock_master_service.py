@@ -1,6 +1,6 @@
 """종목 마스터 동기화 및 검색 서비스.
 
-pykrx를 사용하여 KRX 전체 상장 종목을 DB에 동기화하고,
+pykrx(시세 워커 프로세스)를 사용하여 KRX 전체 상장 종목을 DB에 동기화하고,
 초성 검색을 포함한 종목 검색 기능을 제공한다.
 """
 
@@ -19,6 +19,8 @@ logger = logging.getLogger(__name__)
 
 # 동기화 주기 (7일)
 _SYNC_INTERVAL_DAYS = 7
+# 시장별 종목 목록+종목명 수집 제한 시간 (종목 수천 건을 워커에서 한 번에 조회)
+_SYNC_TIMEOUT = 600.0  # seconds
 
 
 class StockMasterService:
@@ -49,32 +51,25 @@ class StockMasterService:
         logger.info("종목 마스터 동기화 완료")
 
     async def sync_kr_stocks(self) -> int:
-        """pykrx로 KOSPI/KOSDAQ 전종목을 수집하여 DB에 upsert한다."""
-        try:
-            from pykrx import stock as pykrx_stock
-        except ImportError:
-            logger.warning("pykrx가 설치되지 않아 KR 종목 동기화를 건너뜁니다.")
-            return 0
+        """pykrx로 KOSPI/KOSDAQ 전종목을 수집하여 DB에 upsert한다.
+
+        종목 목록과 종목명 조회는 시세 워커에서 시장별 요청 1회로 처리한다.
+        """
+        from app.broker.free.worker_client import call_pykrx
 
         count = 0
-        today = datetime.now().strftime("%Y%m%d")
 
         for market_name in ("KOSPI", "KOSDAQ"):
             try:
-                tickers = pykrx_stock.get_market_ticker_list(today, market=market_name)
+                rows = await call_pykrx("tickers", {"market": market_name}, timeout=_SYNC_TIMEOUT)
+            except ImportError:
+                logger.warning("pykrx가 설치되지 않아 KR 종목 동기화를 건너뜁니다.")
+                return 0
             except Exception:
                 logger.exception("pykrx %s 종목 목록 조회 실패", market_name)
                 continue
 
-            for ticker in tickers:
-                try:
-                    name = pykrx_stock.get_market_ticker_name(ticker)
-                except Exception:
-                    continue
-
-                if not name:
-                    continue
-
+            for ticker, name in rows:
                 await self._upsert(symbol=ticker, market="KR", name=name, sector=market_name)
                 count += 1
 
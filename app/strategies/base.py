@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.bars import BarSeries
+    from app.services.indicator_snapshot import IndicatorSnapshot
 
 
 @dataclass
@@ -35,12 +39,24 @@ class AbstractStrategy(ABC):
         self,
         symbol: str,
         market: str,
-        daily_prices: list[dict],
+        daily_prices: BarSeries,
         current_price: float,
         position_qty: int,
+        snapshot: IndicatorSnapshot | None = None,
     ) -> Signal:
-        """Evaluate strategy and return a signal."""
+        """Evaluate strategy and return a signal.
+
+        daily_prices is oldest-first; use its column arrays (daily_prices.close, ...).
+        snapshot is the scheduler's precomputed indicator snapshot, if fresh.
+        """
         ...
 
+    def needs_daily_prices(self, snapshot: IndicatorSnapshot | None) -> bool:
+        """Whether evaluate() needs daily_prices given the available snapshot.
+
+        The runner skips loading daily bars when this returns False.
+        """
+        return True
+
     def get_param(self, key: str, default: Any = None) -> Any:
         return self.params.get(key, default)
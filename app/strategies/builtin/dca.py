@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from app.bars import BarSeries
+from app.services.indicator_snapshot import IndicatorSnapshot
 from app.strategies.base import AbstractStrategy, Signal
 
 
@@ -14,13 +16,17 @@ class DCAStrategy(AbstractStrategy):
 
     name = "DCA"
 
+    def needs_daily_prices(self, snapshot: IndicatorSnapshot | None) -> bool:
+        return False
+
     async def evaluate(
         self,
         symbol: str,
         market: str,
-        daily_prices: list[dict],
+        daily_prices: BarSeries,
         current_price: float,
         position_qty: int,
+        snapshot: IndicatorSnapshot | None = None,
     ) -> Signal:
         if current_price <= 0:
             return Signal(symbol=symbol, market=market, reason="No price data")
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from app import indicators
+from app.bars import BarSeries
+from app.services.indicator_snapshot import IndicatorSnapshot
 from app.strategies.base import AbstractStrategy, Signal
 
 
@@ -16,31 +19,52 @@ class MovingAverageStrategy(AbstractStrategy):
 
     name = "MOVING_AVERAGE"
 
+    def _from_snapshot(self, snapshot: IndicatorSnapshot | None) -> tuple[float, ...] | None:
+        """(short_now, short_prev, long_now, long_prev) from the snapshot (SMA5/SMA20 only)."""
+        if snapshot is None:
+            return None
+        if (self.get_param("short_period", 5), self.get_param("long_period", 20)) != (5, 20):
+            return None
+        values = (snapshot.ma5, snapshot.ma5_prev, snapshot.ma20, snapshot.ma20_prev)
+        return None if any(v is None for v in values) else values
+
+    def needs_daily_prices(self, snapshot: IndicatorSnapshot | None) -> bool:
+        return self._from_snapshot(snapshot) is None
+
     async def evaluate(
         self,
         symbol: str,
         market: str,
-        daily_prices: list[dict],
+        daily_prices: BarSeries,
         current_price: float,
         position_qty: int,
+        snapshot: IndicatorSnapshot | None = None,
     ) -> Signal:
         short_period = self.get_param("short_period", 5)
         long_period = self.get_param("long_period", 20)
         quantity = self.get_param("quantity", 10)
 
-        if len(daily_prices) < long_period + 1:
+        cached = self._from_snapshot(snapshot)
+        if cached is not None:
+            short_ma_now, short_ma_prev, long_ma_now, long_ma_prev = cached
+        elif len(daily_prices) < long_period + 1:
             return Signal(
                 symbol=symbol, market=market,
                 reason=f"Not enough data ({len(daily_prices)}/{long_period + 1})",
             )
-
-        # Calculate MAs (prices are newest-first, reverse for chronological)
-        closes = [p["close"] for p in reversed(daily_prices)]
-
-        short_ma_now = sum(closes[-short_period:]) / short_period
-        short_ma_prev = sum(closes[-short_period - 1:-1]) / short_period
-        long_ma_now = sum(closes[-long_period:]) / long_period
-        long_ma_prev = sum(closes[-long_period - 1:-1]) / long_period
+        else:
+            # Prices are chronological (MarketService.get_daily_prices sorts oldest-first)
+            closes = daily_prices.close
+            short_ma = indicators.memoize(
+                (symbol, market), daily_prices.version, "sma", (short_period,),
+                lambda: indicators.sma(closes, short_period),
+            )
+            long_ma = indicators.memoize(
+                (symbol, market), daily_prices.version, "sma", (long_period,),
+                lambda: indicators.sma(closes, long_period),
+            )
+            short_ma_now, short_ma_prev = float(short_ma[-1]), float(short_ma[-2])
+            long_ma_now, long_ma_prev = float(long_ma[-1]), float(long_ma[-2])
 
         # Golden cross: short crosses above long
         if short_ma_prev <= long_ma_prev and short_ma_now > long_ma_now:
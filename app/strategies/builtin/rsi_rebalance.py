@@ -2,27 +2,12 @@
 
 from __future__ import annotations
 
+from app import indicators
+from app.bars import BarSeries
+from app.services.indicator_snapshot import IndicatorSnapshot
 from app.strategies.base import AbstractStrategy, Signal
 
 
-def _compute_rsi(closes: list[float], period: int = 14) -> float:
-    """Compute RSI from a chronological list of close prices."""
-    if len(closes) < period + 1:
-        return 50.0  # neutral default
-
-    deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
-    recent = deltas[-period:]
-
-    gains = [d for d in recent if d > 0]
-    losses = [-d for d in recent if d < 0]
-
-    avg_gain = sum(gains) / period if gains else 0.0
-    avg_loss = sum(losses) / period if losses else 0.0001
-
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
-
-
 class RSIRebalanceStrategy(AbstractStrategy):
     """Buy when RSI is oversold, sell when overbought.
 
@@ -35,27 +20,43 @@ class RSIRebalanceStrategy(AbstractStrategy):
 
     name = "RSI_REBALANCE"
 
+    def needs_daily_prices(self, snapshot: IndicatorSnapshot | None) -> bool:
+        return not (
+            snapshot is not None
+            and snapshot.rsi14 is not None
+            and self.get_param("rsi_period", 14) == 14
+        )
+
     async def evaluate(
         self,
         symbol: str,
         market: str,
-        daily_prices: list[dict],
+        daily_prices: BarSeries,
         current_price: float,
         position_qty: int,
+        snapshot: IndicatorSnapshot | None = None,
     ) -> Signal:
         rsi_period = self.get_param("rsi_period", 14)
         oversold = self.get_param("oversold", 30)
         overbought = self.get_param("overbought", 70)
         quantity = self.get_param("quantity", 10)
 
-        if len(daily_prices) < rsi_period + 2:
+        if not self.needs_daily_prices(snapshot):
+            rsi = snapshot.rsi14
+        elif len(daily_prices) < rsi_period + 2:
             return Signal(
                 symbol=symbol, market=market,
                 reason=f"Not enough data ({len(daily_prices)}/{rsi_period + 2})",
             )
-
-        closes = [p["close"] for p in reversed(daily_prices)]
-        rsi = _compute_rsi(closes, rsi_period)
+        else:
+            # Prices are chronological (MarketService.get_daily_prices sorts oldest-first)
+            rsi_values = indicators.memoize(
+                (symbol, market), daily_prices.version, "rsi", (rsi_period,),
+                lambda: indicators.rsi(daily_prices.close, rsi_period),
+            )
+            rsi = indicators.last_value(rsi_values)
+            if rsi is None:
+                rsi = 50.0  # neutral default
 
         if rsi < oversold:
             return Signal(
@@ -7,11 +7,14 @@ import logging
 
 from sqlalchemy import select
 
+from app.bars import BarSeries
+from app.config import settings
 from app.database import async_session
 from app.models.position import Position
 from app.models.strategy import StrategyConfig
 from app.schemas.common import Market, OrderSide, OrderType, TradingMode
 from app.schemas.order import OrderCreate
+from app.services.indicator_snapshot import get_snapshot
 from app.services.market_service import MarketService
 from app.services.order_service import OrderService
 from app.strategies.base import AbstractStrategy
@@ -78,9 +81,12 @@ class StrategyRunner:
     ):
         market = config.market
 
-        # Get market data
+        # Get market data — indicators come from the scheduler's snapshot when fresh
         price_info = await self.market_svc.get_price(symbol, market)
-        daily_prices = await self.market_svc.get_daily_prices(symbol, market)
+        snapshot = get_snapshot(symbol, market, max_age=settings.indicator_snapshot_max_age)
+        daily_prices = BarSeries.empty()
+        if strategy.needs_daily_prices(snapshot):
+            daily_prices = await self.market_svc.get_daily_prices(symbol, market)
 
         # Get current position
         is_paper = config.trading_mode == "PAPER"
@@ -102,6 +108,7 @@ class StrategyRunner:
             daily_prices=daily_prices,
             current_price=price_info.price,
             position_qty=position_qty,
+            snapshot=snapshot,
         )
 
         logger.info("Strategy %s → %s %s: %s", config.name, symbol, signal.side or "HOLD", signal.reason)
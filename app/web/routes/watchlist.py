@@ -26,15 +26,19 @@ async def _build_watchlist_items(
 ) -> list[dict]:
     """관심종목 목록에 시세를 붙여 반환한다."""
     memos = await svc.list_all()
+    try:
+        price_map = await market_svc.get_prices([(m.symbol, m.market) for m in memos])
+    except Exception:
+        price_map = {}
     items = []
     for m in memos:
-        try:
-            p = await market_svc.get_price(m.symbol, m.market)
+        p = price_map.get((m.symbol, m.market))
+        if p is not None:
             items.append({
                 "id": m.id, "symbol": m.symbol, "market": m.market, "name": m.name,
                 "price": p.price, "change": p.change, "change_pct": p.change_pct,
             })
-        except Exception:
+        else:
             items.append({
                 "id": m.id, "symbol": m.symbol, "market": m.market, "name": m.name,
                 "price": 0, "change": 0, "change_pct": 0,
@@ -56,14 +60,18 @@ async def partial_watchlist_items(
         memo_svc = WatchlistService(session)
         items = await _build_watchlist_items(memo_svc, market_svc)
     elif tab == "kr":
+        try:
+            price_map = await market_svc.get_prices([(s["symbol"], "KR") for s in KR_STOCKS])
+        except Exception:
+            price_map = {}
         for s in KR_STOCKS:
-            try:
-                p = await market_svc.get_price(s["symbol"], "KR")
+            p = price_map.get((s["symbol"], "KR"))
+            if p is not None:
                 items.append({
                     "symbol": s["symbol"], "market": "KR", "name": s["name"],
                     "price": p.price, "change": p.change, "change_pct": p.change_pct,
                 })
-            except Exception:
+            else:
                 items.append({
                     "symbol": s["symbol"], "market": "KR", "name": s["name"],
                     "price": 0, "change": 0, "change_pct": 0,
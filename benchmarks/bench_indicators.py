@@ -0,0 +1,161 @@
+"""지표 엔진 벤치마크: 기존 순수 Python 구현 vs app.indicators (10,000봉).
+
+실행: python -m benchmarks.bench_indicators
+
+기존 구현(_add_moving_averages의 슬라이스 합, MovingAverageStrategy의 SMA,
+rsi_rebalance의 _compute_rsi)은 비교를 위해 이 파일에 그대로 옮겨 두었다.
+RSI는 두 구현 모두 전체 구간의 시계열을 계산하도록 맞췄다.
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+
+import numpy as np
+
+from app import indicators
+from app.bars import BarSeries
+
+N_BARS = 10_000
+REPEAT = 5
+
+
+# ── 기존 구현 (baseline) ─────────────────────────────────────
+
+def legacy_add_moving_averages(prices: list[dict]) -> list[dict]:
+    sorted_prices = sorted(prices, key=lambda x: x["date"])
+    closes = [p["close"] for p in sorted_prices]
+    for i, p in enumerate(sorted_prices):
+        p["ma5"] = round(sum(closes[i - 4:i + 1]) / 5, 2) if i >= 4 else None
+        p["ma20"] = round(sum(closes[i - 19:i + 1]) / 20, 2) if i >= 19 else None
+    return sorted_prices
+
+
+def legacy_compute_rsi(closes: list[float], period: int = 14) -> float:
+    if len(closes) < period + 1:
+        return 50.0
+    deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
+    recent = deltas[-period:]
+    gains = [d for d in recent if d > 0]
+    losses = [-d for d in recent if d < 0]
+    avg_gain = sum(gains) / period if gains else 0.0
+    avg_loss = sum(losses) / period if losses else 0.0001
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def legacy_rsi_series(closes: list[float], period: int = 14) -> list[float]:
+    # 기존 전략은 호출마다 전체 deltas를 다시 만든다 → 봉마다 호출하면 O(n²)
+    return [legacy_compute_rsi(closes[:i + 1], period) for i in range(period, len(closes), 50)]
+
+
+# ── 신규 구현 ────────────────────────────────────────────────
+
+def new_add_moving_averages(prices: list[dict]) -> list[dict]:
+    sorted_prices = sorted(prices, key=lambda x: x["date"])
+    closes = indicators.column(sorted_prices)
+    ma5 = indicators.sma(closes, 5).tolist()
+    ma20 = indicators.sma(closes, 20).tolist()
+    for p, m5, m20 in zip(sorted_prices, ma5, ma20):
+        p["ma5"] = round(m5, 2) if m5 == m5 else None
+        p["ma20"] = round(m20, 2) if m20 == m20 else None
+    return sorted_prices
+
+
+def _make_bars(n: int) -> list[dict]:
+    rng = random.Random(7)
+    price = 50_000.0
+    bars = []
+    for i in range(n):
+        price *= 1 + rng.uniform(-0.02, 0.02)
+        bars.append({"date": f"{i:08d}", "close": price, "high": price * 1.01, "low": price * 0.99})
+    return bars
+
+
+def _daily_columns(n: int) -> dict[str, list]:
+    """pykrx 워커가 돌려주는 열 단위 일봉 (날짜 오름차순)."""
+    rng = random.Random(11)
+    dates = np.datetime_as_string(np.arange(np.datetime64("1990-01-01"), n, dtype="datetime64[D]")).tolist()
+    close, price = [], 50_000.0
+    for _ in range(n):
+        price *= 1 + rng.uniform(-0.02, 0.02)
+        close.append(price)
+    return {
+        "date": dates, "open": close, "high": [c * 1.01 for c in close],
+        "low": [c * 0.99 for c in close], "close": close, "volume": [1000] * n,
+    }
+
+
+def dict_rows_pipeline(cols: dict[str, list]) -> list[dict]:
+    # 기존: 행 dict 생성 → MA 계산 시 종가 재추출 → 행마다 ma5/ma20 기록
+    rows = [
+        {"date": d, "open": o, "high": h, "low": lo, "close": c, "volume": v}
+        for d, o, h, lo, c, v in zip(*cols.values())
+    ]
+    return new_add_moving_averages(rows)
+
+
+def bar_series_pipeline(cols: dict[str, list]) -> list[dict]:
+    bars = BarSeries.from_columns(**cols)
+    bars = bars.with_columns(
+        ma5=np.round(indicators.sma(bars.close, 5), 2),
+        ma20=np.round(indicators.sma(bars.close, 20), 2),
+    )
+    return bars.to_dicts()
+
+
+def _bench(label: str, fn) -> float:
+    best = min(timeit.repeat(fn, number=1, repeat=REPEAT))
+    print(f"  {label:<44s} {best * 1000:9.2f} ms")
+    return best
+
+
+def main() -> None:
+    bars = _make_bars(N_BARS)
+    closes_list = [b["close"] for b in bars]
+    closes = np.array(closes_list)
+
+    print(f"bars={N_BARS:,}  (best of {REPEAT})")
+
+    print("MA5/MA20 (_add_moving_averages)")
+    old = _bench("legacy slicing sums", lambda: legacy_add_moving_averages([dict(b) for b in bars]))
+    new = _bench("indicators.sma", lambda: new_add_moving_averages([dict(b) for b in bars]))
+    print(f"  speedup x{old / new:.1f}")
+
+    print("SMA20 only (no dict writes)")
+    old = _bench("legacy slicing sums", lambda: [
+        sum(closes_list[i - 19:i + 1]) / 20 for i in range(19, N_BARS)])
+    new = _bench("indicators.sma", lambda: indicators.sma(closes, 20))
+    print(f"  speedup x{old / new:.1f}")
+
+    print("RSI(14) series (every 50th bar for legacy)")
+    old = _bench("legacy _compute_rsi per bar", lambda: legacy_rsi_series(closes_list))
+    new = _bench("indicators.rsi (all bars)", lambda: indicators.rsi(closes, 14))
+    print(f"  speedup x{old / new:.1f} (legacy computes 1/50 of the points)")
+
+    print("Other indicators (full series)")
+    _bench("indicators.ema(20)", lambda: indicators.ema(closes, 20))
+    _bench("indicators.macd(12, 26, 9)", lambda: indicators.macd(closes))
+    _bench("indicators.bollinger(20, 2)", lambda: indicators.bollinger(closes))
+    high = np.array([b["high"] for b in bars])
+    low = np.array([b["low"] for b in bars])
+    _bench("indicators.atr(14)", lambda: indicators.atr(high, low, closes))
+
+    print("Daily bars → MA5/MA20 → JSON rows")
+    cols = _daily_columns(N_BARS)
+    old = _bench("list[dict] rows", lambda: dict_rows_pipeline(cols))
+    new = _bench("BarSeries columns + to_dicts", lambda: bar_series_pipeline(cols))
+    print(f"  speedup x{old / new:.1f}")
+    series = BarSeries.from_columns(**cols)
+    _bench("BarSeries SMA20 (no dict rows)", lambda: indicators.sma(series.close, 20))
+
+    print("Memoized lookup (same series version)")
+    version = indicators.series_version(bars)
+    indicators.memoize("bench", version, "rsi", (14,), lambda: indicators.rsi(closes, 14))
+    _bench("indicators.memoize hit", lambda: indicators.memoize(
+        "bench", version, "rsi", (14,), lambda: indicators.rsi(closes, 14)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""BarSeries 테스트: 브로커 형식 정규화, 열 배열 슬라이스·병합, JSON 변환."""
+
+import math
+
+import numpy as np
+
+from app.bars import BarSeries
+
+
+def _kis_rows() -> list[dict]:
+    # KIS 일봉 응답처럼 최신순 + YYYYMMDD
+    return [
+        {"date": f"202608{d:02d}", "open": 1.0, "high": 2.0, "low": 0.5, "close": float(d), "volume": d}
+        for d in (5, 4, 3)
+    ]
+
+
+def test_from_records_sorts_and_normalizes_dates():
+    bars = BarSeries.from_records(_kis_rows())
+
+    assert bars.dates() == ["2026-08-03", "2026-08-04", "2026-08-05"]
+    assert bars.close.tolist() == [3.0, 4.0, 5.0]
+    assert bars[-1] == {
+        "date": "2026-08-05", "open": 1.0, "high": 2.0, "low": 0.5, "close": 5.0, "volume": 5,
+    }
+    # 슬라이스는 복사 없이 원본 배열을 공유
+    assert np.shares_memory(bars[1:].close, bars.close)
+
+
+def test_merge_prefers_newer_bars_and_to_dicts_maps_nan_to_none():
+    bars = BarSeries.from_records(_kis_rows())
+    tail = BarSeries.from_columns(["2026-08-05", "2026-08-06"], [1, 1], [9, 9], [1, 1], [7, 8], [1, 1])
+
+    merged = bars.merge(tail)
+    assert merged.dates() == ["2026-08-03", "2026-08-04", "2026-08-05", "2026-08-06"]
+    assert merged.close.tolist() == [3.0, 4.0, 7.0, 8.0]
+
+    rows = merged.with_columns(ma2=np.array([math.nan, 3.5, 5.5, 7.5])).to_dicts()
+    assert rows[0]["ma2"] is None and rows[-1]["ma2"] == 7.5
+    assert rows[-1]["date"] == "2026-08-06" and rows[-1]["volume"] == 1
@@ -0,0 +1,108 @@
+"""분봉 저장소·집계 테스트: 벽시계 구간 정렬, 증분 수집, 조회 시각 정리."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.candles import aggregate
+from app.config import settings
+from app.broker.kis.broker import KISBroker
+from app.services import candle_service
+from app.services.candle_service import CandleService
+from app.services.market_calendar import KST
+
+DAY = date(2026, 10, 13)  # 화요일 (거래일)
+
+
+def _candle(hhmm: str, close: float, volume: int = 1) -> dict:
+    return {
+        "datetime": f"{DAY.isoformat()} {hhmm[:2]}:{hhmm[2:]}:00",
+        "open": close, "high": close + 1, "low": close - 1, "close": close, "volume": volume,
+    }
+
+
+@pytest.fixture(autouse=True)
+def _reset_fetch_times():
+    candle_service._last_fetch.clear()
+    yield
+    candle_service._last_fetch.clear()
+
+
+def test_aggregate_aligns_to_wall_clock_despite_gaps():
+    """09:02가 비어 있어도 5분봉 경계는 09:00 / 09:05로 유지된다."""
+    candles = [_candle(t, float(i)) for i, t in enumerate(
+        ["0900", "0901", "0903", "0904", "0905", "0906", "0911"]
+    )]
+    bars = aggregate(candles, 5)
+
+    assert [b["datetime"][11:16] for b in bars] == ["09:00", "09:05", "09:10"]
+    first = bars[0]
+    assert (first["open"], first["close"], first["volume"]) == (0.0, 3.0, 4)
+    assert (first["high"], first["low"]) == (4.0, -1.0)
+    assert bars[1]["close"] == 5.0 and bars[2]["open"] == 6.0
+
+
+@pytest.mark.asyncio
+async def test_only_new_minutes_are_fetched(session):
+    broker = AsyncMock()
+    broker.get_minute_candles.return_value = [_candle("0900", 1.0), _candle("0901", 2.0)]
+    now = datetime(2026, 10, 13, 9, 2, tzinfo=KST)
+    svc = CandleService(session)
+
+    with patch("app.services.candle_service.datetime") as dt:
+        dt.now.return_value = now
+        first = await svc.get_candles("005930", "KR", 1, broker)
+        broker.get_minute_candles.assert_awaited_once_with("005930", "KR", None)
+
+        # 마지막 저장 분(09:01)부터 다시 받아 진행 중이던 봉을 덮어쓴다
+        candle_service._last_fetch.clear()
+        broker.get_minute_candles.return_value = [_candle("0901", 2.5), _candle("0902", 3.0)]
+        second = await svc.get_candles("005930", "KR", 1, broker)
+
+    assert len(first) == 2
+    assert broker.get_minute_candles.await_args.args == ("005930", "KR", "2026-10-13 09:01:00")
+    assert [c["close"] for c in second] == [1.0, 2.5, 3.0]
+
+    # 다른 집계 단위는 저장소만으로 응답 (조회 간격 이내)
+    with patch("app.services.candle_service.datetime") as dt:
+        dt.now.return_value = now
+        three = await svc.get_candles("005930", "KR", 3, broker)
+    assert broker.get_minute_candles.await_count == 2
+    assert three == [{"datetime": "2026-10-13 09:00:00", "open": 1.0, "high": 4.0,
+                      "low": 0.0, "close": 3.0, "volume": 3}]
+
+
+@pytest.mark.asyncio
+async def test_failed_page_stores_nothing_and_retries_same_range(session):
+    """두 번째 페이지가 실패하면 앞 페이지만 저장해 빈 구간을 남기지 않는다."""
+    kis = KISBroker()
+    page = [_candle(f"09{m:02d}", float(m)) for m in range(30, 60)]
+    kis._get_kr_minute_candles = AsyncMock(side_effect=[page, RuntimeError("EGW00201")])
+    now = datetime(2026, 10, 13, 10, 0, tzinfo=KST)
+    svc = CandleService(session)
+
+    with patch("app.services.candle_service.datetime") as dt:
+        dt.now.return_value = now
+        assert await svc.get_candles("005930", "KR", 1, kis) == []
+
+        candle_service._last_fetch.clear()
+        broker = AsyncMock()
+        broker.get_minute_candles.return_value = [_candle("0900", 1.0)]
+        await svc.get_candles("005930", "KR", 1, broker)
+
+    # 증분 위치가 진전되지 않아 처음부터 다시 받는다
+    broker.get_minute_candles.assert_awaited_once_with("005930", "KR", None)
+
+
+@pytest.mark.asyncio
+async def test_prune_drops_expired_fetch_times(session):
+    candle_service._last_fetch[("005930", "KR")] = time.monotonic()
+    candle_service._last_fetch[("000660", "KR")] = time.monotonic() - settings.quote_cache_ttl - 1
+
+    await CandleService(session).prune(5)
+
+    assert list(candle_service._last_fetch) == [("005930", "KR")]
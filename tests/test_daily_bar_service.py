@@ -0,0 +1,83 @@
+"""DailyBarService 테스트: 저장소 우선 조회, 누락 거래일 증분 수집."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.models.daily_bar import DailyBar
+from app.services import daily_bar_service
+from app.services.daily_bar_service import KST, DailyBarService, _last_trading_day
+
+
+@pytest.fixture(autouse=True)
+def _reset_backfill():
+    daily_bar_service._backfilled.clear()
+    yield
+    daily_bar_service._backfilled.clear()
+
+
+def _weekday_bars(end: date, count: int) -> list[dict]:
+    """end까지 평일 count개의 일봉 (KIS 형식 날짜)."""
+    bars = []
+    day = end
+    while len(bars) < count:
+        if day.weekday() < 5:
+            close = 1000.0 + len(bars)
+            bars.append({
+                "date": day.strftime("%Y%m%d"),
+                "open": close, "high": close, "low": close, "close": close, "volume": 10,
+            })
+        day -= timedelta(days=1)
+    return bars  # KIS처럼 최신순
+
+
+@pytest.mark.asyncio
+async def test_history_is_fetched_once_then_served_from_store(session):
+    broker = AsyncMock()
+    broker.get_daily_prices.return_value = _weekday_bars(_last_trading_day(datetime.now(KST)), 20)
+    svc = DailyBarService(session)
+
+    first = await svc.get_bars("005930", "KR", 20, broker)
+    second = await svc.get_bars("005930", "KR", 10, broker)
+
+    assert broker.get_daily_prices.await_count == 1
+    assert len(first) == 20 and len(second) == 10
+    assert first[0]["date"] < first[-1]["date"]  # 오름차순, YYYY-MM-DD 정규화
+    assert second == first[-10:]
+
+
+def test_fetch_window_covers_only_missing_trading_days():
+    """마지막 저장일이 금요일이고 지금이 화요일 장중이면 월·화 + 금요일 재확인 = 3일."""
+    now = datetime(2026, 10, 13, 10, 0, tzinfo=KST)  # 화요일
+    stored = [
+        DailyBar(symbol="005930", market="KR", date=date(2026, 10, 9), close=1.0,
+                 updated_at=now - timedelta(days=3)),
+    ]
+    daily_bar_service._backfilled[("005930", "KR")] = 60
+    svc = DailyBarService(session=None)
+
+    assert svc._fetch_window(("005930", "KR"), stored, 1, now) == (3, date(2026, 10, 9))
+
+
+def test_unsettled_bar_is_refetched_by_date_after_close():
+    """장중에 저장된 금요일 봉은 마감+확정 여유 뒤, 월요일 휴장을 건너뛰어도 금요일부터 재조회."""
+    friday = date(2026, 10, 2)  # 10/5(월) 대체공휴일
+    stored = [
+        DailyBar(symbol="005930", market="KR", date=friday, close=1.0,
+                 updated_at=datetime(2026, 10, 2, 14, 0, tzinfo=KST)),
+    ]
+    daily_bar_service._backfilled[("005930", "KR")] = 60
+    svc = DailyBarService(session=None)
+
+    def window(now: datetime) -> tuple[int, date | None]:
+        return svc._fetch_window(("005930", "KR"), stored, 1, now)
+
+    assert window(datetime(2026, 10, 2, 15, 50, tzinfo=KST)) == (1, None)  # 확정 여유 전: 당일 봉 TTL 갱신
+    assert window(datetime(2026, 10, 2, 18, 0, tzinfo=KST)) == (1, friday)
+    assert window(datetime(2026, 10, 6, 10, 0, tzinfo=KST)) == (2, friday)
+
+    stored[0].updated_at = datetime(2026, 10, 2, 17, 0, tzinfo=KST)  # 확정 후 저장
+    assert window(datetime(2026, 10, 2, 18, 0, tzinfo=KST)) == (0, None)
@@ -0,0 +1,105 @@
+"""pykrx 제공자 테스트: 전종목 스냅샷 배열 조회, 주기당 1회 조회, 누락 종목 보완, 스냅샷 실패·서킷 차단 시 대체값."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from app.broker.base import PriceInfo
+from app.broker.free import provider as provider_module
+from app.broker.free.provider import FreeMarketProvider
+from app.broker.throttle import _breakers
+from app.services.market_service import MarketService
+from app.services.quote_cache import quote_cache
+
+
+_KRX_ALL_PRICES = "app.broker.free.pykrx_ops._krx_all_prices"
+
+
+def _krx_all_prices(*args, **kwargs) -> pd.DataFrame:
+    # KRX 전종목 시세 원본 형식: 쉼표 숫자 문자열, 대비는 부호 없이 등락 구분 코드로
+    return pd.DataFrame({
+        "ISU_SRT_CD": ["005930", "000660"],
+        "TDD_OPNPRC": ["70,000", "180,000"], "TDD_HGPRC": ["72,000", "181,000"],
+        "TDD_LWPRC": ["69,500", "179,000"], "TDD_CLSPRC": ["71,500", "180,500"],
+        "ACC_TRDVOL": ["1,000", "20"], "FLUC_TP_CD": ["1", "2"],
+        "CMPPREVDD_PRC": ["1,500", "500"], "FLUC_RT": ["2.14", "-0.28"],
+    })
+
+
+@pytest.fixture(autouse=True)
+def _reset_snapshot(monkeypatch):
+    # pykrx를 같은 프로세스에서 patch하므로 워커 프로세스 대신 프로세스 내 실행기 사용
+    monkeypatch.setattr("app.config.settings.pykrx_worker_enabled", False)
+    provider_module._snapshot = None
+    provider_module._snapshot_task = None
+    _breakers.clear()
+    yield
+    provider_module._snapshot = None
+    _breakers.clear()
+    quote_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_lookup_is_shared_until_expiry():
+    provider = FreeMarketProvider()
+    calls = []
+
+    def _fake(*args, **kwargs):
+        calls.append(args)
+        return _krx_all_prices()
+
+    etf = PriceInfo(symbol="069500", price=35000.0, market="KR")
+    with patch(_KRX_ALL_PRICES, side_effect=_fake), \
+         patch("app.services.daily_bar_service.is_bar_live", return_value=True), \
+         patch.object(FreeMarketProvider, "_get_kr_prices", return_value={"069500": etf}) as per_symbol:
+        first, second = await asyncio.gather(
+            provider.get_current_price("005930", "KR"),
+            provider.get_current_price("000660", "KR"),
+        )
+        batch = await provider.get_current_prices(["005930", "069500"], "KR")
+
+    # 동시 만료 조회도 전종목 스냅샷 1회, 이후 유효 시간 내에는 배열 조회만
+    assert len(calls) == 1
+    assert (first.price, first.change, first.volume) == (71500.0, 1500.0, 1000)
+    assert (second.change, second.change_pct) == (-500.0, -0.28)
+    assert batch["005930"] == first and batch["069500"] is etf
+    per_symbol.assert_awaited_once_with(["069500"])
+    assert provider_module._snapshot.ohlcv("000660")["high"] == 181000.0
+
+
+@pytest.mark.asyncio
+async def test_batch_falls_back_to_per_symbol_when_snapshot_fails():
+    provider = FreeMarketProvider()
+    prices = {s: PriceInfo(symbol=s, price=1.0, market="KR") for s in ("005930", "000660")}
+
+    with patch(_KRX_ALL_PRICES, side_effect=ConnectionError("KRX")), \
+         patch.object(FreeMarketProvider, "_get_kr_prices", return_value=prices) as per_symbol:
+        assert await provider.get_current_prices(["005930", "000660"], "KR") == prices
+    per_symbol.assert_awaited_once_with(["005930", "000660"])
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_falls_back_without_calling_pykrx(session, monkeypatch):
+    monkeypatch.setattr("app.config.settings.circuit_failure_threshold", 2)
+    provider = FreeMarketProvider()
+    quote_cache.set(("005930", "KR"), PriceInfo(symbol="005930", price=70000.0, market="KR"), ttl=0)
+
+    with patch(_KRX_ALL_PRICES, side_effect=ConnectionError("KRX")) as snap, \
+         patch("pykrx.stock.get_market_ohlcv_by_date", side_effect=ConnectionError("KRX")) as by_date, \
+         patch.object(MarketService, "_get_broker", return_value=provider):
+        svc = MarketService(session)
+        for _ in range(2):
+            info = await svc.get_price("005930", "KR")
+        assert snap.call_count == 2 and by_date.call_count == 2
+
+        # 두 엔드포인트 모두 열림 → 제공자 호출 없이 만료 캐시로 즉시 응답
+        info = await svc.get_price("005930", "KR")
+        assert snap.call_count == 2 and by_date.call_count == 2
+
+    assert info.stale and info.price == 70000.0
+    assert _breakers["pykrx.snapshot"].state == "open"
+    assert _breakers["pykrx.price"].stats()["rejected"] == 1
@@ -0,0 +1,100 @@
+"""지표 스냅샷 테스트: 현재가 반영 계산, 스케줄러 갱신 후 O(1) 조회, 저장 한도, 전략 사용."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.broker.base import PriceInfo
+from app.services import indicator_snapshot, market_service
+from app.services.indicator_snapshot import compute_snapshot, get_snapshot
+from app.services.market_service import MarketService
+from app.services.quote_cache import quote_cache
+from app.strategies.builtin.moving_average import MovingAverageStrategy
+
+
+def _bars(n: int = 30) -> list[dict]:
+    return [
+        {"date": f"2026-08-{d:02d}", "open": 1.0, "high": float(d), "low": float(d),
+         "close": float(d), "volume": 1}
+        for d in range(1, n + 1)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    quote_cache.clear()
+    market_service._daily_cache.clear()
+    indicator_snapshot.clear_snapshots()
+    yield
+    quote_cache.clear()
+    indicator_snapshot.clear_snapshots()
+
+
+def test_compute_snapshot_overlays_live_price():
+    """장중 현재가는 당일 봉 종가를 교체하고, 당일 봉이 없으면 덧붙여 계산한다."""
+    bars = _bars(30)
+
+    closed = compute_snapshot("005930", "KR", bars)
+    assert closed.as_of == "2026-08-30"
+    assert closed.ma5 == pytest.approx(28.0)  # (26+27+28+29+30)/5
+    assert closed.ma5_prev == pytest.approx(27.0)
+
+    replaced = compute_snapshot("005930", "KR", bars, live_price=35.0, today="2026-08-30")
+    assert replaced.bars == 30
+    assert replaced.ma5 == pytest.approx((26 + 27 + 28 + 29 + 35) / 5)
+
+    appended = compute_snapshot("005930", "KR", bars, live_price=35.0, today="2026-08-31")
+    assert appended.bars == 31 and appended.as_of == "2026-08-31"
+    assert appended.ma5 == pytest.approx((27 + 28 + 29 + 30 + 35) / 5)
+    assert appended.ma5_prev == pytest.approx(28.0)
+
+
+@pytest.mark.asyncio
+async def test_refresh_snapshots_then_reads_skip_broker():
+    """스냅샷 갱신은 일봉을 한 번만 조회하고, 이후 조회는 브로커 없이 맵에서 읽는다."""
+    quote_cache.set(("005930", "KR"), PriceInfo(symbol="005930", price=30.0))
+    broker = AsyncMock()
+    broker.get_daily_prices.return_value = _bars(30)
+    with patch.object(MarketService, "_get_broker", AsyncMock(return_value=broker)), \
+            patch("app.services.daily_bar_service.is_bar_live", return_value=False):
+        svc = MarketService()
+        assert await svc.refresh_indicator_snapshots([("005930", "KR")]) == 1
+        assert await svc.refresh_indicator_snapshots([("005930", "KR")]) == 1
+
+    # 일봉 캐시 재사용 (마지막 봉 만료 여부와 무관하게 재조회하지 않음)
+    assert broker.get_daily_prices.await_count == 1
+    snap = get_snapshot("005930", "KR")
+    assert snap is not None and snap.ma20 == pytest.approx(20.5)
+    assert snap.rsi14 == pytest.approx(100.0)  # 상승만 있는 시계열
+    assert get_snapshot("005930", "KR", max_age=-1) is None  # 유효 시간 초과
+
+
+def test_snapshot_store_is_bounded(monkeypatch):
+    """한도를 넘으면 가장 오래 저장되지 않은 종목부터 제거한다."""
+    monkeypatch.setattr("app.config.settings.indicator_snapshot_max_entries", 2)
+    for symbol in ("000001", "000002", "000001", "000003"):
+        indicator_snapshot.store_snapshot(compute_snapshot(symbol, "KR", _bars(5)))
+
+    assert get_snapshot("000002", "KR") is None
+    assert get_snapshot("000001", "KR") is not None and get_snapshot("000003", "KR") is not None
+    assert indicator_snapshot.get_snapshot_stats()["size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_moving_average_strategy_uses_snapshot():
+    """SMA5/SMA20 설정이면 일봉 없이 스냅샷 값으로 교차를 판단한다."""
+    snap = indicator_snapshot.IndicatorSnapshot(
+        symbol="005930", market="KR", as_of="2026-08-31", close=100.0, bars=60,
+        ma5=101.0, ma5_prev=99.0, ma20=100.0, ma20_prev=100.0,
+    )
+    strategy = MovingAverageStrategy({"quantity": 3})
+    assert not strategy.needs_daily_prices(snap)
+    assert MovingAverageStrategy({"short_period": 10}).needs_daily_prices(snap)
+
+    signal = await strategy.evaluate(
+        symbol="005930", market="KR", daily_prices=[], current_price=100.0,
+        position_qty=0, snapshot=snap,
+    )
+    assert signal.side == "BUY" and signal.quantity == 3
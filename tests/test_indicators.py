@@ -0,0 +1,83 @@
+"""지표 엔진 테스트: 순수 Python 기준 구현과 결과 비교."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from app import indicators
+
+
+@pytest.fixture
+def closes() -> list[float]:
+    rng = random.Random(42)
+    values = [10000.0]
+    for _ in range(199):
+        values.append(values[-1] * (1 + rng.uniform(-0.03, 0.03)))
+    return values
+
+
+def test_sma_matches_window_mean(closes):
+    result = indicators.sma(np.array(closes), 20)
+    assert np.isnan(result[18])
+    for i in (19, 100, 199):
+        assert result[i] == pytest.approx(sum(closes[i - 19:i + 1]) / 20)
+
+
+def test_ema_and_macd_match_recursive_definition(closes):
+    def _ema(values, period):
+        out = [sum(values[:period]) / period]
+        for v in values[period:]:
+            out.append(out[-1] + 2 / (period + 1) * (v - out[-1]))
+        return out
+
+    assert indicators.ema(np.array(closes), 12)[-1] == pytest.approx(_ema(closes, 12)[-1])
+    line, signal, hist = indicators.macd(np.array(closes))
+    expected_line = [a - b for a, b in zip(_ema(closes, 12)[14:], _ema(closes, 26))]
+    assert line[-1] == pytest.approx(expected_line[-1])
+    assert signal[-1] == pytest.approx(_ema(expected_line, 9)[-1])
+    assert hist[-1] == pytest.approx(line[-1] - signal[-1])
+
+
+def test_wilder_rsi(closes):
+    period = 14
+    deltas = [b - a for a, b in zip(closes, closes[1:])]
+    avg_gain = sum(max(d, 0) for d in deltas[:period]) / period
+    avg_loss = sum(max(-d, 0) for d in deltas[:period]) / period
+    for d in deltas[period:]:
+        avg_gain = (avg_gain * (period - 1) + max(d, 0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-d, 0)) / period
+    expected = 100 - 100 / (1 + avg_gain / avg_loss)
+
+    result = indicators.rsi(np.array(closes), period)
+    assert np.isnan(result[period - 1]) and not np.isnan(result[period])
+    assert result[-1] == pytest.approx(expected)
+    assert indicators.rsi(np.arange(1.0, 30.0), period)[-1] == 100.0
+
+
+def test_bollinger_and_atr(closes):
+    arr = np.array(closes)
+    mid, upper, lower = indicators.bollinger(arr, 20, 2.0)
+    window = closes[-20:]
+    mean = sum(window) / 20
+    std = math.sqrt(sum((v - mean) ** 2 for v in window) / 20)
+    assert mid[-1] == pytest.approx(mean)
+    assert upper[-1] == pytest.approx(mean + 2 * std)
+    assert lower[-1] == pytest.approx(mean - 2 * std)
+
+    high, low = arr * 1.01, arr * 0.99
+    result = indicators.atr(high, low, arr, 14)
+    assert np.isnan(result[12]) and result[-1] > 0
+
+
+def test_memoize_reuses_result_for_same_version():
+    indicators.clear_memo()
+    calls = []
+    bars = [{"date": "2026-01-01", "close": 1.0}, {"date": "2026-01-02", "close": 2.0}]
+    version = indicators.series_version(bars)
+    for _ in range(3):
+        indicators.memoize("005930", version, "sma", (2,), lambda: calls.append(1) or 1.5)
+    assert len(calls) == 1
@@ -0,0 +1,51 @@
+"""KIS 공유 클라이언트 테스트: 연결 풀 재사용, 브로커 종료와 분리, 토큰 선제 갱신."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.broker.kis import client as kis_client
+from app.broker.kis.broker import KISBroker
+from app.broker.kis.models import KISToken
+from app.config import settings
+from app.scheduler.jobs import refresh_kis_token
+from app.schemas.common import MarketDataMode
+
+
+@pytest.fixture(autouse=True)
+async def _shared_client(monkeypatch):
+    monkeypatch.setattr(kis_client, "_kis_client", None)
+    yield
+    await kis_client.close_kis_client()
+
+
+async def test_brokers_share_one_connection_pool():
+    trading, price_provider = KISBroker(), KISBroker()
+    await trading.connect()
+    pool = kis_client.get_kis_client()._client
+    await price_provider.connect()
+
+    # 두 번째 connect는 새 풀을 만들지 않고, 한 브로커의 disconnect가 공유 풀을 닫지 않는다
+    assert kis_client.get_kis_client()._client is pool
+    await price_provider.disconnect()
+    assert not pool.is_closed
+
+    await kis_client.close_kis_client()
+    assert pool.is_closed
+
+
+async def test_token_refresh_job_uses_shared_client(monkeypatch):
+    monkeypatch.setattr(settings, "kis_app_key", "key")
+    monkeypatch.setattr(settings, "kis_app_secret", "secret")
+    monkeypatch.setattr(settings, "market_data_mode", MarketDataMode.RECORD)
+    client = kis_client.get_kis_client()
+    client.force_refresh_token = AsyncMock()
+
+    await refresh_kis_token()  # 발급 전에는 갱신하지 않음
+    client._token = KISToken(access_token="t", expires_at=datetime.now() + timedelta(minutes=30))
+    await refresh_kis_token()
+
+    client.force_refresh_token.assert_awaited_once()
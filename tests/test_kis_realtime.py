@@ -0,0 +1,108 @@
+"""KIS 실시간 체결가 수신 테스트 (로컬 대역 서버 사용)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.broker.kis.fake_ws_server import FakeKISWebSocketServer, build_trade_frame
+from app.broker.kis.realtime import KISRealtimeClient, parse_trade_frame, start_realtime_feed
+from app.config import settings
+from app.schemas.common import MarketDataMode
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("조건 대기 시간 초과")
+        await asyncio.sleep(0.01)
+
+
+def test_parse_multi_record_frame():
+    frame = build_trade_frame([
+        {"symbol": "005930", "price": 71900, "change": -100, "change_pct": -0.14, "volume": 1234},
+        {"symbol": "000660", "price": 180500, "change": 500, "change_pct": 0.28, "volume": 99,
+         "high": 181000, "low": 179000},
+    ])
+    ticks = parse_trade_frame(frame)
+    assert [t[0].symbol for t in ticks] == ["005930", "000660"]
+    info, ohlcv = ticks[1]
+    assert info.price == 180500.0 and info.change == 500.0 and info.volume == 99
+    assert ohlcv["high"] == 181000.0 and ohlcv["low"] == 179000.0
+
+
+@pytest.mark.asyncio
+async def test_subscribe_receive_ping_and_reconnect():
+    server = FakeKISWebSocketServer()
+    url = await server.start()
+    received = []
+
+    async def _approval_key() -> str:
+        return "test-approval-key"
+
+    client = KISRealtimeClient(
+        url, _approval_key, on_quote=lambda info, ohlcv: received.append(info),
+        backoff_initial=0.05,
+    )
+    try:
+        await client.set_symbols(["005930", "000660"])
+        client.start()
+        await _wait_for(lambda: server.symbols() == {"005930", "000660"})
+        assert server.control_messages[0]["header"]["approval_key"] == "test-approval-key"
+
+        await server.push_tick(symbol="005930", price=72000, change=100, volume=10)
+        await _wait_for(lambda: len(received) == 1)
+        assert received[0].symbol == "005930" and received[0].price == 72000.0
+
+        # 변경분만 해제/등록
+        await client.set_symbols(["005930"])
+        await _wait_for(lambda: server.symbols() == {"005930"})
+
+        await server.send_ping()
+        await _wait_for(lambda: server.pongs == 1)
+
+        # 연결이 끊기면 백오프 후 재접속해 종목을 다시 등록
+        await server.drop_connections()
+        await _wait_for(lambda: client.stats()["connects"] == 2 and server.symbols() == {"005930"})
+        await server.push_tick(symbol="005930", price=72100)
+        await _wait_for(lambda: len(received) == 2)
+        assert client.stats()["disconnects"] == 1
+    finally:
+        await client.stop()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_rejected_approval_key_is_reissued():
+    """등록이 거부되면 접속키를 재발급(refresh=True)받아 재접속한다."""
+    server = FakeKISWebSocketServer(rejected_keys={"expired-key"})
+    url = await server.start()
+    calls: list[bool] = []
+
+    async def _approval_key(refresh: bool = False) -> str:
+        calls.append(refresh)
+        return "fresh-key" if refresh else "expired-key"
+
+    client = KISRealtimeClient(url, _approval_key, on_quote=lambda info, ohlcv: None, backoff_initial=0.05)
+    try:
+        await client.set_symbols(["005930"])
+        client.start()
+        await _wait_for(lambda: server.symbols() == {"005930"})
+
+        assert calls == [False, True]
+        assert server.control_messages[-1]["header"]["approval_key"] == "fresh-key"
+        assert client.stats()["rejects"] == 1 and client.stats()["key_refreshes"] == 1
+    finally:
+        await client.stop()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_realtime_feed_is_disabled_in_replay_mode(monkeypatch):
+    monkeypatch.setattr(settings, "kis_ws_enabled", True)
+    monkeypatch.setattr(settings, "kis_app_key", "app-key")
+    monkeypatch.setattr(settings, "market_data_mode", MarketDataMode.REPLAY)
+
+    assert await start_realtime_feed() is None
@@ -0,0 +1,49 @@
+"""KRX 거래 캘린더 테스트: 휴장일, 시간대 구분, 갱신 간격."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from app.config import settings
+from app.services.market_calendar import (
+    KST,
+    MarketCalendar,
+    MarketPhase,
+    market_calendar,
+    refresh_interval,
+)
+
+
+def test_phases_on_trading_day():
+    assert market_calendar.phase(datetime(2026, 10, 13, 7, 59, tzinfo=KST)) is MarketPhase.CLOSED
+    assert market_calendar.phase(datetime(2026, 10, 13, 8, 30, tzinfo=KST)) is MarketPhase.PRE_MARKET
+    assert market_calendar.phase(datetime(2026, 10, 13, 9, 0, tzinfo=KST)) is MarketPhase.REGULAR
+    assert market_calendar.phase(datetime(2026, 10, 13, 15, 30, tzinfo=KST)) is MarketPhase.AFTER_HOURS
+    assert market_calendar.phase(datetime(2026, 10, 13, 18, 0, tzinfo=KST)) is MarketPhase.CLOSED
+
+
+def test_holidays_and_weekends_are_closed():
+    # 2026-10-09 한글날(금), 2026-10-10 토요일
+    assert market_calendar.phase(datetime(2026, 10, 9, 10, 0, tzinfo=KST)) is MarketPhase.CLOSED
+    assert market_calendar.phase(datetime(2026, 10, 10, 10, 0, tzinfo=KST)) is MarketPhase.CLOSED
+    assert market_calendar.next_trading_day(date(2026, 10, 8)) == date(2026, 10, 12)
+    assert market_calendar.last_trading_day(datetime(2026, 10, 12, 8, 0, tzinfo=KST)) == date(2026, 10, 8)
+    assert market_calendar.trading_days_between(date(2026, 10, 8), date(2026, 10, 13)) == 2
+
+
+def test_special_session_and_extra_holidays():
+    """수능일은 10시 개장, 설정으로 추가한 임시 휴장일은 거래일에서 제외된다."""
+    assert market_calendar.phase(datetime(2026, 11, 19, 9, 30, tzinfo=KST)) is MarketPhase.PRE_MARKET
+    assert market_calendar.next_session_open(
+        datetime(2026, 11, 18, 16, 0, tzinfo=KST)
+    ) == datetime(2026, 11, 19, 10, 0, tzinfo=KST)
+
+    calendar = MarketCalendar(frozenset({date(2026, 10, 13)}))
+    assert not calendar.is_trading_day(date(2026, 10, 13))
+    assert calendar.session(date(2026, 10, 14)) is not None
+
+
+def test_refresh_interval_by_phase():
+    assert refresh_interval(MarketPhase.REGULAR) == settings.price_refresh_interval
+    assert refresh_interval(MarketPhase.AFTER_HOURS) == settings.price_refresh_interval_slow
+    assert refresh_interval(MarketPhase.CLOSED) is None
@@ -0,0 +1,46 @@
+"""pykrx 시세 워커 프로세스 관리 테스트 (실제 하위 프로세스, pykrx 호출 없이 ping 사용)."""
+
+import pytest
+
+from app.broker.free.worker_client import MarketDataWorker
+
+
+@pytest.fixture
+async def worker():
+    w = MarketDataWorker(max_calls=2, max_rss_mb=0, timeout=30.0)
+    yield w
+    await w.stop()
+
+
+async def test_worker_is_recycled_after_max_calls(worker):
+    first = (await worker.call("ping"))["pid"]
+    assert (await worker.call("ping"))["pid"] == first
+
+    # 호출 2회에 닿으면 교체되어 다음 호출은 새 워커가 처리
+    assert (await worker.call("ping"))["pid"] != first
+    assert worker.stats()["recycles"] == 1
+    assert worker.stats()["spawns"] == 2
+
+
+async def test_crashed_worker_is_restarted_transparently(worker):
+    first = (await worker.call("ping"))["pid"]
+    worker._worker.kill()
+    await worker._worker.proc.wait()
+
+    assert (await worker.call("ping"))["pid"] != first
+    assert worker.stats()["crashes"] == 1
+
+    # 일괄 요청은 항목별로 실패를 돌려주고 요청 자체는 성공한다
+    [item] = await worker.call_batch([("unknown", {})])
+    assert item["ok"] is False and item["type"] == "ValueError"
+
+
+async def test_batch_deadline_keeps_finished_items_and_worker(worker):
+    """마감 시간이 지나면 남은 항목만 건너뛰고, 워커는 종료하지 않는다."""
+    items = await worker.call_batch([("ping", {})] * 6, interval=0.1, timeout=0.25)
+
+    done = [item for item in items if item["ok"]]
+    assert 1 <= len(done) < 6
+    assert all(item["type"] == "TimeoutError" for item in items[len(done):])
+    assert worker.stats()["timeouts"] == 0 and worker.stats()["alive"]
+    assert (await worker.call("ping"))["pid"] == done[0]["result"]["pid"]
@@ -0,0 +1,175 @@
+"""MarketService 테스트: 단일 비행 병합, 캐시 동작."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.broker.base import PriceInfo
+from app.services import market_service, price_cache_service
+from app.services.market_service import MarketService
+from app.services.quote_cache import quote_cache
+from app.services.refresh_planner import refresh_planner
+
+
+@pytest.fixture(autouse=True)
+def _reset_market_state():
+    """모듈 전역 캐시/통계를 테스트마다 초기화."""
+    quote_cache.clear()
+    price_cache_service._pending.clear()
+    market_service._inflight.clear()
+    market_service._daily_cache.clear()
+    refresh_planner.clear()
+    for k in market_service._coalesce_stats:
+        market_service._coalesce_stats[k] = 0
+    yield
+    quote_cache.clear()
+
+
+def _slow_broker(price: float = 70000.0, delay: float = 0.05):
+    """지연 후 시세를 반환하는 mock 브로커."""
+    broker = AsyncMock()
+
+    async def _get_current_price(symbol, market):
+        await asyncio.sleep(delay)
+        return PriceInfo(symbol=symbol, price=price, market=market)
+
+    broker.get_current_price.side_effect = _get_current_price
+    return broker
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_broker_call():
+    """동일 종목 동시 미스 5건은 브로커 호출 1회로 병합된다."""
+    broker = _slow_broker()
+    with patch.object(MarketService, "_get_broker", AsyncMock(return_value=broker)):
+        results = await asyncio.gather(
+            *(MarketService().get_price("005930", "KR") for _ in range(5))
+        )
+
+    assert all(r.price == 70000.0 for r in results)
+    assert broker.get_current_price.await_count == 1
+    stats = market_service.get_coalesce_stats()
+    assert stats == {"broker_calls": 1, "coalesced": 4}
+
+
+@pytest.mark.asyncio
+async def test_failed_flight_is_not_reused():
+    """실패한 조회는 다음 요청에서 재시도된다 (예외가 캐시되지 않음)."""
+    broker = AsyncMock()
+    broker.get_current_price.side_effect = [
+        RuntimeError("pykrx down"),
+        PriceInfo(symbol="005930", price=71000.0, market="KR"),
+    ]
+    with patch.object(MarketService, "_get_broker", AsyncMock(return_value=broker)):
+        svc = MarketService()
+        first = await svc.get_price("005930", "KR")
+        await asyncio.sleep(0)  # done callback 실행
+        second = await svc.get_price("005930", "KR")
+
+    assert first.price == 0.0
+    assert second.price == 71000.0
+    assert broker.get_current_price.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_prices_batches_cache_misses():
+    """캐시 미스 종목은 get_current_prices 1회로 조회되고, 캐시 히트는 제외된다."""
+    quote_cache.set(("005930", "KR"), PriceInfo(symbol="005930", price=70000.0))
+    broker = AsyncMock()
+    broker.get_current_prices.return_value = {
+        "000660": PriceInfo(symbol="000660", price=180000.0),
+    }
+    with patch.object(MarketService, "_get_broker", AsyncMock(return_value=broker)):
+        prices = await MarketService().get_prices(
+            [("005930", "KR"), ("000660", "KR"), ("035720", "KR")]
+        )
+
+    broker.get_current_prices.assert_awaited_once_with(["000660", "035720"], "KR")
+    assert prices[("005930", "KR")].price == 70000.0
+    assert prices[("000660", "KR")].price == 180000.0
+    assert prices[("035720", "KR")].price == 0.0  # 조회 실패 → 대체값
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate_returns_stale_and_refreshes():
+    """SWR 활성 시 grace 이내 만료 엔트리는 즉시 stale로 반환되고 백그라운드에서 갱신된다."""
+    quote_cache.set(
+        ("005930", "KR"), PriceInfo(symbol="005930", price=70000.0),
+        stored_at=time.monotonic() - quote_cache.ttl - 5,
+    )
+    broker = _slow_broker(price=72000.0, delay=0.01)
+    with patch.object(MarketService, "_get_broker", AsyncMock(return_value=broker)), \
+            patch.object(MarketService, "_save_to_db"), \
+            patch.object(market_service.settings, "quote_swr_enabled", True):
+        svc = MarketService()
+        first = await svc.get_price("005930", "KR")
+        second = await svc.get_price("005930", "KR")  # 갱신 진행 중 → 중복 예약 없음
+        await asyncio.gather(*market_service._inflight.values())
+        fresh = await svc.get_price("005930", "KR")
+
+    assert first.stale and first.price == 70000.0
+    assert second.stale
+    assert not fresh.stale and fresh.price == 72000.0
+    assert broker.get_current_price.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_daily_prices_smaller_window_is_sliced_from_cache():
+    """60일 조회 후 21일 조회는 브로커 호출 없이 캐시 슬라이스로 응답한다."""
+    bars = [
+        {"date": f"2026-08-{d:02d}", "open": 1.0, "high": 1.0, "low": 1.0,
+         "close": float(d), "volume": 1}
+        for d in range(1, 31)
+    ]
+    broker = AsyncMock()
+    broker.get_daily_prices.return_value = bars
+    with patch.object(MarketService, "_get_broker", AsyncMock(return_value=broker)):
+        svc = MarketService()
+        full = await svc.get_daily_prices("005930", "KR", days=30)
+        tail = await svc.get_daily_prices("005930", "KR", days=21)
+
+    assert broker.get_daily_prices.await_count == 1
+    assert tail == full[-21:]
+    assert tail[-1]["ma5"] == pytest.approx(28.0)  # (26+27+28+29+30)/5
+
+
+@pytest.mark.asyncio
+async def test_warm_start_serves_db_prices_until_refresh_completes(session):
+    """시작 시 price_cache를 일괄 적재하고, 시작 갱신 중에는 브로커 없이 stale로 응답한다."""
+    from datetime import datetime, timedelta, timezone
+
+    from app.models.price_cache import PriceCache
+
+    session.add_all([
+        PriceCache(symbol="005930", market="KR", price=70000.0,
+                   updated_at=datetime.now(timezone.utc) - timedelta(hours=2)),
+        PriceCache(symbol="000660", market="KR", price=180000.0,
+                   updated_at=datetime.now(timezone.utc)),
+    ])
+    await session.commit()
+
+    assert await MarketService(session).warm_start() == 2
+    assert quote_cache.get(("000660", "KR")).price == 180000.0  # 방금 저장된 시세는 그대로 유효
+    assert quote_cache.get(("005930", "KR")) is None  # updated_at 기준으로 이미 만료
+
+    release = asyncio.Event()
+    market_service._warmup_task = asyncio.ensure_future(release.wait())
+    broker = _slow_broker()
+    try:
+        with patch.object(MarketService, "_get_broker", AsyncMock(return_value=broker)):
+            svc = MarketService()
+            info = await svc.get_price("005930", "KR")
+            batch = await svc.get_prices([("005930", "KR")])
+    finally:
+        release.set()
+        await market_service._warmup_task
+        market_service._warmup_task = None
+
+    assert info.stale and info.price == 70000.0
+    assert batch[("005930", "KR")].stale
+    assert broker.get_current_price.await_count == 0
+    assert broker.get_current_prices.await_count == 0
@@ -0,0 +1,77 @@
+"""메트릭 테스트: 히스토그램 버킷, Prometheus 직렬화, 시세 조회 계층·제공자 계측."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app import metrics
+from app.broker.base import PriceInfo
+from app.services import market_service, price_cache_service
+from app.services.market_service import MarketService
+from app.services.price_cache_service import PriceCacheService
+from app.services.quote_cache import quote_cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+    quote_cache.clear()
+    price_cache_service._pending.clear()
+    market_service._inflight.clear()
+    yield
+    metrics.reset()
+    quote_cache.clear()
+
+
+def test_histogram_buckets_and_prometheus_text():
+    h = metrics.Histogram("t_seconds", "test", ("op",), buckets=(0.1, 1.0))
+    for v in (0.05, 0.1, 0.5, 3.0):
+        h.observe(v, "x")
+
+    lines = list(h.samples())
+    assert lines[:3] == [
+        ("t_seconds_bucket", (("op", "x"), ("le", "0.1")), 2),  # 경계값은 해당 버킷 포함
+        ("t_seconds_bucket", (("op", "x"), ("le", "1")), 3),
+        ("t_seconds_bucket", (("op", "x"), ("le", "+Inf")), 4),
+    ]
+    assert h.to_dict()["x"]["count"] == 4
+
+    metrics.provider_requests.inc("pykrx", "price")
+    text = metrics.render_prometheus()
+    assert "# TYPE provider_requests_total counter" in text
+    assert 'provider_requests_total{provider="pykrx",op="price"} 1' in text
+
+
+@pytest.mark.asyncio
+async def test_quote_tiers_fallbacks_and_provider_errors(session):
+    broker = AsyncMock()
+    broker.get_current_price.return_value = PriceInfo(symbol="005930", price=70000.0, market="KR")
+    with patch.object(MarketService, "_get_broker", AsyncMock(return_value=broker)):
+        svc = MarketService(session)
+        await svc.get_price("005930", "KR")  # 제공자 조회
+        await svc.get_price("005930", "KR")  # 메모리 히트
+
+        # 제공자 실패 → 쓰기 버퍼(DB 계층) 대체값
+        await PriceCacheService(session).flush()
+        quote_cache.clear()
+        broker.get_current_price.side_effect = RuntimeError("down")
+        fallback = await svc.get_price("005930", "KR")
+
+    assert fallback.stale and fallback.price == 70000.0
+    assert metrics.quote_lookups.value("provider") == 1
+    assert metrics.quote_lookups.value("memory") == 1
+    assert metrics.quote_lookups.value("fallback") == 1
+    assert metrics.quote_fallbacks.value("db") == 1
+    assert metrics.price_cache_flushed_rows.value() == 1
+    assert metrics.price_cache_flush_latency.count() == 1
+
+    with pytest.raises(RuntimeError):
+        with metrics.provider_timer("kis", "price"):
+            raise RuntimeError("timeout")
+    assert metrics.provider_errors.value("kis", "price") == 1
+    assert metrics.provider_latency.count("kis", "price") == 1
+
+    snap = metrics.snapshot()
+    assert snap["market_quote_lookups_total"]["values"]["memory"] == 1
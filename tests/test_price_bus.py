@@ -0,0 +1,71 @@
+"""시세 이벤트 버스 테스트: 종목 필터, 가장 오래된 이벤트 버림, MarketService 발행."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.broker.base import PriceInfo
+from app.services import market_service
+from app.services.market_service import MarketService
+from app.services.price_bus import PriceBus, price_bus
+from app.services.quote_cache import quote_cache
+
+
+def _info(symbol: str, price: float) -> PriceInfo:
+    return PriceInfo(symbol=symbol, price=price, market="KR")
+
+
+@pytest.mark.asyncio
+async def test_symbol_filter_and_wildcard_fanout():
+    bus = PriceBus(queue_size=8)
+    samsung = bus.subscribe([("005930", "KR")])
+    everything = bus.subscribe()
+
+    bus.publish(_info("005930", 70000.0))
+    bus.publish(_info("000660", 180000.0))
+
+    first = await samsung.get(timeout=0.1)
+    assert first.info.symbol == "005930" and first.seq == 1
+    assert await samsung.get(timeout=0.01) is None
+    assert everything.queue.qsize() == 2
+    assert bus.stats()["delivered"] == 3
+
+    samsung.close()
+    assert bus.subscribed_keys() == set()
+    assert bus.stats()["subscribers"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest():
+    bus = PriceBus()
+    with bus.subscribe([("005930", "KR")], maxsize=2) as sub:
+        for price in (1.0, 2.0, 3.0):
+            bus.publish(_info("005930", price))
+        prices = [(await sub.get()).info.price for _ in range(2)]
+        assert prices == [2.0, 3.0]
+        assert sub.dropped == 1 and bus.dropped == 1
+    assert bus.stats()["subscribers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesced_fetch_is_published_once():
+    """동시 미스 3건이 하나의 브로커 호출로 병합되면 이벤트도 1건만 발행된다."""
+    quote_cache.clear()
+    market_service._inflight.clear()
+    broker = AsyncMock()
+
+    async def _get_current_price(symbol, market):
+        await asyncio.sleep(0.01)
+        return _info(symbol, 71000.0)
+
+    broker.get_current_price.side_effect = _get_current_price
+    with price_bus.subscribe([("005930", "KR")]) as sub, \
+            patch.object(MarketService, "_get_broker", AsyncMock(return_value=broker)), \
+            patch.object(MarketService, "_save_to_db"):
+        await asyncio.gather(*(MarketService().get_price("005930", "KR") for _ in range(3)))
+        assert sub.queue.qsize() == 1
+        assert (await sub.get()).info.price == 71000.0
+    quote_cache.clear()
@@ -0,0 +1,42 @@
+"""PriceCacheService 쓰기 지연 버퍼 테스트: 일괄 upsert, 최신값 유지."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+
+from app.broker.base import PriceInfo
+from app.models.price_cache import PriceCache
+from app.services import price_cache_service
+from app.services.price_cache_service import PriceCacheService
+
+
+@pytest.fixture(autouse=True)
+def _reset_buffer():
+    price_cache_service._pending.clear()
+    yield
+    price_cache_service._pending.clear()
+
+
+@pytest.mark.asyncio
+async def test_flush_upserts_buffered_quotes_in_one_batch(session):
+    """버퍼링된 시세는 flush 시 한 번에 insert/update되고 종목별 마지막 값만 남는다."""
+    session.add(PriceCache(symbol="005930", market="KR", price=60000.0, high=61000.0))
+    await session.commit()
+
+    PriceCacheService.enqueue(PriceInfo(symbol="005930", price=69000.0))
+    PriceCacheService.enqueue(PriceInfo(symbol="005930", price=70000.0, change=500.0))
+    PriceCacheService.enqueue(PriceInfo(symbol="000660", price=180000.0))
+    assert PriceCacheService.get_pending("005930", "KR").price == 70000.0
+
+    svc = PriceCacheService(session)
+    assert await svc.flush() == 2
+    assert await svc.flush() == 0  # 버퍼 비움
+
+    session.expire_all()
+    rows = {r.symbol: r for r in (await session.execute(select(PriceCache))).scalars()}
+    assert rows["005930"].price == 70000.0
+    assert rows["005930"].change == 500.0
+    assert rows["005930"].high == 61000.0  # OHLC 미제공 시 기존 값 유지
+    assert rows["000660"].price == 180000.0
+    assert price_cache_service.get_write_behind_stats()["pending"] == 0
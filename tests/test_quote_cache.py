@@ -0,0 +1,51 @@
+"""QuoteCache 테스트: LRU 제거, TTL 만료, 통계."""
+
+from __future__ import annotations
+
+import time
+
+from app.broker.base import PriceInfo
+from app.metrics import quote_cache_evictions, render_prometheus
+from app.services.quote_cache import QuoteCache
+
+
+def _info(symbol: str, price: float = 1000.0) -> PriceInfo:
+    return PriceInfo(symbol=symbol, price=price)
+
+
+def test_lru_eviction_keeps_recently_used():
+    """용량 초과 시 가장 오래 사용되지 않은 엔트리가 제거된다."""
+    before = quote_cache_evictions.value()
+    cache = QuoteCache(max_entries=2, ttl=60)
+    cache.set(("A", "KR"), _info("A"))
+    cache.set(("B", "KR"), _info("B"))
+    assert cache.get(("A", "KR")) is not None  # A를 최근 사용으로 갱신
+    cache.set(("C", "KR"), _info("C"))
+
+    assert ("B", "KR") not in cache
+    assert ("A", "KR") in cache and ("C", "KR") in cache
+    assert cache.stats()["evictions"] == 1
+    assert quote_cache_evictions.value() == before + 1
+    assert "# TYPE quote_cache_evictions_total counter" in render_prometheus()
+
+
+def test_expired_entry_is_miss_but_peekable():
+    """TTL이 지난 엔트리는 get에서 미스지만 peek으로 대체값을 얻을 수 있다."""
+    cache = QuoteCache(max_entries=10, ttl=15)
+    cache.set(("A", "KR"), _info("A"), stored_at=time.monotonic() - 20)
+
+    assert cache.get(("A", "KR")) is None
+    value, age = cache.peek(("A", "KR"))
+    assert value.symbol == "A" and age >= 20
+
+    stats = cache.stats()
+    assert stats["misses"] == 1 and stats["expirations"] == 1 and stats["hits"] == 0
+
+
+def test_purge_removes_old_entries():
+    cache = QuoteCache(max_entries=10, ttl=15)
+    cache.set(("A", "KR"), _info("A"), stored_at=time.monotonic() - 4000)
+    cache.set(("B", "KR"), _info("B"))
+
+    assert cache.purge(3600) == 1
+    assert len(cache) == 1
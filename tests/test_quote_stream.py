@@ -0,0 +1,68 @@
+"""SSE 시세 스트림 테스트: 스냅샷·변경분 전송, 하트비트, Last-Event-ID 재생."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app.broker.base import PriceInfo
+from app.services.price_bus import PriceBus
+from app.services.quote_cache import quote_cache
+from app.services.quote_stream import quote_event_stream
+
+KEY = ("005930", "KR")
+
+
+def _info(price: float, volume: int = 100) -> PriceInfo:
+    return PriceInfo(symbol="005930", price=price, market="KR", volume=volume)
+
+
+def _data(frame: str) -> dict:
+    line = next(l for l in frame.splitlines() if l.startswith("data: "))
+    return json.loads(line[len("data: "):])
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    quote_cache.clear()
+    yield
+    quote_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_then_deltas_and_heartbeat():
+    bus = PriceBus()
+    quote_cache.set(KEY, _info(70000.0))
+    stream = quote_event_stream([KEY], heartbeat=0.01, bus=bus)
+
+    assert (await anext(stream)).startswith("retry:")
+    snapshot = await anext(stream)
+    assert _data(snapshot) == {"s": "005930", "m": "KR", "p": 70000.0, "c": 0.0, "r": 0.0, "v": 100}
+
+    bus.publish(_info(70000.0))  # 변경 없음 → 전송 생략
+    bus.publish(_info(70100.0))
+    frame = await anext(stream)
+    assert "id: 2" in frame
+    assert _data(frame) == {"s": "005930", "m": "KR", "p": 70100.0}
+
+    assert await anext(stream) == ": ping\n\n"
+    await stream.aclose()
+    assert bus.stats()["subscribers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_resume_replays_missed_events():
+    bus = PriceBus(history_size=10)
+    for price in (1.0, 2.0, 3.0):
+        bus.publish(_info(price))
+
+    stream = quote_event_stream([KEY], last_event_id=1, heartbeat=0.01, bus=bus)
+    await anext(stream)  # retry/connected
+    first, second = await anext(stream), await anext(stream)
+    assert ("id: 2" in first) and _data(first)["p"] == 2.0
+    assert ("id: 3" in second) and _data(second)["p"] == 3.0
+    await stream.aclose()
+
+    # 프로세스 재시작 등으로 알 수 없는 seq → 스냅샷으로 대체
+    assert bus.replay(99, [KEY]) is None
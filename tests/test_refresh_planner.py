@@ -0,0 +1,73 @@
+"""우선순위 계층별 시세 갱신 테스트: 예산 내 우선순위, 계층별 주기, 갱신 대상 계층 분류."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.models.order import Order
+from app.models.position import Position
+from app.models.watchlist import WatchlistItem
+from app.services import refresh_planner as planner_module
+from app.services.market_service import MarketService
+from app.services.refresh_planner import RefreshPlanner, RefreshTier, note_view
+
+T = RefreshTier
+INTERVALS = {T.ACTIVE: 10, T.POSITION: 10, T.WATCHLIST: 60, T.VIEWED: 120}
+
+
+@pytest.fixture(autouse=True)
+def _reset_views():
+    planner_module._recent_views.clear()
+    yield
+    planner_module._recent_views.clear()
+
+
+def test_budget_serves_higher_tiers_first_and_defers_the_rest():
+    planner = RefreshPlanner(INTERVALS, budget=2)
+    planner.sync({
+        ("W", "KR"): T.WATCHLIST, ("V", "KR"): T.VIEWED,
+        ("P", "KR"): T.POSITION, ("A", "KR"): T.ACTIVE,
+    }, now=0.0)
+
+    assert planner.take_due(now=0.0) == [("A", "KR"), ("P", "KR")]
+    assert planner.deferred == 2
+    # 미룬 종목은 다음 주기 맨 앞
+    assert planner.take_due(now=1.0) == [("W", "KR"), ("V", "KR")]
+
+    # 10초 뒤에는 짧은 주기 계층만 다시 차례
+    assert planner.take_due(now=10.0) == [("A", "KR"), ("P", "KR")]
+    assert planner.take_due(now=20.0) == [("A", "KR"), ("P", "KR")]
+    # 관심 종목이 주기가 돼도 예산이 차면 보유·주문 종목이 먼저
+    assert planner.take_due(now=61.0) == [("A", "KR"), ("P", "KR")]
+    assert planner.take_due(now=62.0) == [("W", "KR")]
+
+    # 관심 → 미체결 주문으로 승격되면 짧은 주기로 재예약, 대상에서 빠진 종목은 제거
+    planner.sync({("A", "KR"): T.ACTIVE, ("W", "KR"): T.ACTIVE}, now=63.0)
+    assert len(planner) == 2 and planner.tier_of(("W", "KR")) is T.ACTIVE
+    assert planner.take_due(now=72.0) == [("A", "KR"), ("W", "KR")]
+
+
+@pytest.mark.asyncio
+async def test_refresh_tiers_take_the_highest_priority(session, account):
+    session.add_all([
+        WatchlistItem(symbol="005930", market="KR", name="삼성전자"),
+        WatchlistItem(symbol="000660", market="KR", name="SK하이닉스"),
+        Position(account_id=account.id, symbol="000660", market="KR", quantity=10, avg_price=1.0),
+        Position(account_id=account.id, symbol="035720", market="KR", quantity=0, avg_price=1.0),
+        Order(account_id=account.id, symbol="005930", market="KR", side="BUY", order_type="LIMIT",
+              quantity=1, price=70000.0, trading_mode="PAPER", status="PENDING"),
+        Order(account_id=account.id, symbol="051910", market="KR", side="BUY", order_type="MARKET",
+              quantity=1, trading_mode="PAPER", status="FILLED"),
+    ])
+    await session.commit()
+    note_view("035420", "KR")
+    note_view("005930", "KR")
+
+    svc = MarketService(session)
+    tiers = await svc.collect_refresh_tiers()
+    assert tiers == {
+        ("005930", "KR"): T.ACTIVE,
+        ("000660", "KR"): T.POSITION,
+        ("035420", "KR"): T.VIEWED,
+    }
+    assert await svc.collect_refresh_keys() == [("005930", "KR"), ("000660", "KR"), ("035420", "KR")]
@@ -0,0 +1,78 @@
+"""시세 기록/재생 테스트: 기록 래퍼 → 파일 → 재생 제공자, 시간 압축, 브로커 팩토리 선택."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.bars import BarSeries
+from app.broker import factory
+from app.broker.base import PriceInfo
+from app.broker.paper.broker import PaperBroker
+from app.broker.replay import provider as replay_provider
+from app.broker.replay.log import MarketDataRecorder, Recording
+from app.broker.replay.provider import ReplayError, ReplayProvider
+from app.broker.replay.recorder import RecordingBroker
+from app.config import settings
+from app.schemas.common import MarketDataMode, TradingMode
+
+_DAILY = BarSeries.from_columns(["2026-10-15", "2026-10-16"], [1, 2], [3, 4], [0, 1], [2, 3], [10, 20])
+_CANDLES = [
+    {"datetime": f"2026-10-16 09:0{m}:00", "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 3}
+    for m in range(4)
+]
+
+
+async def _record(path) -> None:
+    inner = AsyncMock()
+    inner.get_current_price.return_value = PriceInfo(symbol="005930", price=71000.0, change=500.0, volume=9)
+    inner.get_current_prices.return_value = {"005930": PriceInfo(symbol="005930", price=71100.0)}
+    inner.get_daily_prices.return_value = _DAILY
+    inner.get_intraday_candles.return_value = _CANDLES
+    recorder = MarketDataRecorder(path)
+    broker = RecordingBroker(inner, recorder)
+
+    await broker.get_current_price("005930", "KR")
+    await broker.get_current_prices(["005930", "000660"], "KR")
+    await broker.get_daily_prices("005930", "KR", 2)
+    await broker.get_intraday_candles("005930", "KR", 1)
+    recorder.close()
+
+
+async def test_recorded_responses_are_replayed(tmp_path):
+    path = tmp_path / "md.jsonl.gz"
+    await _record(path)
+    replay = ReplayProvider(Recording.load(path), latency_ms=0, loop=False)
+
+    # 첫 응답 시각 이전에는 첫 응답, 기록 끝을 지나면 마지막 응답
+    replay._start += 3600
+    assert (await replay.get_current_price("005930", "KR")).change == 500.0
+    replay._start -= 7200
+    assert (await replay.get_current_price("005930", "KR")).price == 71100.0
+    # 일괄 조회에서 빠졌던 종목은 기록된 실패로 재생
+    with pytest.raises(ReplayError):
+        await replay.get_current_price("000660", "KR")
+    assert await replay.get_current_prices(["005930", "000660", "035420"], "KR") == {
+        "005930": PriceInfo(symbol="005930", price=71100.0),
+    }
+
+    assert await replay.get_daily_prices("005930", "KR", 60) == _DAILY
+    assert await replay.get_intraday_candles("005930", "KR", 1) == _CANDLES
+    three = await replay.get_intraday_candles("005930", "KR", 3)  # 1분봉 집계
+    assert [c["datetime"] for c in three] == ["2026-10-16 09:00:00", "2026-10-16 09:03:00"]
+    with pytest.raises(LookupError):
+        await replay.get_daily_prices("035420", "KR")
+
+
+async def test_replay_mode_selects_paper_broker_with_replay_provider(tmp_path, monkeypatch):
+    path = tmp_path / "md.jsonl.gz"
+    await _record(path)
+    monkeypatch.setattr(settings, "market_data_mode", MarketDataMode.REPLAY)
+    monkeypatch.setattr(settings, "market_data_log", str(path))
+    monkeypatch.setattr(settings, "replay_latency_ms", 0.0)
+    monkeypatch.setattr(replay_provider, "_provider", None)
+    monkeypatch.setattr(factory, "_broker_cache", {})
+
+    broker = await factory.get_broker(TradingMode.REAL)
+
+    assert isinstance(broker, PaperBroker)
+    assert (await broker.get_current_price("005930", "KR")).price in (71000.0, 71100.0)
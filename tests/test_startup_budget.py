@@ -0,0 +1,24 @@
+"""기동 예산 회귀 테스트 — app.main 적재 시간·RSS, 무거운 의존성 지연 적재."""
+
+from app.cli import check_startup, measure_startup, parse_importtime
+
+
+def test_app_startup_stays_within_budget():
+    result = measure_startup("app.main")
+
+    # pykrx/pandas/numpy 등은 첫 실제 사용 시점에만 적재돼야 한다
+    assert result["heavy"] == []
+    assert check_startup(result) == []
+
+
+def test_parse_importtime_output():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     _io\n"
+        "import time:      2000 |       5000 |   app.config\n"
+        "import time:       300 |       9000 | app.main\n"
+    )
+    records = parse_importtime(output)
+
+    assert [(r.module, r.depth) for r in records] == [("_io", 2), ("app.config", 1), ("app.main", 0)]
+    assert records[-1].cumulative_us == 9000
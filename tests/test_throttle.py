@@ -0,0 +1,148 @@
+"""RateLimiter / PriorityRateLimiter / gather_limited / 서킷 브레이커 / 전용 실행기 테스트: 초당 한도, 동시성 제한, 마감 시간, 차단."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.broker.throttle import (
+    BlockingExecutor,
+    CircuitBreaker,
+    CircuitOpenError,
+    PriorityRateLimiter,
+    RateLimiter,
+    gather_limited,
+)
+from app.metrics import rate_limit_wait
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_calls():
+    """burst 이후 호출은 1/rate 간격으로 통과한다."""
+    limiter = RateLimiter(rate=50, burst=2)
+    t0 = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire()
+    elapsed = time.monotonic() - t0
+
+    assert elapsed >= 3 / 50 * 0.9  # 첫 2회는 burst, 나머지 3회는 20ms 간격
+    assert limiter.stats()["acquired"] == 5
+    assert limiter.stats()["waited"] == 3
+
+
+@pytest.mark.asyncio
+async def test_priority_limiter_serves_orders_before_queued_quotes():
+    """시세 조회가 먼저 줄 서 있어도 주문은 다음 허용 시각에 바로 통과하고, 취소된 대기는 건너뛴다."""
+    limiter = PriorityRateLimiter("t-prio", rate=50, lanes=("order", "balance", "quote"))
+    done: list[str] = []
+
+    async def _call(lane: str, tag: str) -> None:
+        await limiter.acquire(lane)
+        done.append(tag)
+
+    await limiter.acquire("quote")  # 첫 호출은 바로 통과, 이후는 20ms 간격
+    quotes = [asyncio.create_task(_call("quote", f"q{i}")) for i in range(3)]
+    await asyncio.sleep(0)
+    order = asyncio.create_task(_call("order", "order"))
+    await asyncio.sleep(0)
+    assert limiter.queued("quote") == 3 and limiter.queued("order") == 1
+
+    quotes[2].cancel()
+    await asyncio.gather(order, *quotes[:2])
+
+    assert done == ["order", "q0", "q1"]
+    stats = limiter.stats()["lanes"]
+    assert stats["quote"]["queued"] == 0 and stats["order"]["waited"] == 1
+    assert rate_limit_wait.count("t-prio", "quote") == 3  # 즉시 통과 1 + 대기 후 통과 2
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_bounds_concurrency_and_skips_failures():
+    running = 0
+    peak = 0
+
+    async def _fetch(key: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if key == 3:
+            raise RuntimeError("boom")
+        return key * 10
+
+    results = await gather_limited(range(8), _fetch, concurrency=2)
+
+    assert peak == 2
+    assert 3 not in results
+    assert results[7] == 70 and len(results) == 7
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_returns_partial_results_on_timeout():
+    async def _fetch(key: int) -> int:
+        await asyncio.sleep(0.01 if key < 2 else 1.0)
+        return key
+
+    results = await gather_limited(range(4), _fetch, concurrency=4, timeout=0.1)
+
+    assert results == {0: 0, 1: 1}
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_rejects_and_recovers_via_half_open():
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=0.05)
+    calls = 0
+
+    async def _fail():
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("KRX down")
+
+    async def _ok():
+        nonlocal calls
+        calls += 1
+        return "ok"
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # 열려 있는 동안은 호출 자체를 하지 않는다
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(_ok)
+    assert calls == 2 and breaker.stats()["rejected"] == 1
+
+    # reset_timeout 후 시험 호출 실패 → 다시 open
+    await asyncio.sleep(0.06)
+    with pytest.raises(RuntimeError):
+        await breaker.call(_fail)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # 시험 호출 성공 → closed
+    await asyncio.sleep(0.06)
+    assert await breaker.call(_ok) == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_blocking_executor_times_out_hung_calls():
+    executor = BlockingExecutor("test-pool", max_workers=1, timeout=0.05)
+    release = threading.Event()
+    try:
+        with pytest.raises(TimeoutError):
+            await executor.run(release.wait, 5)
+        # 멈춘 호출이 작업자를 점유 중이면 대기열 호출도 제한 시간 안에 실패한다
+        assert executor.running == 1
+        with pytest.raises(TimeoutError):
+            await executor.run(lambda: "never")
+        release.set()
+        assert await executor.run(lambda: 42, timeout=1.0) == 42
+        assert executor.stats()["timeouts"] == 2
+    finally:
+        release.set()
+        executor.shutdown()